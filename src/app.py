@@ -3,18 +3,22 @@ This module launches the main GUI, which should only be ran after all setup is f
 """
 
 import os
+import signal
 import sys
+import threading
 from urllib.error import HTTPError, URLError
 
 from PyQt5 import QtCore, QtWidgets
 
 from PyQt5.QtWidgets import QStyleFactory
 
-from utils.log import TextReceiver
+from utils.log import TextReceiver, err_log
 from windows.main_window import MainWindow
 from worker.hapi_thread import HapiThread
 from worker.hapi_worker import HapiWorker
+from worker.work_dispatcher import WorkDispatcher
 from worker.work_request import WorkRequest
+from worker.work_scheduler import WorkScheduler
 from metadata.config import Config
 
 def obtain_apikey():
@@ -81,11 +85,43 @@ Your HAPI API key will be used on the next launch. Please restart HAPIEST.
     sys.exit(0)
 
 
+def serve(port: int) -> int:
+    """
+    Starts the work processes without the GUI and serves them to other programs with a
+    WorkServer on the local port `port`, until the process is interrupted. The server only
+    serves the methods that read the tables (see WorkServer.METHODS). The GUI serves its own
+    work processes the same way if Config.serve_work is set.
+    """
+    from rpc.work_server import WorkServer
+
+    if not os.path.exists(Config.data_folder):
+        os.makedirs(Config.data_folder)
+
+    WorkRequest.start_work_process()
+    server = WorkServer(port)
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_args: stop.set())
+    server.start()
+    print('Serving work requests on {}:{}'.format(*server.address), flush=True)
+    stop.wait()
+
+    server.shutdown()
+    server.server_close()
+    WorkScheduler.stop()
+    WorkDispatcher.stop()
+    return 0
+
+
 def run():
     """
     The main method starts the GUI after asking for an api key if necessary.
     """
 
+    # The headless server must not open any window, e.g. to ask for an api key
+    if len(sys.argv) > 1 and sys.argv[1] == '--serve':
+        return serve(int(sys.argv[2]) if len(sys.argv) > 2 else Config.server_port)
+
     if not check_internet_connection_and_obtain_api_key():
         return 0
 
@@ -109,6 +145,10 @@ def run():
                 gba.generate_availability()
                 print("ok")
                 return 0
+            elif sys.argv[1] in ("-gtt", "--generate-tips-tables"):
+                import res_gen.generate_tips_tables as gtt
+                gtt.generate_tips_tables(sys.argv[2])
+                return 0
 
     if Config.high_dpi:
         # Enable High DPI display with PyQt5
@@ -148,11 +188,25 @@ def run():
 
     TextReceiver.init(window)
 
+    server = None
+    if Config.serve_work:
+        from rpc.work_server import WorkServer
+
+        try:
+            server = WorkServer(Config.server_port)
+            server.start()
+            print('Serving work requests on {}:{}'.format(*server.address))
+        except OSError as e:
+            err_log(f'Failed to serve work requests on port {Config.server_port}: {e}')
+            server = None
+
     _qt_result = app.exec_()
 
+    if server is not None:
+        server.shutdown()
+        server.server_close()
     TextReceiver.redirect_close()
-    close = HapiWorker(WorkRequest.END_WORK_PROCESS, {}, callback=None)
-    close.safe_exit()
-    WorkRequest.WORKER.process.join()
+    WorkScheduler.stop()
+    WorkDispatcher.stop()
     HapiThread.kill_all()
     return 0
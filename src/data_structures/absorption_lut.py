@@ -0,0 +1,247 @@
+import json
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from metadata.config import Config
+
+
+class AbsorptionLut:
+    """
+    A lookup table of absorption cross sections of one line list, precomputed on a
+    (temperature, pressure, optional H2O volume mixing ratio) grid.
+
+    Cross sections are calculated with the hapi absorptionCoefficient_* functions (in HITRAN
+    units, i.e. cm2/molecule) for all grid points at once, and stored as the logarithm in a
+    float32 array of shape (len(temperatures), len(pressures), len(vmrs), len(nu)). The array
+    lives in `Config.data_folder`/lut/<name>/ and is memory-mapped when loaded, so only the
+    pages needed by an interpolation are read.
+
+    Interpolation is linear in T, ln(p) and the VMR, applied to ln(cross section): Lorentzian
+    line wings scale with p, so in log space they are interpolated almost exactly.
+    """
+
+    ##
+    # The LUT folder, in the data folder.
+    LUT_ROOT = 'lut'
+
+    ##
+    # Cross sections below FLOOR * (maximal cross section of the table) are stored as the floor,
+    # which keeps the logarithm finite.
+    FLOOR = 1e-12
+
+    def __init__(self, name: str, nu: np.ndarray, log_xsc: np.ndarray, meta: Dict[str, Any]):
+        """
+        :param name: The name of the LUT (the name of its folder).
+        :param nu: The wavenumber grid.
+        :param log_xsc: ln(cross section) with shape (T, p, vmr, nu).
+        :param meta: The description of the LUT as stored in meta.json.
+        """
+        self.name = name
+        self.nu = nu
+        self.log_xsc = log_xsc
+        self.meta = meta
+        self.temperatures = np.array(meta['temperatures'], dtype=np.float64)
+        self.log_pressures = np.log(np.array(meta['pressures'], dtype=np.float64))
+        self.vmrs = None if meta['vmrs'] is None else np.array(meta['vmrs'], dtype=np.float64)
+
+    @staticmethod
+    def path(name: str) -> str:
+        """
+        :return: The folder where the LUT named `name` is stored.
+        """
+        return os.path.join(Config.data_folder, AbsorptionLut.LUT_ROOT, name)
+
+    @staticmethod
+    def environments(temperatures: Sequence[float], pressures: Sequence[float],
+                     vmrs: Optional[Sequence[float]], vmr_diluent: str) -> List[Dict[str, Any]]:
+        """
+        :return: The hapi Environments for all points of the grid, in the order of the LUT
+        array. A VMR point is calculated as a {'air': 1 - vmr, vmr_diluent: vmr} mixture.
+        """
+        envs = []
+        for t in temperatures:
+            for p in pressures:
+                if vmrs is None:
+                    envs.append({'T': float(t), 'p': float(p)})
+                    continue
+                for vmr in vmrs:
+                    diluent = {'air': 1.0 - float(vmr), vmr_diluent: float(vmr)}
+                    envs.append({'T': float(t), 'p': float(p), 'Diluent': diluent})
+        return envs
+
+    @staticmethod
+    def calculate(table_name: str, environments: List[Dict[str, Any]], profile: str,
+                  abscoef_args: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculates cross sections for a list of environments with one hapi call.
+        :return: The wavenumber grid and a 2-D array of cross sections (environment, nu).
+        """
+        import hapi
+
+        return hapi.PROFILE_MAP[profile](SourceTables=table_name, Environments=environments,
+                                         HITRAN_units=True, **abscoef_args)
+
+    @staticmethod
+    def build(name: str, table_name: str, temperatures: Sequence[float],
+              pressures: Sequence[float], vmrs: Optional[Sequence[float]] = None,
+              profile: str = 'Voigt', vmr_diluent: str = 'h2o', estimate_error: bool = True,
+              **abscoef_args) -> 'AbsorptionLut':
+        """
+        Calculates and stores the LUT named `name`, overwriting an existing one.
+        :param table_name: The hapi table with the line list. It must be loaded in hapi.
+        :param temperatures: The increasing temperature grid (K).
+        :param pressures: The increasing pressure grid (atm).
+        :param vmrs: An optional increasing grid of volume mixing ratios of `vmr_diluent`.
+        :param profile: The line profile, a key of hapi.PROFILE_MAP.
+        :param vmr_diluent: The broadener whose mixing ratio is given by `vmrs`.
+        :param estimate_error: If True, the interpolation error is estimated against a direct
+        calculation at the centers of the grid cells and stored in the metadata.
+        :param abscoef_args: Other arguments of the absorptionCoefficient_* function, e.g.
+        WavenumberRange and WavenumberStep. They must be JSON serializable.
+        :return: The new LUT.
+        """
+        for label, grid in (('temperatures', temperatures), ('pressures', pressures),
+                            ('vmrs', vmrs)):
+            if grid is not None and (len(grid) < 2 or np.any(np.diff(grid) <= 0)):
+                raise ValueError(f'LUT {label} must be increasing and have at least 2 points')
+
+        envs = AbsorptionLut.environments(temperatures, pressures, vmrs, vmr_diluent)
+        nu, xsc = AbsorptionLut.calculate(table_name, envs, profile, abscoef_args)
+        xsc = xsc.reshape((len(temperatures), len(pressures),
+                           1 if vmrs is None else len(vmrs), len(nu)))
+        floor = max(xsc.max(), np.finfo(np.float64).tiny) * AbsorptionLut.FLOOR
+        log_xsc = np.log(np.maximum(xsc, floor)).astype(np.float32)
+
+        meta = {
+            'table_name':   table_name,
+            'profile':      profile,
+            'temperatures': [float(t) for t in temperatures],
+            'pressures':    [float(p) for p in pressures],
+            'vmrs':         None if vmrs is None else [float(vmr) for vmr in vmrs],
+            'vmr_diluent':  vmr_diluent,
+            'abscoef_args': abscoef_args,
+            'error':        None,
+        }
+        lut = AbsorptionLut(name, nu, log_xsc, meta)
+        if estimate_error:
+            lut.meta['error'] = lut.estimate_error()
+        lut.save()
+        return AbsorptionLut.load(name)
+
+    def save(self):
+        """
+        Writes the LUT to its folder. Every file is written to a temporary file first and then
+        moved in place, so a concurrent reader never sees a partial LUT file.
+        """
+        path = AbsorptionLut.path(self.name)
+        os.makedirs(path, exist_ok=True)
+        for filename, array in (('nu.npy', self.nu), ('xsc.npy', self.log_xsc)):
+            tmp = os.path.join(path, filename + '.tmp')
+            with open(tmp, 'wb') as file:
+                np.save(file, array)
+            os.replace(tmp, os.path.join(path, filename))
+        tmp = os.path.join(path, 'meta.json.tmp')
+        with open(tmp, 'w') as file:
+            json.dump(self.meta, file, indent=2)
+        os.replace(tmp, os.path.join(path, 'meta.json'))
+
+    @staticmethod
+    def load(name: str) -> Optional['AbsorptionLut']:
+        """
+        :return: The LUT named `name` with its cross sections memory-mapped, or None if there
+        is no such LUT.
+        """
+        path = AbsorptionLut.path(name)
+        try:
+            with open(os.path.join(path, 'meta.json'), 'r') as file:
+                meta = json.load(file)
+            nu = np.load(os.path.join(path, 'nu.npy'))
+            log_xsc = np.load(os.path.join(path, 'xsc.npy'), mmap_mode='r')
+        except (OSError, ValueError) as e:
+            print(f'Failed to load LUT {name}: {str(e)}')
+            return None
+        return AbsorptionLut(name, nu, log_xsc, meta)
+
+    @staticmethod
+    def __weights(grid: np.ndarray, value: float, label: str) -> Tuple[int, float]:
+        """
+        :return: The index i of the grid cell containing `value` and the weight of grid[i + 1]
+        for linear interpolation.
+        """
+        if not grid[0] <= value <= grid[-1]:
+            raise ValueError(f'{label} {value} is outside of the LUT range '
+                             f'[{grid[0]}, {grid[-1]}]')
+        i = min(int(np.searchsorted(grid, value, side='right')) - 1, len(grid) - 2)
+        return i, (value - grid[i]) / (grid[i + 1] - grid[i])
+
+    def interpolate(self, t: float, p: float, vmr: Optional[float] = None) -> np.ndarray:
+        """
+        :param t: The temperature (K).
+        :param p: The pressure (atm).
+        :param vmr: The volume mixing ratio, required iff the LUT has a VMR grid.
+        :return: The cross section (cm2/molecule) on the wavenumber grid self.nu.
+        """
+        it, wt = AbsorptionLut.__weights(self.temperatures, t, 'Temperature')
+        ip, wp = AbsorptionLut.__weights(self.log_pressures, np.log(p), 'Pressure')
+        if self.vmrs is None:
+            if vmr is not None:
+                raise ValueError(f'LUT {self.name} has no VMR grid')
+            corners = [(0, 0.0)]
+        else:
+            if vmr is None:
+                raise ValueError(f'LUT {self.name} requires a VMR')
+            iv, wv = AbsorptionLut.__weights(self.vmrs, vmr, 'VMR')
+            corners = [(iv, wv)]
+
+        result = np.zeros(len(self.nu), dtype=np.float64)
+        for i, w_i in ((it, 1.0 - wt), (it + 1, wt)):
+            for j, w_j in ((ip, 1.0 - wp), (ip + 1, wp)):
+                for k0, wv in corners:
+                    for k, w_k in ((k0, 1.0 - wv), (k0 + 1, wv)):
+                        w = w_i * w_j * w_k
+                        if w != 0.0:
+                            result += w * self.log_xsc[i, j, k]
+        return np.exp(result)
+
+    def estimate_error(self, environments: Optional[List[Dict[str, Any]]] = None) \
+            -> Dict[str, Any]:
+        """
+        Compares interpolated cross sections with a direct calculation. The error of a spectrum
+        is max |interpolated - direct| / max(direct).
+        :param environments: The environments to check ({'T', 'p'} and 'vmr' for a LUT with a VMR
+        grid). The default are the centers of all grid cells, where the interpolation error is
+        largest.
+        :return: {'samples': [[T, p, vmr, error], ...], 'max': ..., 'mean': ...}
+        """
+        if environments is None:
+            def centers(grid):
+                return None if grid is None else (grid[1:] + grid[:-1]) / 2.0
+
+            vmrs = centers(self.vmrs)
+            environments = [{'T': t, 'p': float(np.exp(log_p)), 'vmr': vmr}
+                            for t in centers(self.temperatures)
+                            for log_p in centers(self.log_pressures)
+                            for vmr in ([None] if vmrs is None else vmrs)]
+
+        diluent = self.meta['vmr_diluent']
+        hapi_envs = []
+        for env in environments:
+            hapi_env = {'T': float(env['T']), 'p': float(env['p'])}
+            if env.get('vmr') is not None:
+                hapi_env['Diluent'] = {'air': 1.0 - float(env['vmr']), diluent: float(env['vmr'])}
+            hapi_envs.append(hapi_env)
+        _, direct = AbsorptionLut.calculate(self.meta['table_name'], hapi_envs,
+                                            self.meta['profile'], self.meta['abscoef_args'])
+
+        samples = []
+        for env, expected in zip(environments, direct):
+            vmr = env.get('vmr')
+            interpolated = self.interpolate(env['T'], env['p'],
+                                            None if vmr is None else float(vmr))
+            err = float(np.max(np.abs(interpolated - expected)) / np.max(expected))
+            samples.append([float(env['T']), float(env['p']),
+                            None if vmr is None else float(vmr), err])
+        errors = [sample[3] for sample in samples]
+        return {'samples': samples, 'max': max(errors), 'mean': float(np.mean(errors))}
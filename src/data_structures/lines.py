@@ -1,32 +1,27 @@
+from collections import OrderedDict
 from typing import *
 
+import numpy as np
+
 from metadata.config import *
-from worker.hapi_worker import HapiWorker
 
 
 class Lines:
     """
-    An interface for interacting with HITRAN line-by-line data. The data must be in the following
-    form:
+    A paged interface for interacting with HITRAN line-by-line data. The table itself stays in the
+    work process: Lines only holds the few most recently used pages, as returned by a
+    `WorkRequest.GET_TABLE_PAGE` request:
 
     ```
-    table = {
-        'header' : {
-            'order' : ('column1','column2','column3'),
-            'format' : {
-                'column1' : '%10d',
-                'column2' : '%20f',
-                'column3' : '%30s' 
-            },
-            'default' : {
-                'column1' : 0,
-                'column2' : 0.0,
-                'column3' : ''
-            },
-            'number_of_rows' : 3,
-            'size_in_bytes' : None,
-            'table_name' : 'sampletab',
-            'table_type' : 'strict'
+    page = {
+        'table_name' : 'sampletab',
+        'number_of_rows' : 3,
+        'start' : 0,
+        'columns' : ['column1','column2','column3'],
+        'format' : {
+            'column1' : '%10d',
+            'column2' : '%20f',
+            'column3' : '%30s'
         },
         'data' : {
             'column1' : [1,2,3],
@@ -36,26 +31,72 @@ class Lines:
     }
     ```
 
-    This is the schema hapi version < 2.0 uses already.
+    Modified fields are recorded in `edits`, which is what is sent to the work process when the
+    table is saved; they are applied again to a page that is loaded after it was dropped.
     """
 
-    def __init__(self, table: Dict[str, Any]):
-        self.table = table
-        self.data = table['data']
-        self.table_len = len(self.data['nu'])
+    ##
+    # The number of pages that are kept.
+    MAX_PAGES = 3
+
+    def __init__(self, page: Dict[str, Any]):
+        """
+        :param page: The first page of the table.
+        """
+        self.table_name = page['table_name']
+        self.table_len = page['number_of_rows']
         self.page_len: int = Config.select_page_length
-        self.last_page = int(self.table_len / self.page_len)
-        self.last_page_len = self.page_len
-        if self.last_page * self.page_len != self.table_len:
-            self.last_page_len = self.table_len - self.last_page * self.page_len
-            self.last_page += 1
+        self.last_page = max(1, -(-self.table_len // self.page_len))
+        self.last_page_len = self.table_len - (self.last_page - 1) * self.page_len
 
         self.page_number = 1
-        self.param_order = table['header']['order']
+        self.param_order = tuple(page['columns'])
+        self.formats = page['format']
+
+        ##
+        # The loaded pages, from the least to the most recently used: page number -> columns.
+        self.pages: 'OrderedDict[int, Dict[str, Any]]' = OrderedDict()
 
-        self.workers: List['HapiWorker'] = []
+        ##
+        # The modified fields: (param, row index in the table) -> new value.
+        self.edits: Dict[Tuple[str, int], Union[int, float, str]] = {}
 
-        self.param_order = tuple(self.param_order)
+        self.add_page(page)
+
+    def page_start(self, page_number: int) -> int:
+        """
+        :return: The index of the first row of page `page_number` in the table.
+        """
+        return (page_number - 1) * self.page_len
+
+    def has_page(self, page_number: int) -> bool:
+        return page_number in self.pages
+
+    def add_page(self, page: Dict[str, Any]):
+        """
+        Adds a page returned by a GET_TABLE_PAGE request, dropping the least recently used page if
+        there are more than MAX_PAGES.
+        """
+        page_number = page['start'] // self.page_len + 1
+        data = {param: Lines.__to_list(page['data'][param]) for param in self.param_order}
+        start = self.page_start(page_number)
+        for (param, index), value in self.edits.items():
+            if start <= index < start + len(data[param]):
+                data[param][index - start] = value
+        self.pages[page_number] = data
+        while len(self.pages) > Lines.MAX_PAGES:
+            oldest = next(iter(self.pages))
+            if oldest == self.page_number:
+                self.pages.move_to_end(oldest)
+                continue
+            del self.pages[oldest]
+
+    @staticmethod
+    def __to_list(values) -> list:
+        # Plain Python values, so the type of a field tells how to edit it
+        if isinstance(values, np.ndarray) and not np.ma.isMaskedArray(values):
+            return values.tolist()
+        return list(values)
 
     def get_len(self):
         """
@@ -69,17 +110,26 @@ class Lines:
     def get_line(self, line_number: int) -> Optional['Line']:
         """
         """
-        line = []
-
-        # index of the `line_number`th field of page 
-        index = line_number + ((self.page_number - 1) * self.page_len)
-        for param in self.param_order:
-            line.append(self.data[param][index])
-        l = Line(line_number + (self.page_number - 1) * self.page_len, line, self)
-        return l
+        data = self.pages[self.page_number]
+        line = [data[param][line_number] for param in self.param_order]
+        return Line(line_number + self.page_start(self.page_number), line, self)
 
     def set_page(self, page_number):
+        """
+        Makes `page_number`, which must have been added, the current page.
+        """
         self.page_number = page_number
+        self.pages.move_to_end(page_number)
+
+    def update(self, line_index: int, param: str, value: Union[int, float, str]):
+        """
+        Sets a field of the current page and records the edit.
+        """
+        self.pages[self.page_number][param][line_index - self.page_start(self.page_number)] = value
+        self.edits[(param, line_index)] = value
+
+    def value(self, line_index: int, param: str) -> Union[int, float, str]:
+        return self.pages[self.page_number][param][line_index - self.page_start(self.page_number)]
 
 
 class Line:
@@ -88,15 +138,14 @@ class Line:
         self.line_index = line_index
         self.line = line
         self.lines = lines
-        self.data = lines.data
-        self.param_order = lines.table['header']['order']
+        self.param_order = lines.param_order
 
     def update_nth_field(self, field_index: int, new_value: Union[int, float, str]):
         """
         *Given params: (self), int field_index, and a new values : [int,float], updates a field
         for the Line class.*
         """
-        self.data[self.param_order[field_index]][self.line_index] = new_value
+        self.lines.update(self.line_index, self.param_order[field_index], new_value)
 
     def get_nth_field(self, field_index: int) -> Union[int, float]:
-        return self.data[self.param_order[field_index]][self.line_index]
+        return self.lines.value(self.line_index, self.param_order[field_index])
@@ -0,0 +1,214 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from data_structures.cache import Cache
+from metadata.config import Config
+
+
+class ResultCache:
+    """
+    A content-addressed, on-disk cache of calculated spectra, e.g. absorption coefficients.
+
+    A result is stored as a compressed .npz file named by the hash of everything the calculation
+    depends on: the content of the source tables and the calculation arguments. A changed table
+    therefore can never hit a stale result. Files live in `Config.data_folder`/.cache/results,
+    and the modification time of a file is its last use: when the total size exceeds
+    `Config.result_cache_size` megabytes, the least recently used results are removed.
+
+    The most recently used results are also kept in memory, so the stages of a pipeline (e.g. a
+    spectrum computed from an absorption coefficient) can be reused without touching the disk.
+    """
+
+    ##
+    # The folder of the result files in the cache root.
+    RESULTS_FOLDER = 'results'
+
+    ##
+    # Part of every key; bump it when the meaning of stored results changes.
+    VERSION = 1
+
+    ##
+    # The number of results kept in memory.
+    MEMORY_ENTRIES = 8
+
+    ##
+    # The in-memory results: key -> (x, y), from the least to the most recently used.
+    __memory: 'OrderedDict[str, Tuple[np.ndarray, np.ndarray]]' = OrderedDict()
+
+    ##
+    # Table fingerprints of this process: table name -> (id of the table data, fingerprint).
+    # The work functions that replace or reload a table drop its fingerprint (see forget_table),
+    # since a new data dictionary may get the id of the old one.
+    __fingerprints: Dict[str, Tuple[int, str]] = {}
+
+    @staticmethod
+    def path() -> str:
+        return os.path.join(Config.data_folder, Cache.CACHE_ROOT, ResultCache.RESULTS_FOLDER)
+
+    @staticmethod
+    def table_fingerprint(table_name: str) -> str:
+        """
+        :return: A hash of the content of the hapi table `table_name`.
+        """
+        from hapi import LOCAL_TABLE_CACHE
+
+        data = LOCAL_TABLE_CACHE[table_name]['data']
+        cached = ResultCache.__fingerprints.get(table_name)
+        if cached is not None and cached[0] == id(data):
+            return cached[1]
+
+        digest = hashlib.sha1()
+        for column in sorted(data.keys()):
+            values = data[column]
+            digest.update(column.encode('utf-8'))
+            if isinstance(values, np.ndarray) and values.dtype != object:
+                digest.update(str(values.dtype).encode('utf-8'))
+                digest.update(np.ascontiguousarray(values).tobytes())
+            else:
+                digest.update(repr(list(values)).encode('utf-8'))
+        fingerprint = digest.hexdigest()
+        ResultCache.__fingerprints[table_name] = (id(data), fingerprint)
+        return fingerprint
+
+    @staticmethod
+    def forget_table(table_name: str):
+        """
+        Drops the fingerprint of `table_name`, so it is hashed again on its next use. Must be
+        called whenever the table is replaced, changed or reloaded.
+        """
+        ResultCache.__fingerprints.pop(table_name, None)
+
+    @staticmethod
+    def key(source_tables, **arguments) -> str:
+        """
+        :param source_tables: The hapi tables the result is calculated from.
+        :param arguments: All other (JSON serializable) arguments the result depends on.
+        :return: The content address of the result.
+        """
+        description = {
+            'version':   ResultCache.VERSION,
+            'tables':    [ResultCache.table_fingerprint(table) for table in source_tables],
+            'arguments': arguments,
+        }
+        text = json.dumps(description, sort_keys=True, default=ResultCache.__to_json)
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def __to_json(value):
+        # numpy scalars and arrays (e.g. isotopologue ids taken from a table)
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        raise TypeError(f'{type(value).__name__} can not be part of a result cache key')
+
+    @staticmethod
+    def get(key: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        :return: The (x, y) arrays stored under `key`, or None if there are none.
+        """
+        filename = os.path.join(ResultCache.path(), key + '.npz')
+        try:
+            with np.load(filename) as result:
+                x, y = result['x'], result['y']
+            # The modification time records the last use
+            os.utime(filename)
+        except (OSError, KeyError, ValueError):
+            return None
+        return x, y
+
+    @staticmethod
+    def put(key: str, x: np.ndarray, y: np.ndarray):
+        """
+        Stores the (x, y) arrays under `key`, then removes the least recently used results until
+        the cache fits in its size budget.
+        """
+        path = ResultCache.path()
+        try:
+            os.makedirs(path, exist_ok=True)
+            # Other work processes may store the same result at the same time
+            tmp = os.path.join(path, f'{key}.{os.getpid()}.tmp')
+            with open(tmp, 'wb') as file:
+                np.savez_compressed(file, x=np.asarray(x), y=np.asarray(y))
+            os.replace(tmp, os.path.join(path, key + '.npz'))
+        except OSError as e:
+            print(f'Failed to cache result: {str(e)}')
+            return
+        ResultCache.evict(Config.result_cache_size * 2 ** 20)
+
+    @staticmethod
+    def evict(budget: int):
+        """
+        Removes the least recently used results until their total size is at most `budget` bytes.
+        """
+        path = ResultCache.path()
+        try:
+            entries = []
+            for entry in os.scandir(path):
+                if entry.name.endswith('.npz'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, filename in sorted(entries):
+            if total <= budget:
+                break
+            try:
+                os.remove(filename)
+                total -= size
+            except OSError:
+                pass
+
+    @staticmethod
+    def lookup(key: str, disk: bool = True) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        :param disk: If False, only the results kept in memory are looked at.
+        :return: The cached result stored under `key`, or None if there is none.
+        """
+        memory = ResultCache.__memory
+        if key in memory:
+            memory.move_to_end(key)
+            return memory[key]
+        result = ResultCache.get(key) if disk else None
+        if result is not None:
+            ResultCache.__remember(key, result)
+        return result
+
+    @staticmethod
+    def store(key: str, result: Tuple[np.ndarray, np.ndarray], disk: bool = True):
+        """
+        Stores the (x, y) result under `key`, in memory and, if `disk`, on disk.
+        """
+        if disk:
+            ResultCache.put(key, *result)
+        ResultCache.__remember(key, result)
+
+    @staticmethod
+    def __remember(key: str, result: Tuple[np.ndarray, np.ndarray]):
+        memory = ResultCache.__memory
+        memory[key] = result
+        while len(memory) > ResultCache.MEMORY_ENTRIES:
+            memory.popitem(last=False)
+
+    @staticmethod
+    def memoize(source_tables, arguments: Dict[str, Any], calculate, disk: bool = True) \
+            -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :param calculate: A function computing the (x, y) result.
+        :param disk: If False, the result is only kept in memory. This is meant for results that
+        are cheap to derive from another cached result.
+        :return: The cached result for (source_tables, arguments), calculating and storing it
+        on a miss.
+        """
+        key = ResultCache.key(source_tables, **arguments)
+        result = ResultCache.lookup(key, disk)
+        if result is None:
+            result = calculate()
+            ResultCache.store(key, result, disk)
+        return result
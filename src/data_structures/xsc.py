@@ -1,5 +1,7 @@
 from typing import Iterable, List, Optional, Tuple
 
+import numpy as np
+
 from metadata.xsc_meta import CrossSectionMeta
 
 
@@ -11,8 +13,8 @@ class CrossSection:
 
     def __init__(self, nu: Iterable[float], abscoef: Iterable[float], step: float, numin: float,
                  numax: float, molecule: str, len: int, pressure: float, temp: float):
-        self.nu = tuple(nu)
-        self.abscoef = tuple(abscoef)
+        self.nu = np.asarray(nu, dtype=np.float64)
+        self.abscoef = np.asarray(abscoef, dtype=np.float64)
         self.step = step
         self.numin = numin
         self.numax = numax
@@ -48,13 +50,9 @@ class XscParser:
         _broadener = header[94:97].strip()
         _reference = header[97:100].strip()
 
-        y = []
-
-        for line in lines:
-            for yvalue in line.split():
-                y.append(float(yvalue))
+        y = np.array([float(yvalue) for line in lines for yvalue in line.split()])
         step = (max_wavenum - numin) / float(num_points)
-        x = list(map(lambda n: numin + float(n) * step, range(0, num_points)))
+        x = numin + np.arange(num_points, dtype=np.float64) * step
 
         return CrossSection(x, y, step, numin, max_wavenum, molecule, num_points, pressure,
                             temperature)
@@ -67,6 +67,53 @@ class Config:
             'type':          int
         },
 
+        # The size budget of the on-disk cache of calculated absorption coefficients.
+        'result_cache_size':      {
+            'default_value': 512,
+            'display_name':  'Result Cache Size (MB)',
+            'tool_tip':      'The maximum disk space used to store calculated absorption '
+                             'coefficients so identical graphs are not recalculated. The least '
+                             'recently used results are removed first.',
+            'type':          int
+        },
+
+        # The number of processes that calculate graphs and run other work requests.
+        'work_processes':         {
+            'default_value': 1,
+            'display_name':  'Work Processes',
+            'tool_tip':      'The number of processes that run calculations in parallel. Every '
+                             'process holds its own copy of the loaded tables.',
+            'type':          int
+        },
+
+        # Whether table metadata requests are served by a process of their own.
+        'fast_lane':              {
+            'default_value': True,
+            'display_name':  'Metadata Fast Lane',
+            'tool_tip':      'Whether an extra process answers table metadata requests, so they '
+                             'do not wait for running calculations.',
+            'type':          bool
+        },
+
+        # The port of the work server (python src --serve).
+        'server_port':            {
+            'default_value': 8393,
+            'display_name':  'Work Server Port',
+            'tool_tip':      'The local port on which the headless work server (started with '
+                             '--serve) accepts requests from batch scripts.',
+            'type':          int
+        },
+
+        # Whether the GUI serves its work processes on the work server port.
+        'serve_work':             {
+            'default_value': False,
+            'display_name':  'Serve Work Processes',
+            'tool_tip':      'Whether the GUI serves its work processes on the work server port, '
+                             'so batch scripts share their loaded tables and cached results. '
+                             'Only the requests that read tables are served.',
+            'type':          bool
+        },
+
         'hapi_api_key':           {
             'default_value': '0000', 'display_name': 'HAPI API Key',
             'tool_tip':      'The HAPI API key that is needed to use HAPI v2 functionality.',
@@ -107,6 +154,10 @@ class Config:
     data_folder = None
     high_dpi = None
     select_page_length = None
+    result_cache_size = None
+    work_processes = None
+    fast_lane = None
+    server_port = None
     hapi_api_key = None
     axisx_label_format = None
     axisx_log_label_format = None
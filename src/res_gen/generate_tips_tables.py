@@ -0,0 +1,94 @@
+"""
+Upstream releases of hapi.py carry the TIPS-2011 and TIPS-2017 partition sum tables as roughly
+12,000 lines of module-level array assignments, which all get executed every time hapi is
+imported. Hapiest keeps those tables in binary form in res/tips instead, and hapi loads them
+the first time a partition sum is needed.
+
+This is a script that
+1. takes the path of an upstream hapi.py that still contains the tables,
+2. executes only the TIPS table section of that file,
+3. writes the tables to res/tips as flat .npy arrays (so they can be memory mapped) and a small
+    JSON index describing where each isotopologue's data lives in those arrays.
+
+Run it whenever hapi.py is updated to a release with new partition sum data:
+
+    python3 src --generate-tips-tables path/to/upstream/hapi.py
+"""
+
+import json
+import os
+
+import numpy as np
+
+TIPS_FOLDER = "res/tips"
+
+TIPS_SECTION_START = "TIPS_ISO_HASH = {}"
+TIPS_SECTION_END = "#  --------------- /TIPS-2017 IMPLEMENTATION"
+
+
+def load_tips_section(hapi_path: str):
+    """
+    Executes the TIPS table section of an upstream hapi.py and returns the resulting namespace.
+    """
+    with open(hapi_path, 'r') as file:
+        lines = file.read().split('\n')
+
+    start = next(i for i, line in enumerate(lines) if line.startswith(TIPS_SECTION_START))
+    end = next(i for i, line in enumerate(lines) if line.startswith(TIPS_SECTION_END))
+
+    namespace = {
+        '__FloatType__': np.float64, 'float32': np.float32, 'float64': np.float64
+    }
+    exec('\n'.join(lines[start:end]), namespace)
+    return namespace
+
+
+def generate_tips_tables(hapi_path: str):
+    tips = load_tips_section(hapi_path)
+
+    # TIPS-2011: one float32 array per isotopologue, all sharing the Tdat grid
+    iso_2011 = []
+    q_2011 = []
+    offset = 0
+    for (M, I), q in tips['TIPS_ISO_HASH'].items():
+        iso_2011.append([M, I, offset, len(q), float(tips['TIPS_GSI_HASH'][(M, I)])])
+        q_2011.append(np.asarray(q, dtype=np.float32))
+        offset += len(q)
+
+    # TIPS-2017: a handful of shared temperature grids, and one float64 array per isotopologue
+    grids = []
+    t_2017 = []
+    offset = 0
+    for grid_id in sorted(tips['TIPS_2017_ISOT']):
+        grid = tips['TIPS_2017_ISOT'][grid_id]
+        grids.append([offset, len(grid)])
+        t_2017.append(np.asarray(grid, dtype=np.float64))
+        offset += len(grid)
+
+    iso_2017 = []
+    q_2017 = []
+    offset = 0
+    for (M, I), q in tips['TIPS_2017_ISOQ_HASH'].items():
+        grid = tips['TIPS_2017_ISOT_HASH'][(M, I)]
+        grid_id = next(
+            grid_id for grid_id, g in tips['TIPS_2017_ISOT'].items() if g is grid)
+        iso_2017.append([M, I, grid_id, offset, len(q)])
+        q_2017.append(np.asarray(q, dtype=np.float64))
+        offset += len(q)
+
+    if not os.path.exists(TIPS_FOLDER):
+        os.makedirs(TIPS_FOLDER)
+
+    np.save(os.path.join(TIPS_FOLDER, "tips_2011_q.npy"), np.concatenate(q_2011))
+    np.save(os.path.join(TIPS_FOLDER, "tips_2017_t.npy"), np.concatenate(t_2017))
+    np.save(os.path.join(TIPS_FOLDER, "tips_2017_q.npy"), np.concatenate(q_2017))
+
+    index = {
+        'tips_2011': {'iso': iso_2011},
+        'tips_2017': {'grids': grids, 'iso': iso_2017}
+    }
+    with open(os.path.join(TIPS_FOLDER, "tips_index.json"), "w+") as f:
+        f.write(json.dumps(index))
+
+    print(f"Wrote {len(iso_2011)} TIPS-2011 and {len(iso_2017)} TIPS-2017 isotopologues to "
+          f"{TIPS_FOLDER}")
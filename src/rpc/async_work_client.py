@@ -0,0 +1,76 @@
+import asyncio
+import weakref
+from typing import Any, Optional
+
+from rpc.work_client import WorkClient
+
+
+class AsyncWorkClient:
+    """
+    The asyncio counterpart of WorkClient, for programs that share the work processes of another
+    process: of the headless server (python src --serve), or of the GUI if Config.serve_work is
+    set, with their loaded tables and cached results. In the process that runs the work
+    processes, use worker.async_worker.AsyncWorker instead.
+
+    At most `concurrency` requests of an event loop are sent at a time; the others wait in `run`,
+    so any number of requests can be gathered:
+
+        async with AsyncWorkClient(port=port) as client:
+            names = await client.run('TABLE_NAMES')
+            spectra = await asyncio.gather(*(client.run('ABSORPTION_COEFFICIENT',
+                                                        SourceTables=[name], ...)
+                                             for name in names))
+
+    Cancelling the task that awaits a request asks the server to cancel the request.
+    This module only depends on the standard library and NumPy, like WorkClient.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, concurrency: int = 4,
+                 timeout: Optional[float] = None):
+        """
+        :param concurrency: The maximal number of requests of an event loop that are sent at a
+        time.
+        :param timeout: The timeout (in seconds) for connecting to the server. The connection is
+        made right away, so it blocks the caller.
+        """
+        self.client = WorkClient(host, port, timeout)
+        self.concurrency = concurrency
+        ##
+        # The semaphore that bounds the requests of each event loop. A semaphore can only be
+        # awaited on the loop it was first used on.
+        self.semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    async def run(self, method: str, priority: Optional[str] = None, **params) -> Any:
+        """
+        Sends a request once fewer than `concurrency` requests are in flight, and waits for its
+        result.
+        :param method: The name of the WorkRequest opcode, e.g. 'TABLE_NAMES'.
+        :param priority: 'interactive' or 'batch'; the default depends on the method.
+        :param params: The arguments of the work function.
+        :raises RpcError: If the request failed.
+        :raises asyncio.CancelledError: If the request was cancelled.
+        """
+        loop = asyncio.get_running_loop()
+        if loop not in self.semaphores:
+            self.semaphores[loop] = asyncio.Semaphore(self.concurrency)
+        async with self.semaphores[loop]:
+            future = self.client.submit(method, priority, **params)
+            try:
+                # Shielded, since the future of the client is only cancelled by the server
+                return await asyncio.shield(asyncio.wrap_future(future))
+            except asyncio.CancelledError:
+                if not future.done():
+                    self.client.cancel(future)
+                raise
+
+    def close(self):
+        """
+        Closes the connection. The server cancels the requests that have not finished.
+        """
+        self.client.close()
+
+    async def __aenter__(self) -> 'AsyncWorkClient':
+        return self
+
+    async def __aexit__(self, *_args):
+        self.close()
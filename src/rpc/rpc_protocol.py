@@ -0,0 +1,178 @@
+import json
+import struct
+from typing import Any, BinaryIO, List, Tuple
+
+import numpy as np
+
+
+class RpcError(Exception):
+    """
+    A JSON-RPC error: raised by the client for error responses, and used by the server to
+    report errors in requests.
+    """
+
+    ##
+    # The error codes of JSON-RPC 2.0, and the codes of hapiest's own errors.
+    PARSE_ERROR = -32700
+    INVALID_REQUEST = -32600
+    METHOD_NOT_FOUND = -32601
+    INVALID_PARAMS = -32602
+    INTERNAL_ERROR = -32603
+    WORK_FAILED = -32000
+    CANCELLED = -32800
+
+    def __init__(self, code: int, message: str):
+        super().__init__(f'{message} ({code})')
+        self.code = code
+        self.message = message
+
+    def to_json(self) -> dict:
+        return {'code': self.code, 'message': self.message}
+
+
+class RpcProtocol:
+    """
+    The wire format of the work server: JSON-RPC 2.0 messages whose arrays are sent as binary
+    frames.
+
+    A message is an 8 byte header (the size of the JSON text and the number of binary frames,
+    both little endian uint32), the UTF-8 JSON text, and the frames, each one preceded by its
+    size as a little endian uint64. A NumPy array in the message is replaced by
+    {"__ndarray__": index of its frame, "dtype": ..., "shape": ...} and its data is sent as is,
+    so the receiver can read it without parsing. Arrays of Python objects are sent as lists.
+
+    Other objects (e.g. the Bands of a BANDS request) are sent as the dictionary of their
+    attributes, with their class name under "__class__".
+    """
+
+    HEADER = struct.Struct('<II')
+    FRAME = struct.Struct('<Q')
+
+    ARRAY_TAG = '__ndarray__'
+
+    ##
+    # The maximal size of the JSON text of a message.
+    MAX_TEXT_SIZE = 1 << 30
+
+    ##
+    # The maximal total size of the binary frames of a message.
+    MAX_FRAMES_SIZE = 1 << 32
+
+    @staticmethod
+    def encode(message: Any) -> List[Any]:
+        """
+        :return: The parts of the encoded message (bytes and array buffers), in order.
+        """
+        frames = []
+
+        def default(value: Any) -> Any:
+            if isinstance(value, np.ndarray):
+                if value.dtype.hasobject:
+                    return value.tolist()
+                frames.append(np.ascontiguousarray(value))
+                return {RpcProtocol.ARRAY_TAG: len(frames) - 1, 'dtype': value.dtype.str,
+                        'shape': list(value.shape)}
+            if isinstance(value, np.generic):
+                return value.item()
+            if isinstance(value, (set, frozenset)):
+                return list(value)
+            if hasattr(value, '__dict__'):
+                return {'__class__': type(value).__name__, **vars(value)}
+            raise TypeError(f'{type(value).__name__} can not be sent')
+
+        text = json.dumps(message, default=default).encode('utf-8')
+        parts = [RpcProtocol.HEADER.pack(len(text), len(frames)), text]
+        for frame in frames:
+            parts.append(RpcProtocol.FRAME.pack(frame.nbytes))
+            parts.append(memoryview(frame).cast('B'))
+        return parts
+
+    @staticmethod
+    def write(stream: BinaryIO, message: Any):
+        """
+        Writes `message` to `stream` (a socket file opened for writing) and flushes it.
+        """
+        for part in RpcProtocol.encode(message):
+            stream.write(part)
+        stream.flush()
+
+    @staticmethod
+    def read(stream: BinaryIO) -> Any:
+        """
+        Reads a message from `stream` (a socket file opened for reading).
+        :raises EOFError: If the stream ended before the message.
+        :raises RpcError: If the message can not be parsed.
+        """
+        text_size, number_of_frames = RpcProtocol.HEADER.unpack(
+            RpcProtocol.__read_exactly(stream, RpcProtocol.HEADER.size))
+        if text_size > RpcProtocol.MAX_TEXT_SIZE:
+            raise RpcError(RpcError.PARSE_ERROR, 'Message too large')
+        text = RpcProtocol.__read_exactly(stream, text_size)
+        frames = []
+        frames_size = 0
+        for _ in range(number_of_frames):
+            size, = RpcProtocol.FRAME.unpack(
+                RpcProtocol.__read_exactly(stream, RpcProtocol.FRAME.size))
+            frames_size += size
+            if frames_size > RpcProtocol.MAX_FRAMES_SIZE:
+                raise RpcError(RpcError.PARSE_ERROR, 'Message too large')
+            try:
+                frame = bytearray(size)
+            except MemoryError:
+                raise RpcError(RpcError.PARSE_ERROR, 'Message too large')
+            if stream.readinto(frame) != size:
+                raise EOFError()
+            frames.append(frame)
+
+        def object_hook(value: dict) -> Any:
+            if RpcProtocol.ARRAY_TAG not in value:
+                return value
+            try:
+                frame = frames[value[RpcProtocol.ARRAY_TAG]]
+                return np.frombuffer(frame, dtype=np.dtype(value['dtype'])) \
+                    .reshape(value['shape'])
+            except (IndexError, KeyError, TypeError, ValueError) as e:
+                raise RpcError(RpcError.PARSE_ERROR, f'Invalid array: {e}')
+
+        try:
+            return json.loads(text.decode('utf-8'), object_hook=object_hook)
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise RpcError(RpcError.PARSE_ERROR, f'Invalid JSON: {e}')
+
+    @staticmethod
+    def __read_exactly(stream: BinaryIO, size: int) -> bytes:
+        data = stream.read(size)
+        if len(data) != size:
+            raise EOFError()
+        return data
+
+    @staticmethod
+    def request(rpc_id: Any, method: str, params: dict, **members) -> dict:
+        """
+        :param members: Additional members of the request, e.g. its priority.
+        :return: A JSON-RPC request (a notification if rpc_id is None).
+        """
+        message = {'jsonrpc': '2.0', 'method': method, 'params': params, **members}
+        if rpc_id is not None:
+            message['id'] = rpc_id
+        return message
+
+    @staticmethod
+    def response(rpc_id: Any, result: Any = None, error: RpcError = None) -> dict:
+        """
+        :return: A JSON-RPC response with either `result` or `error`.
+        """
+        if error is not None:
+            return {'jsonrpc': '2.0', 'id': rpc_id, 'error': error.to_json()}
+        return {'jsonrpc': '2.0', 'id': rpc_id, 'result': result}
+
+    @staticmethod
+    def outcome(message: dict) -> Tuple[Any, Any]:
+        """
+        :return: The id of the JSON-RPC response `message`, and its result or RpcError.
+        """
+        if 'error' in message:
+            error = message['error'] if isinstance(message['error'], dict) else {}
+            return message.get('id'), RpcError(error.get('code', RpcError.INTERNAL_ERROR),
+                                               error.get('message', 'Unknown error'))
+        return message.get('id'), message.get('result')
@@ -0,0 +1,128 @@
+import itertools
+import socket
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, Optional
+
+from rpc.rpc_protocol import RpcError, RpcProtocol
+
+
+class WorkClient:
+    """
+    A client of the WorkServer. Requests are pipelined: `submit` sends a request and returns a
+    Future right away, and a reader thread completes the futures as the responses arrive, in any
+    order. `call` is the blocking shorthand. In asyncio code, wrap the futures with
+    asyncio.wrap_future.
+
+    This module only depends on the standard library and NumPy, so batch scripts can use it
+    without the GUI's dependencies:
+
+        with WorkClient(port=port) as client:
+            names = client.call('TABLE_NAMES')
+            spectra = [client.submit('ABSORPTION_COEFFICIENT', SourceTables=[name], ...)
+                       for name in names]
+            results = [future.result() for future in spectra]
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, timeout: Optional[float] = None):
+        """
+        :param timeout: The timeout (in seconds) for connecting to the server.
+        """
+        self.socket = socket.create_connection((host, port), timeout)
+        self.socket.settimeout(None)
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.rfile = self.socket.makefile('rb')
+        self.wfile = self.socket.makefile('wb')
+        self.ids = itertools.count()
+        ##
+        # The futures of the requests whose responses have not arrived yet: id -> future.
+        self.futures: Dict[int, Future] = {}
+        self.closed = False
+        self.lock = threading.Lock()
+        self.reader = threading.Thread(target=self.__read, name='WorkClient', daemon=True)
+        self.reader.start()
+
+    def submit(self, method: str, priority: Optional[str] = None, **params) -> Future:
+        """
+        Sends a request without waiting for its response.
+        :param method: The name of the WorkRequest opcode, e.g. 'TABLE_NAMES'.
+        :param priority: 'interactive' or 'batch'; the default depends on the method.
+        :param params: The arguments of the work function.
+        :return: A future of the result. It raises RpcError if the request failed, and is
+        cancelled if the request was cancelled.
+        """
+        rpc_id = next(self.ids)
+        future = Future()
+        members = {} if priority is None else {'priority': priority}
+        with self.lock:
+            if self.closed:
+                raise ConnectionError('The connection to the work server is closed')
+            self.futures[rpc_id] = future
+            RpcProtocol.write(self.wfile, RpcProtocol.request(rpc_id, method, params, **members))
+        future.rpc_id = rpc_id
+        return future
+
+    def call(self, method: str, priority: Optional[str] = None, **params) -> Any:
+        """
+        Sends a request and waits for its result.
+        :raises RpcError: If the request failed.
+        """
+        return self.submit(method, priority, **params).result()
+
+    def cancel(self, future: Future):
+        """
+        Asks the server to cancel the request of `future`. The future is cancelled when the
+        server confirms it, unless the request had finished before.
+        """
+        with self.lock:
+            RpcProtocol.write(self.wfile, RpcProtocol.request(
+                None, 'cancel', {'id': future.rpc_id}))
+
+    def close(self):
+        """
+        Closes the connection. The server cancels the requests that have not finished.
+        """
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.reader.join()
+        self.rfile.close()
+        self.wfile.close()
+        self.socket.close()
+
+    def __enter__(self) -> 'WorkClient':
+        return self
+
+    def __exit__(self, *_args):
+        self.close()
+
+    def __read(self):
+        error = ConnectionError('The connection to the work server was closed')
+        try:
+            while True:
+                rpc_id, outcome = RpcProtocol.outcome(RpcProtocol.read(self.rfile))
+                with self.lock:
+                    future = self.futures.pop(rpc_id, None)
+                if future is None:
+                    if isinstance(outcome, RpcError):
+                        # An error that is not about a particular request
+                        error = outcome
+                        return
+                    continue
+                if isinstance(outcome, RpcError) and outcome.code == RpcError.CANCELLED:
+                    future.cancel()
+                elif isinstance(outcome, RpcError):
+                    future.set_exception(outcome)
+                else:
+                    future.set_result(outcome)
+        except (EOFError, OSError, RpcError) as e:
+            if isinstance(e, RpcError):
+                error = e
+        finally:
+            with self.lock:
+                self.closed = True
+                futures = list(self.futures.values())
+                self.futures.clear()
+            for future in futures:
+                future.set_exception(error)
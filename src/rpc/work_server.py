@@ -0,0 +1,248 @@
+import queue
+import socketserver
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from rpc.rpc_protocol import RpcError, RpcProtocol
+from utils.log import *
+from worker.work_dispatcher import WorkDispatcher
+from worker.work_request import WorkRequest
+from worker.work_result import WorkResult
+
+
+class WorkConnection(socketserver.StreamRequestHandler):
+    """
+    Serves the JSON-RPC requests of one client. Every request is submitted to the WorkDispatcher
+    as soon as it is read, so a client can pipeline any number of requests; the responses are
+    written by a thread of their own, in the order the results arrive.
+
+    If the client disconnects, its unfinished requests are cancelled.
+    """
+
+    def setup(self):
+        super().setup()
+        ##
+        # The responses that wait to be written; None ends the writer thread.
+        self.outbox: 'queue.Queue[Optional[dict]]' = queue.Queue()
+        ##
+        # The unfinished requests of the client: JSON-RPC id -> job_id.
+        self.jobs: Dict[Any, int] = {}
+        self.lock = threading.Lock()
+        self.writer = threading.Thread(target=self.__write, name='WorkConnection', daemon=True)
+        self.writer.start()
+
+    def handle(self):
+        while True:
+            try:
+                message = RpcProtocol.read(self.rfile)
+            except (EOFError, OSError):
+                return
+            except RpcError as e:
+                # The stream can't be trusted after a malformed message
+                self.outbox.put(RpcProtocol.response(None, error=e))
+                return
+            try:
+                self.__on_request(message)
+            except RpcError as e:
+                # Notifications get no response, not even an error
+                if isinstance(message, dict) and 'method' in message and 'id' not in message:
+                    continue
+                rpc_id = message.get('id') if isinstance(message, dict) else None
+                if not WorkConnection.valid_id(rpc_id):
+                    rpc_id = None
+                self.outbox.put(RpcProtocol.response(rpc_id, error=e))
+
+    def finish(self):
+        with self.lock:
+            job_ids = list(self.jobs.values())
+        for job_id in job_ids:
+            WorkDispatcher.cancel(job_id)
+        self.outbox.put(None)
+        self.writer.join()
+        super().finish()
+
+    @staticmethod
+    def valid_id(rpc_id: Any) -> bool:
+        """
+        :return: Whether `rpc_id` can be the id of a request: a string, an integer or null.
+        """
+        return rpc_id is None or isinstance(rpc_id, str) or \
+            (isinstance(rpc_id, int) and not isinstance(rpc_id, bool))
+
+    def __on_request(self, message: Any):
+        if not isinstance(message, dict) or message.get('jsonrpc') != '2.0' or \
+                not isinstance(message.get('method'), str) or \
+                not WorkConnection.valid_id(message.get('id')):
+            raise RpcError(RpcError.INVALID_REQUEST, 'Invalid request')
+        rpc_id = message.get('id')
+        params = message.get('params', {})
+        if not isinstance(params, dict):
+            raise RpcError(RpcError.INVALID_PARAMS, 'params must be an object')
+
+        method = message['method']
+        if method == WorkServer.CANCEL_METHOD:
+            if not WorkConnection.valid_id(params.get('id')):
+                raise RpcError(RpcError.INVALID_PARAMS, 'Invalid id')
+            with self.lock:
+                job_id = self.jobs.get(params.get('id'))
+            if job_id is not None:
+                WorkDispatcher.cancel(job_id)
+            if rpc_id is not None:
+                self.outbox.put(RpcProtocol.response(rpc_id, job_id is not None))
+            return
+        methods = self.server.methods
+        if method not in methods:
+            if method in WorkServer.WRITE_METHODS:
+                raise RpcError(RpcError.METHOD_NOT_FOUND,
+                               f'{method} is not served: the server is read-only')
+            raise RpcError(RpcError.METHOD_NOT_FOUND, f'Unknown method {method}')
+        if methods[method] == WorkRequest.SWEEP:
+            # The swept request is named like a method
+            name = params.get('work_type')
+            work_type = methods.get(name) if isinstance(name, str) else None
+            if work_type not in WorkRequest.SWEEP_WORK_TYPES:
+                raise RpcError(RpcError.INVALID_PARAMS, f'{name} can not be swept')
+            params = {**params, 'work_type': work_type}
+        if not self.server.allow_writes:
+            # The work functions would write these files wherever the client asks
+            for args in (params, params.get('args')):
+                if isinstance(args, dict) and \
+                        any(args.get(name) is not None for name in WorkServer.FILE_PARAMS):
+                    raise RpcError(RpcError.INVALID_PARAMS,
+                                   'Files can not be written: the server is read-only')
+        priority = message.get('priority')
+        if priority is not None and priority not in WorkServer.PRIORITIES:
+            raise RpcError(RpcError.INVALID_REQUEST, f'Unknown priority {priority}')
+
+        job_id = WorkDispatcher.new_job_id()
+        with self.lock:
+            if rpc_id is not None:
+                if rpc_id in self.jobs:
+                    raise RpcError(RpcError.INVALID_REQUEST, f'Duplicate id {rpc_id}')
+                self.jobs[rpc_id] = job_id
+        WorkDispatcher.submit(
+            WorkRequest(job_id, methods[method], params,
+                        WorkServer.PRIORITIES.get(priority)),
+            lambda work_result: self.__on_result(rpc_id, work_result))
+
+    def __on_result(self, rpc_id: Any, work_result: WorkResult):
+        # Called on the dispatcher thread
+        if rpc_id is None:
+            return
+        with self.lock:
+            self.jobs.pop(rpc_id, None)
+        if work_result.cancelled:
+            error = RpcError(RpcError.CANCELLED, 'Request cancelled')
+        elif work_result.error is not None:
+            error = RpcError(RpcError.WORK_FAILED, work_result.error)
+        else:
+            error = None
+        self.outbox.put(RpcProtocol.response(rpc_id, work_result.result, error))
+
+    def __write(self):
+        while True:
+            response = self.outbox.get()
+            if response is None:
+                return
+            try:
+                RpcProtocol.write(self.wfile, response)
+            except (TypeError, ValueError) as e:
+                # A result that can not be encoded
+                RpcProtocol.write(self.wfile, RpcProtocol.response(
+                    response['id'], error=RpcError(RpcError.INTERNAL_ERROR, str(e))))
+            except OSError as e:
+                debug('Failed to send a response: ', e, type(e))
+                return
+
+
+class WorkServer(socketserver.ThreadingTCPServer):
+    """
+    Serves the work processes to other programs, e.g. batch scripts, over a local socket: the
+    methods are the names of the WorkRequest opcodes (e.g. "ABSORPTION_COEFFICIENT"), the params
+    are the arguments of the work function, and the result is the result of the work function.
+    The "work_type" of a SWEEP request is the name of the swept method.
+    A request may have a "priority" member ("interactive" or "batch"), and the method "cancel"
+    with the params {"id": id} cancels the unfinished request with that id. See RpcProtocol for
+    the wire format and rpc.work_client.WorkClient for a client.
+
+    The server uses the pool of WorkScheduler, so the work processes keep their tables and
+    caches between the requests of all clients.
+
+    The server has no authentication, so by default it only serves the methods that read the
+    tables, and refuses the FILE_PARAMS: any local user can connect to it.
+    """
+
+    ##
+    # The methods that are served, and their opcodes. The requests that control the work
+    # processes are left out.
+    METHODS: Dict[str, WorkRequest.WorkType] = {
+        'ABSORPTION_COEFFICIENT': WorkRequest.ABSORPTION_COEFFICIENT,
+        'TABLE_META_DATA':        WorkRequest.TABLE_META_DATA,
+        'GET_TABLE':              WorkRequest.GET_TABLE,
+        'GET_TABLE_PAGE':         WorkRequest.GET_TABLE_PAGE,
+        'TABLE_NAMES':            WorkRequest.TABLE_NAMES,
+        'TRANSMITTANCE_SPECTRUM': WorkRequest.TRANSMITTANCE_SPECTRUM,
+        'RADIANCE_SPECTRUM':      WorkRequest.RADIANCE_SPECTRUM,
+        'ABSORPTION_SPECTRUM':    WorkRequest.ABSORPTION_SPECTRUM,
+        'BANDS':                  WorkRequest.BANDS,
+        'SWEEP':                  WorkRequest.SWEEP
+    }
+
+    ##
+    # The methods that write tables or other files to the data folder. They are only served if
+    # the server is created with allow_writes=True.
+    WRITE_METHODS: Dict[str, WorkRequest.WorkType] = {
+        'FETCH':         WorkRequest.FETCH,
+        'SAVE_TABLE':    WorkRequest.SAVE_TABLE,
+        'SELECT':        WorkRequest.SELECT,
+        'DOWNLOAD_XSCS': WorkRequest.DOWNLOAD_XSCS
+    }
+
+    ##
+    # The params that name a file the work function writes. They are only accepted if the server
+    # is created with allow_writes=True; this includes the params of the request a SWEEP sweeps.
+    FILE_PARAMS = ('File',)
+
+    CANCEL_METHOD = 'cancel'
+
+    PRIORITIES: Dict[str, WorkRequest.Priority] = {
+        'interactive': WorkRequest.INTERACTIVE,
+        'batch':       WorkRequest.BATCH
+    }
+
+    HOST = '127.0.0.1'
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, port: int = 0, host: str = HOST, allow_writes: bool = False):
+        """
+        :param port: The port to listen on; 0 picks a free port (see `address`).
+        :param host: The address to listen on. Only the loopback interface by default, since
+        the server has no authentication.
+        :param allow_writes: Whether the WRITE_METHODS and the FILE_PARAMS are served as well.
+        Only for hosts whose users are all trusted with the files of the user of the server.
+        """
+        self.allow_writes = allow_writes
+        ##
+        # The methods this server serves.
+        self.methods: Dict[str, WorkRequest.WorkType] = \
+            {**WorkServer.METHODS, **WorkServer.WRITE_METHODS} if allow_writes \
+            else WorkServer.METHODS
+        super().__init__((host, port), WorkConnection)
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """
+        :return: The (host, port) the server listens on.
+        """
+        return self.server_address[:2]
+
+    def start(self) -> threading.Thread:
+        """
+        Serves the requests on a daemon thread until `shutdown` is called.
+        :return: The thread.
+        """
+        thread = threading.Thread(target=self.serve_forever, name='WorkServer', daemon=True)
+        thread.start()
+        return thread
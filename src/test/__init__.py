@@ -3,16 +3,47 @@ from multiprocessing import Process
 from types import TracebackType
 from typing import *
 
+from test.absorption_lut_test import AbsorptionLutTest
+from test.adaptive_wing_test import AdaptiveWingTest
+from test.async_worker_test import AsyncWorkerTest
 from test.config_editor_test import ConfigEditorTest
+from test.convolution_engine_test import ConvolutionEngineTest
+from test.cpf_engine_test import CpfEngineTest
+from test.environments_test import EnvironmentsTest
 from test.fail_test import FailTest
 from test.hapi_sources_test import HapiSourcesTest
+from test.hartmann_tran_test import HartmannTranTest
+from test.ladder_plan_test import LadderPlanTest
+from test.line_binning_test import LineBinningTest
 from test.molecule_info_test import MoleculeInfoTest
+from test.result_cache_test import ResultCacheTest
+from test.shared_arrays_test import SharedArraysTest
+from test.single_precision_test import SinglePrecisionTest
+from test.spectrum_pipeline_test import SpectrumPipelineTest
+from test.table_page_test import TablePageTest
 from test.test import Test
 from test.throw_test import ThrowTest
+from test.two_grid_test import TwoGridTest
+from test.voigt_lut_test import VoigtLutTest
+from test.work_cancel_test import WorkCancelTest
+from test.work_coalesce_test import WorkCoalesceTest
+from test.work_dispatcher_test import WorkDispatcherTest
+from test.work_progress_test import WorkProgressTest
+from test.work_scheduler_test import WorkSchedulerTest
+from test.work_server_test import WorkServerTest
+from test.work_sweep_test import WorkSweepTest
 
 
 tests: List[Test] = [Test(), FailTest(), ThrowTest(), HapiSourcesTest(), MoleculeInfoTest(),
-                     ConfigEditorTest()]
+                     ConfigEditorTest(), CpfEngineTest(), VoigtLutTest(), HartmannTranTest(),
+                     AbsorptionLutTest(), ConvolutionEngineTest(), TwoGridTest(),
+                     AdaptiveWingTest(), LineBinningTest(), LadderPlanTest(),
+                     SinglePrecisionTest(), WorkDispatcherTest(),
+                     WorkSchedulerTest(), SharedArraysTest(),
+                     TablePageTest(), WorkCancelTest(), WorkProgressTest(),
+                     WorkCoalesceTest(), WorkServerTest(), WorkSweepTest(),
+                     AsyncWorkerTest(), EnvironmentsTest(), ResultCacheTest(),
+                     SpectrumPipelineTest()]
 
 
 def run_tests():
@@ -0,0 +1,39 @@
+import tempfile
+
+import numpy as np
+
+from test.synthetic_table import create_synthetic_table
+from test.test import Test
+
+
+class AbsorptionLutTest(Test):
+    """
+    Builds a small absorption cross section LUT and checks that it reproduces the direct
+    calculation at the grid points, that the interpolation error estimated at the centers of the
+    grid cells is small, and that a stored LUT can be loaded again.
+    """
+
+    def __init__(self):
+        Test.__init__(self)
+
+    def name(self) -> str:
+        return 'absorption lut test'
+
+    def test(self) -> bool:
+        from metadata.config import Config
+        from data_structures.absorption_lut import AbsorptionLut
+
+        Config.data_folder = tempfile.mkdtemp()
+        table = create_synthetic_table(nlines=100)
+        lut = AbsorptionLut.build('synthetic', table, [200.0, 230.0, 260.0, 290.0, 320.0],
+                                  list(np.logspace(-2.0, 0.0, 9)), WavenumberStep=0.01)
+
+        on_grid = lut.estimate_error([{'T': 260.0, 'p': 0.1}])['max']
+        print('max error at a grid point: {:.3e}'.format(on_grid))
+        print('max error at cell centers: {:.3e}'.format(lut.meta['error']['max']))
+        if on_grid > 1e-5 or lut.meta['error']['max'] > 0.1:
+            return False
+
+        loaded = AbsorptionLut.load('synthetic')
+        return loaded is not None and \
+            np.array_equal(loaded.interpolate(250.0, 0.3), lut.interpolate(250.0, 0.3))
@@ -0,0 +1,47 @@
+import numpy as np
+
+from test.synthetic_table import create_synthetic_table
+from test.test import Test
+
+
+class AdaptiveWingTest(Test):
+    """
+    Checks that an absorption coefficient calculated with adaptive line wings (WingTolerance)
+    stays close to the calculation with the full wings: the error relative to the local absorption
+    is a small multiple of the tolerance, and much smaller relative to the maximum; also for a
+    table that only has the broadening of the diluent, without the one of air.
+    """
+
+    TOLERANCE = 1e-3
+
+    def __init__(self):
+        Test.__init__(self)
+
+    def name(self) -> str:
+        return 'adaptive wing test'
+
+    def test(self) -> bool:
+        import hapi
+
+        table = create_synthetic_table(nlines=300)
+        self_broadened = create_synthetic_table('self_broadened', nlines=300)
+        header = hapi.LOCAL_TABLE_CACHE[self_broadened]['header']
+        del hapi.LOCAL_TABLE_CACHE[self_broadened]['data']['gamma_air']
+        del header['format']['gamma_air']
+        header['order'] = tuple(par for par in header['order'] if par != 'gamma_air')
+
+        ok = True
+        for source, diluent in ((table, {'air': 1.0}), (self_broadened, {'self': 1.0})):
+            args = dict(SourceTables=source, HITRAN_units=False, WavenumberStep=0.01,
+                        WavenumberWing=10.0, Environment={'T': 296.0, 'p': 1.0},
+                        Diluent=diluent)
+            _, full = hapi.absorptionCoefficient_Voigt(**args)
+            _, adaptive = hapi.absorptionCoefficient_Voigt(
+                WingTolerance=AdaptiveWingTest.TOLERANCE, **args)
+            err = np.abs(adaptive - full)
+            local = np.max(err / full)
+            peak = np.max(err) / np.max(full)
+            print('max relative error: {:.3e} (local), {:.3e} (peak)'.format(local, peak))
+            ok = ok and local <= 10 * AdaptiveWingTest.TOLERANCE and \
+                peak <= AdaptiveWingTest.TOLERANCE
+        return bool(ok)
@@ -0,0 +1,107 @@
+import tempfile
+
+import numpy as np
+
+from test.synthetic_table import create_synthetic_table
+from test.test import Test
+
+
+class AsyncWorkerTest(Test):
+    """
+    Gathers metadata and absorption coefficient requests of several tables from an asyncio event
+    loop with an AsyncWorker that submits at most two of them at a time, on a pool of two work
+    processes. Checks the results, that the concurrency bound holds, that a failed request
+    raises WorkError, that cancelling the task of a long calculation cancels it, and that the
+    worker can be used by another event loop afterwards.
+    """
+
+    def __init__(self):
+        Test.__init__(self)
+
+    def name(self) -> str:
+        return 'async worker test'
+
+    def test(self) -> bool:
+        import asyncio
+
+        import hapi
+        from metadata.config import Config
+        from worker.async_worker import AsyncWorker, WorkError
+        from worker.work_dispatcher import WorkDispatcher
+        from worker.work_request import WorkRequest
+        from worker.work_scheduler import WorkScheduler
+
+        Config.data_folder = tempfile.mkdtemp()
+        hapi.VARIABLES['BACKEND_DATABASE_NAME'] = Config.data_folder
+        tables = ['a', 'b', 'c', 'd']
+        for i, name in enumerate(tables):
+            hapi.cache2storage(create_synthetic_table(name, nlines=1000, seed=i))
+
+        abscoef = dict(graph_fn='Voigt', Components=[(2, 1)],
+                       Environment={'T': 296.0, 'p': 1.0}, Diluent={'air': 1.0},
+                       WavenumberRange=(2000.0, 2100.0), WavenumberStep=0.01,
+                       WavenumberWing=10.0, WavenumberWingHW=50.0, title='', titlex='',
+                       titley='', name='')
+
+        worker = AsyncWorker(concurrency=2)
+
+        async def main() -> bool:
+            in_flight = []
+            running = True
+
+            async def sample():
+                while running:
+                    in_flight.append(WorkDispatcher.pending())
+                    await asyncio.sleep(0.005)
+
+            sampler = asyncio.create_task(sample())
+            metadata, spectra = await asyncio.gather(
+                asyncio.gather(*(worker.run(WorkRequest.TABLE_META_DATA, {'table_name': name})
+                                 for name in tables)),
+                asyncio.gather(*(worker.run(WorkRequest.ABSORPTION_COEFFICIENT,
+                                            {**abscoef, 'SourceTables': [name]})
+                                 for name in tables)))
+            running = False
+            await sampler
+            print('requests in flight: at most {}'.format(max(in_flight)))
+            if max(in_flight) > 2 or any(meta['length'] != 1000 for meta in metadata) or \
+                    any(spectrum['y'].max() <= 0.0 for spectrum in spectra) or \
+                    np.array_equal(spectra[0]['y'], spectra[1]['y']):
+                return False
+
+            try:
+                await worker.run(WorkRequest.ABSORPTION_COEFFICIENT,
+                                 {**abscoef, 'SourceTables': ['missing']})
+                return False
+            except WorkError as e:
+                print('failed request: {}'.format(e))
+
+            slow = asyncio.create_task(worker.run(
+                WorkRequest.ABSORPTION_COEFFICIENT,
+                {**abscoef, 'SourceTables': ['a'], 'WavenumberStep': 0.0001,
+                 'WavenumberWing': 50.0}))
+            await asyncio.sleep(1.0)
+            slow.cancel()
+            try:
+                await slow
+                return False
+            except asyncio.CancelledError:
+                pass
+            # The pool is free again once the work process has noticed the cancellation
+            names = await asyncio.wait_for(worker.run(WorkRequest.TABLE_NAMES, {}), 60.0)
+            return sorted(names) == tables
+
+        WorkScheduler.start(2, fast_lane=False)
+        async def names() -> list:
+            return await asyncio.gather(*(worker.run(WorkRequest.TABLE_NAMES, {})
+                                          for _ in range(3)))
+
+        try:
+            if not asyncio.run(asyncio.wait_for(main(), 600.0)):
+                return False
+            # A new event loop gets a semaphore of its own
+            return all(sorted(result) == tables
+                       for result in asyncio.run(asyncio.wait_for(names(), 60.0)))
+        finally:
+            WorkScheduler.stop()
+            WorkDispatcher.stop()
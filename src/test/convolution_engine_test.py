@@ -0,0 +1,78 @@
+import numpy as np
+
+from test.test import Test
+
+
+class ConvolutionEngineTest(Test):
+    """
+    Checks that every convolution engine reproduces numpy's direct convolution for the slit
+    functions of the GUI, including the running sum engine for box and triangular slits, also
+    relative to the weak wings of a long spectrum with a large dynamic range, and that the
+    convolution sampled on an output grid agrees with the full one.
+    """
+
+    TOLERANCE = 1e-10
+
+    def __init__(self):
+        Test.__init__(self)
+
+    def name(self) -> str:
+        return 'convolution engine test'
+
+    def test(self) -> bool:
+        import hapi
+
+        step = 0.001
+        spectrum = np.random.RandomState(0).rand(50001) ** 8
+        ok = True
+        for slit_fn in (hapi.SLIT_RECTANGULAR, hapi.SLIT_TRIANGULAR, hapi.SLIT_GAUSSIAN,
+                        hapi.SLIT_DISPERSION, hapi.SLIT_DIFFRACTION, hapi.SLIT_MICHELSON):
+            for resolution, wing in ((0.01, 0.05), (0.1, 1.0), (0.0373, 2.0)):
+                slit = hapi.getSlitFunction(slit_fn, resolution, wing, step)
+                expected = np.convolve(spectrum, slit, mode='same')
+                for engine_name, engine in hapi.CONVOLVE_ENGINES.items():
+                    if engine is hapi.convolveRunningSum and hapi.slitBoxes(slit) is None:
+                        continue
+                    err = np.max(np.abs(engine(spectrum, slit) - expected)) / np.max(expected)
+                    if err > ConvolutionEngineTest.TOLERANCE:
+                        print('{} {} {}: {:.3e}'.format(slit_fn.__name__, resolution,
+                                                        engine_name, err))
+                        ok = False
+
+        # The running sums keep the relative error small where the spectrum is 1e-12 of its peaks
+        nu = 0.01 * np.arange(1000000)
+        lines = np.zeros(len(nu)) + 1e-12
+        for center in np.random.RandomState(1).uniform(0.0, 10000.0, 5):
+            lines += 0.01 ** 2 / ((nu - center) ** 2 + 0.01 ** 2)
+        for slit_fn in (hapi.SLIT_RECTANGULAR, hapi.SLIT_TRIANGULAR):
+            slit = hapi.getSlitFunction(slit_fn, 0.5, 2.0, 0.01)
+            expected = np.convolve(lines, slit, mode='same')
+            weak = expected < 1e-9 * np.max(expected)
+            err = np.max(np.abs(hapi.convolveRunningSum(lines, slit) - expected)[weak] /
+                         expected[weak])
+            if hapi.slitBoxes(slit) is None or not np.any(weak) or \
+                    err > ConvolutionEngineTest.TOLERANCE:
+                print('{} weak wings: {:.3e}'.format(slit_fn.__name__, err))
+                ok = False
+
+        # Sampling on a grid with a multiple of the step picks points of the full convolution.
+        nu = 2000.0 + step * np.arange(len(spectrum))
+        for slit_fn in (hapi.SLIT_RECTANGULAR, hapi.SLIT_GAUSSIAN):
+            x, y, _, _, _ = hapi.convolveSpectrum(nu, spectrum, 0.2, 1.0, slit_fn)
+            xs, ys = hapi.convolveSpectrumSampled(nu, spectrum, 0.2, 1.0, slit_fn,
+                                                  OutputStep=0.1)
+            ok = ok and len(xs) == len(x[::100]) and np.allclose(xs, x[::100]) and \
+                np.max(np.abs(ys - y[::100])) <= ConvolutionEngineTest.TOLERANCE * np.max(y)
+
+        # Box slits always and triangular slits whose width is a multiple of the step can use
+        # running sums.
+        ok = ok and hapi.slitBoxes(hapi.getSlitFunction(hapi.SLIT_RECTANGULAR, 0.0373, 2.0,
+                                                        step)) is not None
+        ok = ok and hapi.slitBoxes(hapi.getSlitFunction(hapi.SLIT_TRIANGULAR, 0.1, 1.0,
+                                                        step)) is not None
+
+        # The slit cache keeps the most recently used slits only.
+        recent = hapi.getSlitFunction(hapi.SLIT_GAUSSIAN, 0.1, 1.0, step)
+        ok = ok and len(hapi.SLIT_CACHE) <= hapi.VARIABLES['SLIT_CACHE_ENTRIES'] and \
+            hapi.getSlitFunction(hapi.SLIT_GAUSSIAN, 0.1, 1.0, step) is recent
+        return bool(ok)
@@ -0,0 +1,65 @@
+from time import time
+
+import numpy as np
+
+from test.test import Test
+
+
+class CpfEngineTest(Test):
+    """
+    Accuracy / speed benchmark of the vectorized CPF engines against the original cpf on a
+    standard (x, y) grid: x in [-30, 30], y log-spaced in [1e-6, 1e2].
+    """
+
+    REPEATS = 5
+
+    def __init__(self):
+        Test.__init__(self)
+
+    def name(self) -> str:
+        return 'cpf engine test'
+
+    def test(self) -> bool:
+        import hapi
+
+        x = np.linspace(-30.0, 30.0, 2001)
+        y = np.logspace(-6.0, 2.0, 50)
+        X, Y = np.meshgrid(x, y)
+        X = X.ravel()
+        Y = Y.ravel()
+
+        def bench(fn):
+            start = time()
+            for _ in range(CpfEngineTest.REPEATS):
+                result = fn(X, Y)
+            return result, (time() - start) / CpfEngineTest.REPEATS
+
+        (ref_r, ref_i), ref_time = bench(hapi.cpf)
+        print('{:16s} {:>12s} {:>12s} {:>10s}'.format('engine', 'max rel err', 'time (ms)',
+                                                      'speedup'))
+        print('{:16s} {:>12s} {:12.2f} {:10.2f}'.format('cpf', '-', ref_time * 1e3, 1.0))
+
+        # Maximum relative error of the real part (Voigt function) w.r.t. the original cpf
+        # that each engine is expected to stay within. The Humlicek algorithm itself is only
+        # good to a few 1e-3 (relative) in the far wings when y is tiny, which bounds the
+        # agreement with the Weideman based engines.
+        tolerances = {'humlicek': 1e-12, 'hum1_wei': 5e-3, 'voigt': 5e-3}
+        ok = True
+        for engine_name, engine in hapi.CPF_ENGINES.items():
+            (wr, wi), engine_time = bench(engine)
+            err = np.max(np.abs(wr - ref_r) / np.abs(ref_r))
+            print('{:16s} {:12.3e} {:12.2f} {:10.2f}'.format(engine_name, err, engine_time * 1e3,
+                                                             ref_time / engine_time))
+            ok = ok and err <= tolerances[engine_name]
+            if wi is not None:
+                ok = ok and np.max(np.abs(wi - ref_i)) <= tolerances[engine_name]
+
+        # The masked engines must reproduce the algorithms they replace.
+        wr, wi = hapi.cpf_hum1_wei(X, Y)
+        old_r, old_i = hapi.hum1_wei(X, Y)
+        ok = ok and np.allclose(wr, old_r, rtol=1e-12, atol=0) and \
+            np.allclose(wi, old_i, rtol=1e-12, atol=0)
+        wr, _ = hapi.cpf_voigt(X, Y)
+        ok = ok and np.allclose(wr, old_r, rtol=1e-12, atol=0)
+
+        return bool(ok)
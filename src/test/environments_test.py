@@ -0,0 +1,39 @@
+import numpy as np
+
+from test.synthetic_table import create_synthetic_table
+from test.test import Test
+
+
+class EnvironmentsTest(Test):
+    """
+    Checks that the absorption coefficients calculated for several environments at once, one of
+    them with its own diluent, are the ones of separate calculations for each environment.
+    """
+
+    def __init__(self):
+        Test.__init__(self)
+
+    def name(self) -> str:
+        return 'environments test'
+
+    def test(self) -> bool:
+        import hapi
+
+        table = create_synthetic_table(nlines=200)
+        args = dict(SourceTables=table, HITRAN_units=False, WavenumberStep=0.01,
+                    Diluent={'air': 1.0})
+        environments = [{'T': 250.0, 'p': 0.5},
+                        {'T': 350.0, 'p': 2.0, 'Diluent': {'air': 0.5, 'self': 0.5}}]
+        nu, rows = hapi.absorptionCoefficient_Voigt(
+            Environment=environments[0], Environments=environments, **args)
+        if rows.shape != (2, len(nu)):
+            return False
+        for environment, row in zip(environments, rows):
+            environment = dict(environment)
+            diluent = environment.pop('Diluent', args['Diluent'])
+            single_nu, single = hapi.absorptionCoefficient_Voigt(
+                Environment=environment, **{**args, 'Diluent': diluent})
+            if not np.array_equal(nu, single_nu) or \
+                    not np.allclose(row, single, rtol=1e-12, atol=0.0):
+                return False
+        return not np.allclose(rows[0], rows[1])
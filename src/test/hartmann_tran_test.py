@@ -0,0 +1,57 @@
+import numpy as np
+
+from test.synthetic_table import create_synthetic_table
+from test.test import Test
+
+
+class HartmannTranTest(Test):
+    """
+    Checks that the vectorized pcqsdhc reproduces the single line pcqsdhc_OLD, both for a batch of
+    lines covering all branches of the algorithm (Voigt, SDVoigt, SDVoigt with shift dependence,
+    HT) and for an absorption coefficient calculated with batches of lines.
+    """
+
+    TOLERANCE = 1e-9
+
+    def __init__(self):
+        Test.__init__(self)
+
+    def name(self) -> str:
+        return 'hartmann tran test'
+
+    def test(self) -> bool:
+        import hapi
+
+        rng = np.random.RandomState(1)
+        lines = []
+        for i in range(200):
+            kind = i % 4
+            gamma0 = 10 ** rng.uniform(-4.0, 0.0)
+            lines.append((2000.0 + rng.uniform(-1.0, 1.0),                        # Nu
+                          10 ** rng.uniform(-3.0, -1.0),                          # GammaD
+                          gamma0,                                                 # Gamma0
+                          0.0 if kind == 0 else gamma0 * rng.uniform(0.0, 0.3),   # Gamma2
+                          rng.uniform(-1e-2, 0.0),                                # Delta0
+                          0.0 if kind < 2 else rng.uniform(-1e-3, 1e-3),          # Delta2
+                          0.0 if kind < 3 else rng.uniform(0.0, 0.1),             # NuVC
+                          0.0 if kind < 3 else rng.uniform(0.0, 0.5)))            # Eta
+        wn = np.linspace(1990.0, 2010.0, 2001)
+
+        expected = np.array([hapi.pcqsdhc_OLD(*line, wn)[0] for line in lines])
+        parameters = np.array(lines).T[:, :, None]
+        batch = hapi.pcqsdhc(*parameters, np.broadcast_to(wn, expected.shape))[0]
+        err = np.max(np.abs(batch - expected) / np.abs(expected))
+        print('max relative error (profiles): {:.3e}'.format(err))
+        if err > HartmannTranTest.TOLERANCE:
+            return False
+
+        table = create_synthetic_table()
+        args = dict(SourceTables=table, HITRAN_units=False, WavenumberStep=0.01,
+                    Environment={'T': 296.0, 'p': 0.1}, Diluent={'air': 1.0})
+        _, batched = hapi.absorptionCoefficient_HT(**args)
+        hapi.VECTORIZED_PROFILES.clear()
+        _, single = hapi.absorptionCoefficient_HT(**args)
+        mask = single > 0
+        err = np.max(np.abs(batched[mask] - single[mask]) / single[mask])
+        print('max relative error (abscoef): {:.3e}'.format(err))
+        return bool(err <= HartmannTranTest.TOLERANCE)
@@ -0,0 +1,38 @@
+import numpy as np
+
+from test.synthetic_table import create_synthetic_table
+from test.test import Test
+
+
+class LadderPlanTest(Test):
+    """
+    Checks that the broadening parameters resolved once per table (ladderPlan) give the same
+    absorption coefficient as the search of the presets for every line, for a diluent with missing
+    columns and with columns having masked values.
+    """
+
+    def __init__(self):
+        Test.__init__(self)
+
+    def name(self) -> str:
+        return 'ladder plan test'
+
+    def test(self) -> bool:
+        import hapi
+
+        table = create_synthetic_table(nlines=200)
+        data = hapi.LOCAL_TABLE_CACHE[table]['data']
+        rng = np.random.RandomState(3)
+        data['gamma_h2o'] = np.ma.array(rng.uniform(0.2, 0.4, 200),
+                                        mask=rng.uniform(size=200) < 0.3)
+        data['delta_h2o'] = np.ma.array(rng.uniform(-0.01, 0.0, 200),
+                                        mask=rng.uniform(size=200) < 0.3)
+
+        args = dict(SourceTables=table, HITRAN_units=False, WavenumberStep=0.01,
+                    Environment={'T': 296.0, 'p': 1.0},
+                    Diluent={'air': 0.8, 'h2o': 0.1, 'co2': 0.1})
+        _, planned = hapi.absorptionCoefficient_HT(**args)
+        # the DEBUG mode searches the presets for every line
+        _, searched = hapi.absorptionCoefficient_HT(DEBUG=[], **args)
+        print('max difference: {:.3e}'.format(np.max(np.abs(planned - searched))))
+        return bool(np.all(np.isfinite(planned)) and np.array_equal(planned, searched))
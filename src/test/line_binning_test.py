@@ -0,0 +1,36 @@
+import numpy as np
+
+from test.synthetic_table import create_synthetic_table
+from test.test import Test
+
+
+class LineBinningTest(Test):
+    """
+    Checks that binning lines narrower than the grid step (LineBinning) keeps the absorption: the
+    cumulative integral of the absorption must match a calculation on a grid fine enough to
+    resolve the lines.
+    """
+
+    TOLERANCE = 1e-2
+
+    def __init__(self):
+        Test.__init__(self)
+
+    def name(self) -> str:
+        return 'line binning test'
+
+    def test(self) -> bool:
+        import hapi
+
+        table = create_synthetic_table(nlines=300)
+        args = dict(SourceTables=table, HITRAN_units=False, WavenumberRange=[2000.0, 2100.0],
+                    Environment={'T': 296.0, 'p': 1e-3}, Diluent={'air': 1.0})
+        _, binned = hapi.absorptionCoefficient_Voigt(WavenumberStep=0.01, LineBinning=0.5, **args)
+        _, fine = hapi.absorptionCoefficient_Voigt(WavenumberStep=0.0005, **args)
+
+        # integrals up to the upper edges of the cells of the coarse grid
+        expected = np.cumsum(fine)[10::20] * 0.0005
+        integral = np.cumsum(binned)[:len(expected)] * 0.01
+        err = np.max(np.abs(integral - expected)) / expected[-1]
+        print('max error of the integrated absorption: {:.3e}'.format(err))
+        return bool(err <= LineBinningTest.TOLERANCE)
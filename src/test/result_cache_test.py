@@ -0,0 +1,104 @@
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from test.synthetic_table import create_synthetic_table
+from test.test import Test
+
+
+class ResultCacheTest(Test):
+    """
+    Checks the two tiers of ResultCache: a result is calculated once and then served from memory,
+    or from disk once it has left the memory; memory-only results never reach the disk; saving a
+    table misses the results of its old content, and so does an absorption coefficient after a
+    change of the hapi precision; and the least recently used files are removed when the cache
+    exceeds its size.
+    """
+
+    def __init__(self):
+        Test.__init__(self)
+
+    def name(self) -> str:
+        return 'result cache test'
+
+    def test(self) -> bool:
+        import hapi
+        from data_structures.result_cache import ResultCache
+        from metadata.config import Config
+        from worker.work_functions import WorkFunctions
+
+        Config.data_folder = tempfile.mkdtemp()
+        Config.result_cache_size = 5
+        hapi.VARIABLES['BACKEND_DATABASE_NAME'] = Config.data_folder
+        hapi.cache2storage(create_synthetic_table('a', nlines=100))
+
+        calculations = []
+
+        def calculate(n: int = 10):
+            calculations.append(n)
+            return np.arange(float(n)), np.ones(n)
+
+        def files():
+            return sorted(os.listdir(ResultCache.path()))
+
+        # A miss, then a hit from memory
+        ResultCache.memoize(['a'], {'n': 1}, calculate)
+        x, y = ResultCache.memoize(['a'], {'n': 1}, calculate)
+        if len(calculations) != 1 or len(files()) != 1 or len(x) != 10:
+            return False
+
+        # Memory-only results are not written
+        for n in range(ResultCache.MEMORY_ENTRIES):
+            ResultCache.memoize(['a'], {'n': 1, 'memory': n}, calculate, disk=False)
+        ResultCache.memoize(['a'], {'n': 1, 'memory': 0}, calculate, disk=False)
+        if len(calculations) != 1 + ResultCache.MEMORY_ENTRIES or len(files()) != 1:
+            return False
+
+        # The first result has left the memory, so it is read from disk
+        ResultCache.memoize(['a'], {'n': 1}, calculate)
+        if len(calculations) != 1 + ResultCache.MEMORY_ENTRIES:
+            return False
+
+        # A changed table misses its old results
+        WorkFunctions.save_table(table_name='a', name='a', edits=[('sw', 0, 1e-19)])
+        ResultCache.memoize(['a'], {'n': 1}, calculate)
+        if len(calculations) != 2 + ResultCache.MEMORY_ENTRIES or len(files()) != 2:
+            return False
+
+        # A changed hapi setting misses the absorption coefficients calculated with the old one
+        voigt = WorkFunctions.graph_type_map['Voigt']
+
+        def counting_voigt(**kwargs):
+            calculations.append(kwargs['Environment'])
+            return voigt(**kwargs)
+
+        abscoef = ('Voigt', [(2, 1)], ['a'], {'T': 296.0, 'p': 1.0}, {'air': 1.0},
+                   (2000.0, 2100.0), 0.01, 10.0, 50.0)
+        WorkFunctions.graph_type_map['Voigt'] = counting_voigt
+        try:
+            WorkFunctions.absorption_coefficient(*abscoef)
+            WorkFunctions.absorption_coefficient(*abscoef)
+            hapi.VARIABLES['PRECISION'] = 'single'
+            WorkFunctions.absorption_coefficient(*abscoef)
+        finally:
+            hapi.VARIABLES['PRECISION'] = 'double'
+            WorkFunctions.graph_type_map['Voigt'] = voigt
+        if len(calculations) != 4 + ResultCache.MEMORY_ENTRIES:
+            return False
+
+        # Results of 2 MB (random values do not compress): the third one exceeds the 5 MB budget
+        # and removes the least recently used one
+        rng = np.random.RandomState(0)
+        big = [ResultCache.key(['a'], big=i) for i in range(3)]
+        now = time.time()
+        for i, key in enumerate(big[:2]):
+            ResultCache.put(key, rng.uniform(size=2 ** 17), rng.uniform(size=2 ** 17))
+        # The first one was used more recently than the second one
+        os.utime(os.path.join(ResultCache.path(), big[0] + '.npz'), (now + 10, now + 10))
+        os.utime(os.path.join(ResultCache.path(), big[1] + '.npz'), (now - 10, now - 10))
+        ResultCache.put(big[2], rng.uniform(size=2 ** 17), rng.uniform(size=2 ** 17))
+        remaining = [key for key in big if ResultCache.get(key) is not None]
+        print('results kept after eviction: {}'.format(len(files())))
+        return remaining == [big[0], big[2]]
@@ -0,0 +1,55 @@
+import multiprocessing
+
+import numpy as np
+
+from test.test import Test
+
+
+def send_table(q: multiprocessing.Queue):
+    from worker.shared_arrays import SharedArrays
+    from worker.work_result import WorkResult
+
+    rng = np.random.RandomState(0)
+    data = {'nu': rng.uniform(0.0, 10000.0, 200000), 'molec_id': np.ones(10, dtype=np.int64)}
+    q.put(SharedArrays.pack(WorkResult(1, {'data': data, 'sum': float(data['nu'].sum())})))
+
+
+class SharedArraysTest(Test):
+    """
+    Sends a work result with a large and a small array from another process and checks that only
+    the large array goes through shared memory, that it arrives intact and writable without being
+    copied, and that the block is released once the array is gone.
+    """
+
+    def __init__(self):
+        Test.__init__(self)
+
+    def name(self) -> str:
+        return 'shared arrays test'
+
+    def test(self) -> bool:
+        import gc
+        from worker.shared_arrays import SharedArrays, SharedPayload
+
+        q = multiprocessing.Queue()
+        sender = multiprocessing.Process(target=send_table, args=(q,))
+        sender.start()
+        payload = q.get()
+        sender.join()
+        if not isinstance(payload, SharedPayload) or len(payload.buffers) != 1:
+            return False
+        print('pickle size: {} bytes'.format(len(payload.data)))
+
+        work_result = SharedArrays.unpack(payload)
+        nu = work_result.result['data']['nu']
+        if nu.flags.owndata or not nu.flags.writeable:
+            return False
+        if nu.sum() != work_result.result['sum']:
+            return False
+        nu[0] = -1.0
+
+        if SharedArrays.release() != 1:
+            return False
+        del nu, work_result
+        gc.collect()
+        return SharedArrays.release() == 0
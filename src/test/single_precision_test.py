@@ -0,0 +1,55 @@
+import numpy as np
+
+from test.synthetic_table import create_synthetic_table
+from test.test import Test
+
+
+class SinglePrecisionTest(Test):
+    """
+    Checks that absorption coefficients and convolved spectra calculated with
+    Precision='single' are float32 and stay close to the double precision results, and that the
+    default precision still gives float64.
+    """
+
+    ##
+    # The maximal deviation from double precision, relative to the peak of the spectrum.
+    TOLERANCE = 1e-5
+
+    def __init__(self):
+        Test.__init__(self)
+
+    def name(self) -> str:
+        return 'single precision test'
+
+    def test(self) -> bool:
+        import hapi
+
+        table = create_synthetic_table()
+        args = dict(SourceTables=table, HITRAN_units=False, WavenumberStep=0.01,
+                    Environment={'T': 296.0, 'p': 0.5}, Diluent={'air': 1.0})
+
+        def deviation(double, single) -> float:
+            if double.dtype != np.float64 or single.dtype != np.float32:
+                return np.inf
+            return float(np.max(np.abs(single - double)) / np.max(double))
+
+        errors = {}
+        for profile in ('Voigt', 'Lorentz', 'Doppler', 'HT'):
+            calculate = getattr(hapi, 'absorptionCoefficient_' + profile)
+            nu, double = calculate(**args)
+            _, single = calculate(Precision='single', **args)
+            errors[profile] = deviation(double, single)
+
+        nu, xsc = hapi.absorptionCoefficient_Voigt(**args)
+        slit = dict(Resolution=0.5, AF_wing=3.0, SlitFunction=hapi.SLIT_GAUSSIAN)
+        errors['convolution'] = deviation(hapi.convolveSpectrum(nu, xsc, **slit)[1],
+                                          hapi.convolveSpectrum(nu, xsc, Precision='single',
+                                                                **slit)[1])
+        errors['sampled convolution'] = \
+            deviation(hapi.convolveSpectrumSampled(nu, xsc, OutputStep=0.1, **slit)[1],
+                      hapi.convolveSpectrumSampled(nu, xsc, OutputStep=0.1, Precision='single',
+                                                   **slit)[1])
+
+        for label, err in errors.items():
+            print('{}: max deviation {:.3e}'.format(label, err))
+        return all(err <= SinglePrecisionTest.TOLERANCE for err in errors.values())
@@ -0,0 +1,66 @@
+import tempfile
+
+import numpy as np
+
+from test.synthetic_table import create_synthetic_table
+from test.test import Test
+
+
+class SpectrumPipelineTest(Test):
+    """
+    Graphs a transmittance spectrum, then the same spectrum with another path length and an
+    instrumental function, and an absorption spectrum of the same setup. Checks that the
+    absorption coefficient is calculated only once, and that the later spectra are the ones
+    calculated from scratch.
+    """
+
+    def __init__(self):
+        Test.__init__(self)
+
+    def name(self) -> str:
+        return 'spectrum pipeline test'
+
+    def test(self) -> bool:
+        import hapi
+        from metadata.config import Config
+        from worker.work_functions import WorkFunctions
+
+        Config.data_folder = tempfile.mkdtemp()
+        hapi.VARIABLES['BACKEND_DATABASE_NAME'] = Config.data_folder
+        hapi.cache2storage(create_synthetic_table('a', nlines=300))
+
+        calculations = []
+        voigt = WorkFunctions.graph_type_map['Voigt']
+
+        def counting_voigt(**kwargs):
+            calculations.append(kwargs['Environment'])
+            return voigt(**kwargs)
+
+        args = dict(graph_fn='Voigt', Components=[(2, 1)], SourceTables=['a'],
+                    Environment={'T': 296.0, 'p': 1.0}, Diluent={'air': 1.0},
+                    HITRAN_units=False, WavenumberRange=(2000.0, 2100.0), WavenumberStep=0.01,
+                    WavenumberWing=10.0, WavenumberWingHW=50.0, title='', titlex='', titley='',
+                    name='')
+        WorkFunctions.graph_type_map['Voigt'] = counting_voigt
+        try:
+            WorkFunctions.graph_transmittance_spectrum(path_length=100.0, **args)
+            second = WorkFunctions.graph_transmittance_spectrum(
+                path_length=10.0, instrumental_fn='gaussian', Resolution=0.1, AF_wing=1.0,
+                **args)
+            third = WorkFunctions.graph_absorption_spectrum(path_length=10.0, **args)
+        finally:
+            WorkFunctions.graph_type_map['Voigt'] = voigt
+        print('absorption coefficient calculations: {}'.format(len(calculations)))
+        if len(calculations) != 1:
+            return False
+
+        nu, coef = voigt(Components=[(2, 1)], SourceTables=['a'],
+                         Environment={'T': 296.0, 'p': 1.0}, Diluent={'air': 1.0},
+                         HITRAN_units=False, WavenumberRange=(2000.0, 2100.0),
+                         WavenumberStep=0.01, WavenumberWing=10.0, WavenumberWingHW=50.0)
+        x, y = hapi.transmittanceSpectrum(nu, coef, Environment={'l': 10.0, 'T': 296.0})
+        x, y, _, _, _ = hapi.convolveSpectrum(x, y, Resolution=0.1, AF_wing=1.0,
+                                              SlitFunction=hapi.SLIT_GAUSSIAN)
+        _, absorption = hapi.absorptionSpectrum(nu, coef, Environment={'l': 10.0, 'T': 296.0})
+        return np.allclose(second['x'], x) and np.allclose(second['y'], y) and \
+            np.allclose(third['y'], absorption)
@@ -0,0 +1,43 @@
+"""
+Tests of the calculation code can't download line lists from HITRAN, so they use a synthetic line
+list instead. The lines look like a band of one isotopologue: random positions in the wavenumber
+range, log-uniform intensities, and realistic broadening parameters.
+"""
+import numpy as np
+
+
+def create_synthetic_table(name: str = 'synthetic', nlines: int = 500,
+                           numin: float = 2000.0, numax: float = 2100.0,
+                           molec_id: int = 2, local_iso_id: int = 1, seed: int = 0):
+    """
+    Creates a synthetic table named `name` in hapi's LOCAL_TABLE_CACHE.
+    :return: the name of the table.
+    """
+    import hapi
+
+    rng = np.random.RandomState(seed)
+    nu = np.sort(rng.uniform(numin, numax, nlines))
+    data = {
+        'molec_id':     np.full(nlines, molec_id, dtype=np.int64),
+        'local_iso_id': np.full(nlines, local_iso_id, dtype=np.int64),
+        'nu':           nu,
+        'sw':           10 ** rng.uniform(-26.0, -19.0, nlines),
+        'a':            rng.uniform(0.1, 100.0, nlines),
+        'elower':       rng.uniform(0.0, 3000.0, nlines),
+        'gamma_air':    rng.uniform(0.05, 0.1, nlines),
+        'gamma_self':   rng.uniform(0.07, 0.12, nlines),
+        'n_air':        rng.uniform(0.6, 0.8, nlines),
+        'delta_air':    rng.uniform(-0.005, 0.0, nlines),
+    }
+    order = tuple(data.keys())
+    header = {
+        'table_name':     name,
+        'number_of_rows': nlines,
+        'order':          order,
+        # Upper case exponents as in HITRAN headers, which storage2cache can read back
+        'format':         {par: hapi.PARAMETER_META[par]['default_fmt'].replace('e', 'E')
+                           for par in order},
+        'default':        {},
+    }
+    hapi.LOCAL_TABLE_CACHE[name] = {'header': header, 'data': data}
+    return name
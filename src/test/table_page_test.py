@@ -0,0 +1,56 @@
+import tempfile
+
+from test.synthetic_table import create_synthetic_table
+from test.test import Test
+
+
+class TablePageTest(Test):
+    """
+    Pages through a synthetic table with GET_TABLE_PAGE and Lines, and checks that edits survive
+    pages being dropped and loaded again, and that saving the edits in the work process changes
+    only the saved copy of the table.
+    """
+
+    def __init__(self):
+        Test.__init__(self)
+
+    def name(self) -> str:
+        return 'table page test'
+
+    def test(self) -> bool:
+        import hapi
+        from data_structures.lines import Lines
+        from metadata.config import Config
+        from worker.work_functions import WorkFunctions
+
+        Config.data_folder = tempfile.mkdtemp()
+        hapi.VARIABLES['BACKEND_DATABASE_NAME'] = Config.data_folder
+        Config.select_page_length = 100
+        table = create_synthetic_table(nlines=1050)
+        nu = hapi.LOCAL_TABLE_CACHE[table]['data']['nu']
+
+        page = WorkFunctions.get_table_page(table, 200, 100, ['nu', 'sw'])
+        if list(page['data'].keys()) != ['nu', 'sw'] or page['number_of_rows'] != 1050 or \
+                list(page['data']['nu']) != list(nu[200:300]):
+            return False
+
+        lines = Lines(WorkFunctions.get_table_page(table, 0, 100))
+        if lines.last_page != 11 or lines.last_page_len != 50:
+            return False
+        lines.get_line(5).update_nth_field(lines.param_order.index('nu'), 1.0)
+        for page_number in range(2, 12):
+            lines.add_page(WorkFunctions.get_table_page(table, lines.page_start(page_number), 100))
+            lines.set_page(page_number)
+        if len(lines.pages) != Lines.MAX_PAGES or lines.get_len() != 50 or \
+                lines.get_line(49).get_nth_field(lines.param_order.index('nu')) != nu[-1]:
+            return False
+        lines.add_page(WorkFunctions.get_table_page(table, 0, 100))
+        lines.set_page(1)
+        if lines.get_line(5).get_nth_field(lines.param_order.index('nu')) != 1.0:
+            return False
+
+        edits = [(param, row, value) for (param, row), value in lines.edits.items()]
+        if not WorkFunctions.save_table(table_name=table, name='edited', edits=edits):
+            return False
+        edited = hapi.LOCAL_TABLE_CACHE['edited']['data']['nu']
+        return edited[5] == 1.0 and nu[5] != 1.0 and list(edited[6:]) == list(nu[6:])
@@ -0,0 +1,32 @@
+import numpy as np
+
+from test.synthetic_table import create_synthetic_table
+from test.test import Test
+
+
+class TwoGridTest(Test):
+    """
+    Checks that an absorption coefficient calculated with the two-level wavenumber grid stays
+    within the requested accuracy of the fine grid calculation, for pressure broadened lines.
+    """
+
+    ACCURACY = 1e-3
+
+    def __init__(self):
+        Test.__init__(self)
+
+    def name(self) -> str:
+        return 'two grid test'
+
+    def test(self) -> bool:
+        import hapi
+
+        table = create_synthetic_table(nlines=200)
+        args = dict(SourceTables=table, HITRAN_units=False, WavenumberStep=0.002,
+                    Environment={'T': 296.0, 'p': 2.0}, Diluent={'air': 1.0})
+        _, fine = hapi.absorptionCoefficient_HT(**args)
+        _, two_grid = hapi.absorptionCoefficient_HT(TwoGridAccuracy=TwoGridTest.ACCURACY, **args)
+        mask = fine > 0
+        err = np.max(np.abs(two_grid[mask] - fine[mask]) / fine[mask])
+        print('max relative error: {:.3e}'.format(err))
+        return bool(err <= TwoGridTest.ACCURACY)
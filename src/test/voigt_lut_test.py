@@ -0,0 +1,55 @@
+import tempfile
+
+import numpy as np
+
+from test.synthetic_table import create_synthetic_table
+from test.test import Test
+
+
+class VoigtLutTest(Test):
+    """
+    Checks that PROFILE_VOIGT_LUT stays within VOIGT_LUT_ERROR_BOUND of the exact Voigt profile,
+    both for single profiles over the whole (x, y) range of the table and for an absorption
+    coefficient, and that the table is cached on disk.
+    """
+
+    def __init__(self):
+        Test.__init__(self)
+
+    def name(self) -> str:
+        return 'voigt lut test'
+
+    def test(self) -> bool:
+        import os
+        import hapi
+
+        hapi.VARIABLES['BACKEND_DATABASE_NAME'] = tempfile.mkdtemp()
+
+        # Single profiles: GammaD = sqrt(ln2) so that x and y are the plain wavenumber offset
+        # and Lorentz width.
+        gamma_d = hapi.cSqrtLn2
+        worst = 0.0
+        for y in np.logspace(np.log10(hapi.VOIGT_LUT_YMIN), 2.0, 81):
+            wn = np.linspace(-40.0, 40.0, 4001)
+            exact = hapi.cefFast(wn, np.full(wn.shape, y), 32).real * hapi.pipwoeronehalf
+            lut = hapi.PROFILE_VOIGT_LUT(0.0, gamma_d, y, 0.0, wn)
+            worst = max(worst, np.max(np.abs(lut - exact) / exact))
+        print('max relative error (profiles): {:.3e}'.format(worst))
+        if worst > hapi.VOIGT_LUT_ERROR_BOUND:
+            return False
+
+        lut_files = os.listdir(os.path.join(hapi.VARIABLES['BACKEND_DATABASE_NAME'], '.cache'))
+        if not any(f.startswith('voigt_lut') and f.endswith('.npy') for f in lut_files):
+            return False
+
+        # Absorption coefficient: every line has a relative error below the bound, so the sum
+        # does as well.
+        table = create_synthetic_table()
+        args = dict(SourceTables=table, HITRAN_units=False, WavenumberStep=0.01,
+                    Environment={'T': 296.0, 'p': 0.1}, Diluent={'air': 1.0})
+        _, exact = hapi.absorptionCoefficient_Voigt(**args)
+        _, lut = hapi.absorptionCoefficient_VoigtLUT(**args)
+        mask = exact > 0
+        err = np.max(np.abs(lut[mask] - exact[mask]) / exact[mask])
+        print('max relative error (abscoef): {:.3e}'.format(err))
+        return bool(err <= hapi.VOIGT_LUT_ERROR_BOUND)
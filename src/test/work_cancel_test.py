@@ -0,0 +1,79 @@
+import tempfile
+import threading
+import time
+
+from test.synthetic_table import create_synthetic_table
+from test.test import Test
+
+
+class WorkCancelTest(Test):
+    """
+    Starts a single work process, keeps it busy with a long absorption coefficient calculation
+    and queues a batch and an interactive request behind it. Checks that a queued request can be
+    cancelled, that the running calculation stops soon after it is cancelled, and that the
+    interactive request is then served before the batch request.
+    """
+
+    def __init__(self):
+        Test.__init__(self)
+
+    def name(self) -> str:
+        return 'work cancel test'
+
+    def test(self) -> bool:
+        import hapi
+        from metadata.config import Config
+        from worker.work_dispatcher import WorkDispatcher
+        from worker.work_request import WorkRequest
+        from worker.work_scheduler import WorkScheduler
+
+        Config.data_folder = tempfile.mkdtemp()
+        hapi.VARIABLES['BACKEND_DATABASE_NAME'] = Config.data_folder
+        hapi.cache2storage(create_synthetic_table('a', nlines=100000))
+
+        results = []
+        done = threading.Condition()
+
+        def submit(work_type, priority=None, **args) -> int:
+            job_id = WorkDispatcher.new_job_id()
+
+            def handler(work_result):
+                with done:
+                    results.append(work_result)
+                    done.notify_all()
+
+            WorkDispatcher.submit(WorkRequest(job_id, work_type, args, priority), handler)
+            return job_id
+
+        def wait(count: int) -> bool:
+            with done:
+                return done.wait_for(lambda: len(results) >= count, 300.0)
+
+        WorkScheduler.start(1, fast_lane=False)
+        try:
+            slow = submit(WorkRequest.ABSORPTION_COEFFICIENT, graph_fn='HT', SourceTables=['a'],
+                          Components=[(2, 1)], Environment={'T': 296.0, 'p': 1.0},
+                          Diluent={'air': 1.0}, WavenumberRange=(2000.0, 2100.0),
+                          WavenumberStep=0.001, WavenumberWing=50.0, WavenumberWingHW=50.0,
+                          title='', titlex='', titley='', name='')
+            batch = submit(WorkRequest.TABLE_META_DATA, WorkRequest.BATCH, table_name='a')
+            dropped = submit(WorkRequest.GET_TABLE_PAGE, table_name='a', start=0, count=10)
+            interactive = submit(WorkRequest.TABLE_NAMES)
+            if WorkScheduler.queued() != 3:
+                return False
+
+            WorkDispatcher.cancel(dropped)
+            if not wait(1) or results[0].job_id != dropped or not results[0].cancelled:
+                return False
+
+            start = time.time()
+            WorkDispatcher.cancel(slow)
+            if not wait(4):
+                return False
+            print('cancelled after {:.3f} s'.format(time.time() - start))
+            order = [work_result.job_id for work_result in results[1:]]
+            return order == [slow, interactive, batch] and results[1].cancelled and \
+                results[2].result == ['a'] and results[3].result['length'] == 100000
+        finally:
+            WorkScheduler.stop()
+            WorkDispatcher.stop()
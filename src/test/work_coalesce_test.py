@@ -0,0 +1,101 @@
+import queue
+import threading
+
+from test.test import Test
+
+
+class WorkCoalesceTest(Test):
+    """
+    Answers work requests with a thread that stands in for the work process and counts what it
+    executes. Checks that identical requests in flight are executed once and every client gets
+    the result under its own job_id, that metadata is then answered from memory, that a client
+    can leave a shared execution, and that saving a table only invalidates what depends on it.
+    """
+
+    def __init__(self):
+        Test.__init__(self)
+
+    def name(self) -> str:
+        return 'work coalesce test'
+
+    def test(self) -> bool:
+        from worker.work_dispatcher import WorkDispatcher
+        from worker.work_request import WorkRequest
+        from worker.work_result import WorkResult
+
+        gate = threading.Event()
+        executed = queue.Queue()
+
+        def work_process():
+            while True:
+                request = WorkRequest.WORKQ.get()
+                if request.work_type == WorkRequest.END_WORK_PROCESS:
+                    return
+                gate.wait()
+                executed.put(request)
+                WorkRequest.RESULTQ.put(WorkResult(request.job_id, dict(request.work_args)))
+
+        worker = threading.Thread(target=work_process, daemon=True)
+        worker.start()
+        results = {}
+        lock = threading.Condition()
+
+        def submit(work_type, **args) -> int:
+            job_id = WorkDispatcher.new_job_id()
+
+            def handler(work_result):
+                with lock:
+                    results[job_id] = work_result
+                    lock.notify_all()
+
+            WorkDispatcher.submit(WorkRequest(job_id, work_type, args), handler)
+            return job_id
+
+        def wait(job_ids) -> bool:
+            with lock:
+                return lock.wait_for(lambda: all(job_id in results for job_id in job_ids), 10.0)
+
+        def count_executed() -> int:
+            count = 0
+            while not executed.empty():
+                executed.get()
+                count += 1
+            return count
+
+        try:
+            jobs = [submit(WorkRequest.TABLE_META_DATA, table_name='a') for _ in range(3)] + \
+                   [submit(WorkRequest.TABLE_META_DATA, table_name='b'),
+                    submit(WorkRequest.TABLE_NAMES), submit(WorkRequest.TABLE_NAMES)]
+            page = [submit(WorkRequest.GET_TABLE_PAGE, table_name='a', start=0, count=10)
+                    for _ in range(2)]
+            WorkDispatcher.cancel(page[0])
+            if not results[page[0]].cancelled:
+                return False
+            gate.set()
+            if not wait(jobs + page[1:]) or count_executed() != 4:
+                return False
+            if any(results[job_id].job_id != job_id for job_id in jobs) or \
+                    results[jobs[2]].result != {'table_name': 'a'}:
+                return False
+
+            memoized = [submit(WorkRequest.TABLE_META_DATA, table_name='a'),
+                        submit(WorkRequest.TABLE_NAMES)]
+            if not wait(memoized) or count_executed() != 0:
+                return False
+
+            save = submit(WorkRequest.SAVE_TABLE, name='a', edits=[])
+            if not wait([save]) or count_executed() != 1:
+                return False
+            again = [submit(WorkRequest.TABLE_META_DATA, table_name='a'),
+                     submit(WorkRequest.TABLE_NAMES),
+                     submit(WorkRequest.TABLE_META_DATA, table_name='b')]
+            if not wait(again):
+                return False
+            count = count_executed()
+            print('requests executed after the save: {}'.format(count))
+            return count == 2 and results[again[2]].result == {'table_name': 'b'}
+        finally:
+            gate.set()
+            WorkRequest.WORKQ.put(WorkRequest(-1, WorkRequest.END_WORK_PROCESS, {}))
+            worker.join()
+            WorkDispatcher.stop()
@@ -0,0 +1,101 @@
+import threading
+import time
+
+from test.test import Test
+
+
+class WorkDispatcherTest(Test):
+    """
+    Answers work requests with a thread that stands in for the work process, in an order
+    different from the order of the requests, and checks that WorkDispatcher routes every result
+    to the handler of its job, that a HapiWorker receives its result in its Qt thread without
+    the delay of polling, and that a failed request reaches the HapiWorker as well.
+    """
+
+    ##
+    # The maximal time (s) from putting a result into the result queue to its delivery.
+    MAX_LATENCY = 0.05
+
+    def __init__(self):
+        Test.__init__(self)
+
+    def name(self) -> str:
+        return 'work dispatcher test'
+
+    def test(self) -> bool:
+        from PyQt5 import QtCore
+        from worker.hapi_worker import HapiWorker
+        from worker.work_dispatcher import WorkDispatcher
+        from worker.work_request import WorkRequest
+        from worker.work_result import WorkResult
+
+        def work_process(batch: int):
+            # Answers the requests of each batch in reverse order
+            while True:
+                requests = [WorkRequest.WORKQ.get() for _ in range(batch)]
+                for request in reversed(requests):
+                    if request.work_type == WorkRequest.END_WORK_PROCESS:
+                        return
+                    if request.work_args['x'] is None:
+                        WorkRequest.RESULTQ.put(WorkResult(request.job_id, None, error='no x'))
+                    else:
+                        WorkRequest.RESULTQ.put(WorkResult(request.job_id,
+                                                           request.work_args['x']))
+
+        worker = threading.Thread(target=work_process, args=(10,), daemon=True)
+        worker.start()
+        results = {}
+        done = threading.Event()
+
+        def handler(work_result):
+            results[work_result.job_id] = work_result.result
+            if len(results) == 100:
+                done.set()
+
+        expected = {}
+        for x in range(100):
+            job_id = WorkDispatcher.new_job_id()
+            expected[job_id] = x
+            WorkDispatcher.submit(WorkRequest(job_id, WorkRequest.TABLE_NAMES, {'x': x}), handler)
+        if not done.wait(10.0) or results != expected or WorkDispatcher.pending() != 0:
+            return False
+        for _ in range(10):
+            WorkRequest.WORKQ.put(WorkRequest(-1, WorkRequest.END_WORK_PROCESS, {}))
+        worker.join()
+
+        # A HapiWorker gets its result through a signal queued to the Qt event loop
+        worker = threading.Thread(target=work_process, args=(1,), daemon=True)
+        worker.start()
+        app = QtCore.QCoreApplication([])
+        received = []
+
+        def callback(work_result):
+            received.append((time.time() - sent, work_result.result))
+            app.quit()
+
+        sent = time.time()
+        hapi_worker = HapiWorker(WorkRequest.TABLE_NAMES, {'x': 'names'}, callback)
+        hapi_worker.start()
+        QtCore.QTimer.singleShot(10000, app.quit)
+        app.exec_()
+
+        # A failed request is delivered to `failed` rather than to the callback
+        failed = []
+
+        def on_failed(work_result):
+            failed.append(work_result.error)
+            app.quit()
+
+        failing_worker = HapiWorker(WorkRequest.TABLE_NAMES, {'x': None}, callback,
+                                    failed=on_failed)
+        failing_worker.start()
+        QtCore.QTimer.singleShot(10000, app.quit)
+        app.exec_()
+        WorkRequest.WORKQ.put(WorkRequest(-1, WorkRequest.END_WORK_PROCESS, {}))
+        worker.join()
+        WorkDispatcher.stop()
+
+        if len(received) != 1 or received[0][1] != 'names' or failed != ['no x']:
+            return False
+        print('round trip: {:.1f} ms'.format(received[0][0] * 1000))
+        return received[0][0] < WorkDispatcherTest.MAX_LATENCY
@@ -0,0 +1,71 @@
+import tempfile
+import threading
+
+import numpy as np
+
+from test.synthetic_table import create_synthetic_table
+from test.test import Test
+
+
+class WorkProgressTest(Test):
+    """
+    Calculates an absorption coefficient in a work process with partial results enabled. Checks
+    that progress reports arrive before the result with an increasing number of processed lines,
+    and that the partial absorption coefficient is on the final grid and never exceeds the final
+    one (it contains a subset of the lines).
+    """
+
+    def __init__(self):
+        Test.__init__(self)
+
+    def name(self) -> str:
+        return 'work progress test'
+
+    def test(self) -> bool:
+        import hapi
+        from metadata.config import Config
+        from worker.work_dispatcher import WorkDispatcher
+        from worker.work_request import WorkRequest
+        from worker.work_scheduler import WorkScheduler
+
+        Config.data_folder = tempfile.mkdtemp()
+        hapi.VARIABLES['BACKEND_DATABASE_NAME'] = Config.data_folder
+        hapi.cache2storage(create_synthetic_table('a', nlines=6000))
+
+        reports = []
+        results = []
+        done = threading.Event()
+
+        def handler(work_result):
+            results.append(work_result)
+            done.set()
+
+        WorkScheduler.start(1, fast_lane=False)
+        try:
+            job_id = WorkDispatcher.new_job_id()
+            WorkDispatcher.submit(
+                WorkRequest(job_id, WorkRequest.ABSORPTION_COEFFICIENT, dict(
+                    graph_fn='HT', SourceTables=['a'], Components=[(2, 1)],
+                    Environment={'T': 296.0, 'p': 1.0}, Diluent={'air': 1.0},
+                    WavenumberRange=(2000.0, 2100.0), WavenumberStep=0.005,
+                    WavenumberWing=10.0, WavenumberWingHW=50.0, title='', titlex='', titley='',
+                    name=''), partial=True),
+                handler, reports.append)
+            if not done.wait(300.0) or results[0].error is not None:
+                return False
+        finally:
+            WorkScheduler.stop()
+            WorkDispatcher.stop()
+
+        print('{} progress reports, last: {}'.format(len(reports), reports[-1] if reports else ''))
+        lines = [report.done for report in reports]
+        if not reports or lines != sorted(lines) or \
+                any(report.stage != 'abscoef' or report.total != 6000 for report in reports):
+            return False
+        partials = [report.partial for report in reports if report.partial is not None]
+        if not partials:
+            return False
+        x, y = results[0].result['x'], results[0].result['y']
+        partial = partials[-1]
+        return np.array_equal(partial['x'], x) and \
+            np.all(partial['y'] <= y * (1.0 + 1e-12)) and partial['y'].sum() < y.sum()
@@ -0,0 +1,78 @@
+import tempfile
+import threading
+
+from test.synthetic_table import create_synthetic_table
+from test.test import Test
+
+
+class WorkSchedulerTest(Test):
+    """
+    Starts a pool of two work processes and a fast lane on a data folder with synthetic tables.
+    Checks that two calculations run in parallel, that a metadata request is answered while they
+    are running, and that a table saved by one process becomes visible to the fast lane.
+    """
+
+    def __init__(self):
+        Test.__init__(self)
+
+    def name(self) -> str:
+        return 'work scheduler test'
+
+    def test(self) -> bool:
+        import hapi
+        from metadata.config import Config
+        from worker.work_dispatcher import WorkDispatcher
+        from worker.work_request import WorkRequest
+        from worker.work_scheduler import WorkScheduler
+
+        Config.data_folder = tempfile.mkdtemp()
+        hapi.VARIABLES['BACKEND_DATABASE_NAME'] = Config.data_folder
+        for i, name in enumerate(('a', 'b')):
+            hapi.cache2storage(create_synthetic_table(name, nlines=2000, seed=i))
+
+        results = []
+        done = threading.Condition()
+
+        def submit(work_type, **args) -> int:
+            job_id = WorkDispatcher.new_job_id()
+
+            def handler(work_result):
+                with done:
+                    results.append((job_id, work_result.result))
+                    done.notify_all()
+
+            WorkDispatcher.submit(WorkRequest(job_id, work_type, args), handler)
+            return job_id
+
+        def wait(count: int) -> bool:
+            with done:
+                return done.wait_for(lambda: len(results) >= count, 300.0)
+
+        WorkScheduler.start(2, fast_lane=True)
+        try:
+            abscoef = dict(graph_fn='HT', Components=[(2, 1)], Environment={'T': 296.0, 'p': 1.0},
+                           Diluent={'air': 1.0}, WavenumberRange=(2000.0, 2100.0),
+                           WavenumberStep=0.005, WavenumberWing=10.0, WavenumberWingHW=50.0,
+                           title='', titlex='', titley='', name='')
+            slow = [submit(WorkRequest.ABSORPTION_COEFFICIENT, SourceTables=[table], **abscoef)
+                    for table in ('a', 'b')]
+            print('load of the pool: {}'.format(WorkScheduler.load()))
+            if WorkScheduler.load() != [1, 1]:
+                return False
+            names = submit(WorkRequest.TABLE_NAMES)
+            if not wait(3) or results[0][0] != names or \
+                    sorted(results[0][1]) != ['a', 'b'] or \
+                    {job_id for job_id, _ in results[1:]} != set(slow):
+                return False
+
+            table = hapi.LOCAL_TABLE_CACHE[create_synthetic_table('c', nlines=300)]
+            submit(WorkRequest.SAVE_TABLE, table=table, name='c')
+            if not wait(4) or results[3][1] is not True:
+                return False
+            submit(WorkRequest.TABLE_META_DATA, table_name='c')
+            if not wait(5) or results[4][1] is None:
+                return False
+            return results[4][1]['length'] == 300
+        finally:
+            WorkScheduler.stop()
+            WorkDispatcher.stop()
@@ -0,0 +1,134 @@
+import os
+import socket
+import tempfile
+
+import numpy as np
+
+from test.synthetic_table import create_synthetic_table
+from test.test import Test
+
+
+class WorkServerTest(Test):
+    """
+    Serves a pool of two work processes with a WorkServer on localhost and pipelines requests
+    from a WorkClient: metadata, two absorption coefficients whose arrays come back as binary
+    frames, an unknown method, a method that writes tables and a spectrum written to a file
+    (which are not served by default), and a long calculation that is cancelled. Sends an
+    invalid id and a frame too large to read, which are answered with errors, and gathers
+    requests from an AsyncWorkClient. Also checks that tables are only saved under names inside
+    the data folder.
+    """
+
+    def __init__(self):
+        Test.__init__(self)
+
+    def name(self) -> str:
+        return 'work server test'
+
+    def test(self) -> bool:
+        import asyncio
+
+        import hapi
+        from metadata.config import Config
+        from rpc.async_work_client import AsyncWorkClient
+        from rpc.rpc_protocol import RpcError, RpcProtocol
+        from rpc.work_client import WorkClient
+        from rpc.work_server import WorkServer
+        from worker.work_functions import WorkFunctions
+        from worker.work_dispatcher import WorkDispatcher
+        from worker.work_scheduler import WorkScheduler
+
+        Config.data_folder = tempfile.mkdtemp()
+        hapi.VARIABLES['BACKEND_DATABASE_NAME'] = Config.data_folder
+        for i, name in enumerate(('a', 'b')):
+            hapi.cache2storage(create_synthetic_table(name, nlines=2000, seed=i))
+
+        WorkScheduler.start(2, fast_lane=True)
+        server = WorkServer()
+        server.start()
+        try:
+            with WorkClient(*server.address, timeout=10.0) as client:
+                abscoef = dict(graph_fn='Voigt', Components=[(2, 1)],
+                               Environment={'T': 296.0, 'p': 1.0}, Diluent={'air': 1.0},
+                               WavenumberRange=[2000.0, 2100.0], WavenumberStep=0.01,
+                               WavenumberWing=10.0, WavenumberWingHW=50.0, title='', titlex='',
+                               titley='', name='')
+                spectra = [client.submit('ABSORPTION_COEFFICIENT', SourceTables=[table],
+                                         **abscoef) for table in ('a', 'b')]
+                names = client.submit('TABLE_NAMES')
+                meta = client.submit('TABLE_META_DATA', table_name='b')
+                unknown = client.submit('END_WORK_PROCESS')
+                write = client.submit('SAVE_TABLE', table_name='a', name='../a')
+                outside = os.path.join(tempfile.mkdtemp(), 'outside.txt')
+                written = client.submit('TRANSMITTANCE_SPECTRUM', SourceTables=['a'],
+                                        path_length=10.0, File=outside, **abscoef)
+
+                if sorted(names.result(60.0)) != ['a', 'b'] or \
+                        meta.result(60.0)['length'] != 2000:
+                    return False
+                for refused, code in ((unknown, RpcError.METHOD_NOT_FOUND),
+                                      (write, RpcError.METHOD_NOT_FOUND),
+                                      (written, RpcError.INVALID_PARAMS)):
+                    try:
+                        refused.result(60.0)
+                        return False
+                    except RpcError as e:
+                        if e.code != code:
+                            return False
+                if os.path.exists(outside):
+                    return False
+
+                (xa, ya), (xb, yb) = [(result['x'], result['y']) for result in
+                                      (future.result(300.0) for future in spectra)]
+                print('absorption coefficients: {} and {} points'.format(len(ya), len(yb)))
+                if not isinstance(ya, np.ndarray) or ya.dtype != np.float64 or \
+                        not np.array_equal(xa, xb) or len(xa) != len(ya) or \
+                        np.array_equal(ya, yb) or ya.max() <= 0.0:
+                    return False
+
+                slow = client.submit('ABSORPTION_COEFFICIENT', 'batch', SourceTables=['a'],
+                                     **{**abscoef, 'WavenumberStep': 0.0001,
+                                        'WavenumberWing': 50.0})
+                client.cancel(slow)
+                try:
+                    slow.result(300.0)
+                except Exception as e:
+                    print('long calculation: {}'.format(type(e).__name__))
+                if not slow.cancelled():
+                    return False
+
+            with socket.create_connection(server.address, 10.0) as connection, \
+                    connection.makefile('rb') as rfile, connection.makefile('wb') as wfile:
+                # An id that is neither a string nor an integer, then a valid request
+                RpcProtocol.write(wfile, RpcProtocol.request([1], 'TABLE_NAMES', {}))
+                RpcProtocol.write(wfile, RpcProtocol.request(2, 'TABLE_NAMES', {}))
+                invalid = RpcProtocol.outcome(RpcProtocol.read(rfile))
+                valid = RpcProtocol.outcome(RpcProtocol.read(rfile))
+                if invalid[0] is not None or invalid[1].code != RpcError.INVALID_REQUEST or \
+                        valid[0] != 2 or sorted(valid[1]) != ['a', 'b']:
+                    return False
+                # A frame of 2^62 bytes
+                text = b'{}'
+                wfile.write(RpcProtocol.HEADER.pack(len(text), 1) + text +
+                            RpcProtocol.FRAME.pack(1 << 62))
+                wfile.flush()
+                _, error = RpcProtocol.outcome(RpcProtocol.read(rfile))
+                if not isinstance(error, RpcError) or error.code != RpcError.PARSE_ERROR:
+                    return False
+
+            async def gather_names() -> list:
+                async with AsyncWorkClient(*server.address, concurrency=2,
+                                           timeout=10.0) as async_client:
+                    return await asyncio.gather(*(async_client.run('TABLE_NAMES')
+                                                  for _ in range(5)))
+
+            gathered = asyncio.run(asyncio.wait_for(gather_names(), 60.0))
+            if any(sorted(names) != ['a', 'b'] for names in gathered):
+                return False
+        finally:
+            server.shutdown()
+            server.server_close()
+            WorkScheduler.stop()
+            WorkDispatcher.stop()
+        return not WorkFunctions.save_table(table_name='a', name='../a') and \
+            not WorkFunctions.valid_table_name('.a') and WorkFunctions.valid_table_name('a_b')
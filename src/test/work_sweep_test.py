@@ -0,0 +1,99 @@
+import tempfile
+import threading
+
+import numpy as np
+
+from test.synthetic_table import create_synthetic_table
+from test.test import Test
+
+
+class WorkSweepTest(Test):
+    """
+    Sweeps an absorption coefficient over temperatures and pressures, and a transmittance spectrum
+    over path lengths, with a pool of two work processes. Checks that the sweep is split across
+    the processes and stacked in the order of its points, and that every row equals the result
+    of the plain request at that point.
+    """
+
+    def __init__(self):
+        Test.__init__(self)
+
+    def name(self) -> str:
+        return 'work sweep test'
+
+    def test(self) -> bool:
+        import hapi
+        from metadata.config import Config
+        from worker.work_dispatcher import WorkDispatcher
+        from worker.work_request import WorkRequest
+        from worker.work_scheduler import WorkScheduler
+
+        Config.data_folder = tempfile.mkdtemp()
+        hapi.VARIABLES['BACKEND_DATABASE_NAME'] = Config.data_folder
+        hapi.cache2storage(create_synthetic_table('a', nlines=2000))
+
+        results = {}
+        reports = []
+        lock = threading.Condition()
+
+        def submit(work_type, args) -> int:
+            job_id = WorkDispatcher.new_job_id()
+
+            def handler(work_result):
+                with lock:
+                    results[job_id] = work_result
+                    lock.notify_all()
+
+            WorkDispatcher.submit(WorkRequest(job_id, work_type, args), handler, reports.append)
+            return job_id
+
+        def wait(job_ids) -> bool:
+            with lock:
+                return lock.wait_for(lambda: all(job_id in results for job_id in job_ids), 300.0)
+
+        abscoef = dict(graph_fn='Voigt', SourceTables=['a'], Components=[(2, 1)],
+                       Environment={'T': 296.0, 'p': 1.0}, Diluent={'air': 1.0},
+                       WavenumberRange=(2000.0, 2100.0), WavenumberStep=0.01,
+                       WavenumberWing=10.0, WavenumberWingHW=50.0, title='', titlex='',
+                       titley='', name='')
+        transmittance = dict(abscoef, HITRAN_units=False, path_length=100.0,
+                             instrumental_fn='', Resolution=0.01, AF_wing=100.0)
+
+        WorkScheduler.start(2, fast_lane=False)
+        try:
+            sweeps = [submit(WorkRequest.SWEEP, {
+                          'work_type': WorkRequest.ABSORPTION_COEFFICIENT, 'args': abscoef,
+                          'sweep': {'T': [250.0, 296.0, 350.0], 'p': [0.5, 1.0]}}),
+                      submit(WorkRequest.SWEEP, {
+                          'work_type': WorkRequest.TRANSMITTANCE_SPECTRUM,
+                          'args': transmittance, 'sweep': {'path_length': [10.0, 100.0]}})]
+            if not wait(sweeps):
+                return False
+            plain = [submit(WorkRequest.ABSORPTION_COEFFICIENT, abscoef),
+                     submit(WorkRequest.TRANSMITTANCE_SPECTRUM, transmittance)]
+            if not wait(plain) or WorkDispatcher.pending() != 0:
+                return False
+        finally:
+            WorkScheduler.stop()
+            WorkDispatcher.stop()
+
+        if any(results[job_id].error is not None for job_id in sweeps + plain):
+            return False
+        coefficients, spectra = [results[job_id].result for job_id in sweeps]
+        print('sweep labels: {}'.format(coefficients['labels']))
+        if coefficients['y'].shape != (6, len(coefficients['x'])) or \
+                [point['p'] for point in coefficients['points']] != [0.5, 1.0] * 3 or \
+                coefficients['labels'][3] != 'T = 296 K, p = 1 atm':
+            return False
+        # Rows of different temperatures differ
+        if np.allclose(coefficients['y'][1], coefficients['y'][3]):
+            return False
+        # Both sweeps report the progress of their parts under their own job_id
+        if not any(report.job_id == sweeps[0] and report.info.get('Parts') == 2
+                   for report in reports):
+            return False
+        coefficient, spectrum = [results[job_id].result for job_id in plain]
+        return np.allclose(coefficients['y'][3], coefficient['y'], rtol=1e-10, atol=0.0) and \
+            spectra['y'].shape == (2, len(spectrum['y'])) and \
+            np.allclose(spectra['y'][1], spectrum['y'], rtol=1e-10, atol=0.0) and \
+            np.all(spectra['y'][0] >= spectra['y'][1])
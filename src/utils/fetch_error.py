@@ -11,6 +11,7 @@ class FetchErrorKind(Enum):
     FailedToRetrieveData = 7
     FailedToOpenThread = 8
     EmptyName = 9
+    BadName = 10
 
 
 # A class that contains a FetchErrorKind along with a description for the error
@@ -207,6 +207,8 @@ class FetchWidget(QWidget):
                     err_log(' Error: You must select at least one isotopologue.')
                 elif err.error == FetchErrorKind.EmptyName:
                     pass
+                elif err.error == FetchErrorKind.BadName:
+                    err_log(f'Error: {err.description}')
 
         except Exception as e:
             debug(e)
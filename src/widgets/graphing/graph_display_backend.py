@@ -5,3 +5,15 @@ class GraphDisplayBackend:
 
     def add_graph(self, x, y, title, titlex, titley, name, args):
         pass
+
+    def show_partial(self, key, x, y, name):
+        """
+        Shows (or replaces) the partial result `key` of a graph that is still being calculated.
+        """
+        pass
+
+    def remove_partial(self, key):
+        """
+        Removes the partial result `key`, if it is shown.
+        """
+        pass
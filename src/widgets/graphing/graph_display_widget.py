@@ -1,6 +1,7 @@
 import json
 from typing import *
 
+import numpy as np
 from PyQt5 import uic
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
@@ -12,6 +13,7 @@ from utils.log import *
 from widgets.graphing.mpl_widget import MplWidget
 from widgets.graphing.vispy_widget import VispyWidget
 from worker.hapi_worker import HapiWorker, WorkResult
+from worker.work_progress import WorkProgress
 from worker.work_request import WorkRequest
 
 from widgets.graphing.graph_type import GraphType
@@ -64,15 +66,12 @@ class GraphDisplayWidget(QMainWindow):
 
         self.graph_ty = graph_ty
         self.graph_display_id = GraphDisplayWidget.graph_display_id()
-        self.workers = {
-            0: HapiWorker(GraphDisplayWidget.graph_ty_to_work_ty[graph_ty], work_object,
-                          lambda x: (self.plot(x), self.workers.pop(0)))
-            }
+        self.workers = {}
+        self.cur_work_id = 0
 
         GraphDisplayWidget.graph_windows[self.graph_display_id] = self
 
-        self.workers[0].start()
-        self.cur_work_id = 1
+        self.add_worker(graph_ty, work_object)
 
         from widgets.graphing.graphing_widget import GraphingWidget
 
@@ -102,12 +101,49 @@ class GraphDisplayWidget(QMainWindow):
     def add_worker(self, graph_ty, work_object):
         id = self.cur_work_id
         self.cur_work_id += 1
-        worker = HapiWorker(GraphDisplayWidget.graph_ty_to_work_ty[graph_ty], work_object,
-                            lambda x: (self.plot(x), self.workers.pop(id)))
+        work_ty = GraphDisplayWidget.graph_ty_to_work_ty[graph_ty]
+        # A sweep is plotted as one curve per point of the sweep
+        sweep = work_object.pop('sweep', None)
+        if sweep and work_ty in WorkRequest.SWEEP_WORK_TYPES and graph_ty != GraphType.XSC:
+            work_ty, work_object = WorkRequest.SWEEP, \
+                                   {'work_type': work_ty, 'args': work_object, 'sweep': sweep}
+        # Only the absorption coefficient is plotted while it is calculated: the spectra are
+        # derived from the complete absorption coefficient
+        worker = HapiWorker(work_ty, work_object,
+                            lambda x: self.__on_worker_done(id, x),
+                            progress=lambda x: self.__on_worker_progress(id, work_object, x),
+                            partial=work_ty == WorkRequest.ABSORPTION_COEFFICIENT,
+                            failed=lambda x: self.__on_worker_failed(id, x))
 
         self.workers[id] = worker
         worker.start()
 
+    def __on_worker_progress(self, id: int, work_object: Dict, work_progress: WorkProgress):
+        if id not in self.workers:
+            return
+        self.statusBar().showMessage(str(work_progress))
+        if work_progress.partial is not None:
+            self.backend.show_partial(id, work_progress.partial['x'],
+                                      work_progress.partial['y'],
+                                      f"{work_object['name']} (partial)")
+
+    def __on_worker_done(self, id: int, work_result: WorkResult):
+        self.workers.pop(id, None)
+        self.backend.remove_partial(id)
+        if not self.workers:
+            self.statusBar().clearMessage()
+        self.plot(work_result)
+
+    def __on_worker_failed(self, id: int, work_result: WorkResult):
+        # Nothing is plotted, but the partial curve and the progress have to go
+        self.workers.pop(id, None)
+        self.backend.remove_partial(id)
+        if work_result.error is not None:
+            self.statusBar().showMessage(f'Failed to graph: {work_result.error}')
+        elif not self.workers:
+            self.statusBar().clearMessage()
+        self.done_signal.emit(0)
+
     def closeEvent(self, event):
         self.close()
         event.accept()
@@ -118,8 +154,15 @@ class GraphDisplayWidget(QMainWindow):
     def close(self):
         """
         Overrides Window.close implementation, removes self from GraphDisplayWindow.graph_windows
+        and cancels the calculations of graphs that have not been plotted yet.
         """
         from widgets.graphing.graphing_widget import GraphingWidget
+        if self.workers:
+            for worker in self.workers.values():
+                worker.cancel()
+            self.workers.clear()
+            # Nothing will be plotted, so re-enable graphing now
+            self.done_signal.emit(0)
         GraphDisplayWidget.graph_windows.pop(self.graph_display_id, None)
         GraphingWidget.GRAPHING_WIDGET_INSTANCE.update_existing_window_items()
         QMainWindow.close(self)
@@ -134,7 +177,8 @@ class GraphDisplayWidget(QMainWindow):
         indicates an error), or it
                             will be a dictionary that contains the x and y coordinates and some
                             information about graph
-                            labels
+                            labels. The result of a sweep has a row of y coordinates for every
+                            point of the sweep, and each of them is plotted as a curve.
         """
         self.done_signal.emit(0)
 
@@ -144,19 +188,26 @@ class GraphDisplayWidget(QMainWindow):
 
         try:
             result = work_result.result
-            (x, y) = result['x'], result['y']
-            sanitized_name = str(result['name']) \
-                .replace(',', '') \
-                .replace('\'', '') \
-                .replace('"', '')
-            self.plots[sanitized_name] = (x, y)
-            if len(x) > len(y):
-                x = x[:len(y)]
-            elif len(x) < len(y):
-                y = y[:len(x)]
-            self.n_plots += 1
-            self.backend.add_graph(x, y, result['title'], result['titlex'], result['titley'],
-                                   f"{result['name']} - {self.n_plots}", result['args'])
+            if np.ndim(result['y']) == 2:
+                curves = [(f"{result['name']} ({label})", y)
+                          for label, y in zip(result['labels'], result['y'])]
+            else:
+                curves = [(result['name'], result['y'])]
+            for name, y in curves:
+                x = result['x']
+                sanitized_name = str(name) \
+                    .replace(',', '') \
+                    .replace('\'', '') \
+                    .replace('"', '')
+                self.plots[sanitized_name] = (x, y)
+                if len(x) > len(y):
+                    x = x[:len(y)]
+                elif len(x) < len(y):
+                    y = y[:len(x)]
+                self.n_plots += 1
+                self.backend.add_graph(x, y, result['title'], result['titlex'],
+                                       result['titley'], f"{name} - {self.n_plots}",
+                                       result['args'])
         except Exception as e:
             err_log(e)
 
@@ -1,5 +1,6 @@
 import builtins
 from enum import Enum
+from typing import Any, Dict, List, Optional
 
 from PyQt5 import QtCore, QtWidgets, uic
 from PyQt5.QtWidgets import QComboBox, QLayout, QLabel, QDoubleSpinBox, QLineEdit, QPushButton, \
@@ -25,6 +26,11 @@ class GraphingWidget(QtWidgets.QWidget):
 
     GRAPHING_WIDGET_INSTANCE = None
 
+    ##
+    # The names of the parameters in the sweep field, and the parameters they sweep. 'self'
+    # sweeps the fraction of self broadening, the rest being broadened by air.
+    SWEEP_NAMES = {'T': 'T', 'p': 'p', 'l': 'path_length', 'self': 'Diluent'}
+
     str_to_graph_ty = {
         ABSORPTION_COEFFICIENT_STRING:  GraphType.ABSORPTION_COEFFICIENT,
         ABSORPTION_SPECTRUM_STRING:     GraphType.ABSORPTION_SPECTRUM,
@@ -83,6 +89,7 @@ class GraphingWidget(QtWidgets.QWidget):
         self.output_filename: QLineEdit = None
         self.pressure: QDoubleSpinBox = None
         self.temperature: QDoubleSpinBox = None
+        self.sweep: QLineEdit = None
 
         # self.xsc = None
 
@@ -121,6 +128,10 @@ class GraphingWidget(QtWidgets.QWidget):
         self.data_name.setToolTip("Select the name of the data you wish to graph.")
         self.temperature.setToolTip("Select the temperature to graph the data at.")
         self.pressure.setToolTip("Select the pressure to graph the data at.")
+        self.sweep.setToolTip(
+            "Optionally graph a family of curves, one for every combination of the values, e.g. "
+            "'T=250,296; p=0.5,1'. Sweeps T (K), p (atm), l (path length, cm) and self (the "
+            "fraction of self broadening).")
         self.intensity_threshold.setToolTip("Absolute value of minimum intensity.")
         self.numin.setToolTip("Select min wavelength for graph.")
         self.numax.setToolTip("Select max wavelength for graph.")
@@ -137,6 +148,7 @@ class GraphingWidget(QtWidgets.QWidget):
         data_name = self.get_data_name()
         backend = self.backend.currentText()
 
+        sweep = None
         if data_name.endswith(".xsc"):
             Components = []
             SourceTables = [data_name]
@@ -157,6 +169,7 @@ class GraphingWidget(QtWidgets.QWidget):
             WavenumberStep = self.get_wn_step()
             WavenumberWing = self.get_wn_wing()
             WavenumberWingHW = self.get_wn_wing_hw()
+            sweep = self.get_sweep()
 
         name = self.plot_name.text()
         graph_fn = self.get_line_profile()
@@ -164,10 +177,14 @@ class GraphingWidget(QtWidgets.QWidget):
             Environment=Environment, Diluent=Diluent, HITRAN_units=False,
             WavenumberRange=WavenumberRange, WavenumberStep=WavenumberStep,
             WavenumberWing=WavenumberWing, WavenumberWingHW=WavenumberWingHW, backend=backend,
-            name=name)
+            name=name, sweep=sweep)
 
     def graph(self):
-        standard_params = self.get_standard_parameters()
+        try:
+            standard_params = self.get_standard_parameters()
+        except ValueError as e:
+            self.data_name_error.setText('<span style="color:#aa0000;">' + str(e) + '</span>')
+            return
         self.graph_button.setDisabled(True)
         graph_type = self.graph_type.currentText()
         if graph_type == GraphingWidget.ABSORPTION_COEFFICIENT_STRING:
@@ -449,6 +466,37 @@ class GraphingWidget(QtWidgets.QWidget):
         diluent = self.broadener_input.get_diluent()
         return diluent
 
+    def get_sweep(self) -> Optional[Dict[str, List[Any]]]:
+        """
+        Parses the sweep field, e.g. 'T=250,296; p=0.5,1' (see SWEEP_NAMES).
+        :returns: the swept values (see WorkFunctions.sweep_points), or None if nothing is swept.
+        :raises ValueError: if the sweep field can not be parsed, or sweeps the path length of a
+        graph that does not depend on it.
+        """
+        sweep = {}
+        for term in self.sweep.text().split(';'):
+            if not term.strip():
+                continue
+            name, _, values = term.partition('=')
+            name = name.strip()
+            if name not in GraphingWidget.SWEEP_NAMES:
+                raise ValueError(f"Unknown sweep parameter '{name}'")
+            # Only the spectra depend on the path length
+            if name == 'l' and self.get_graph_type() not in {
+                    GraphingWidget.ABSORPTION_SPECTRUM_STRING,
+                    GraphingWidget.TRANSMITTANCE_SPECTRUM_STRING,
+                    GraphingWidget.RADIANCE_SPECTRUM_STRING}:
+                raise ValueError(f"The {self.get_graph_type()} does not depend on the path "
+                                 f"length 'l'")
+            try:
+                values = [float(value) for value in values.split(',')]
+            except ValueError:
+                raise ValueError(f"Invalid values of the sweep parameter '{name}'")
+            if name == 'self':
+                values = [{'air': 1.0 - value, 'self': value} for value in values]
+            sweep[GraphingWidget.SWEEP_NAMES[name]] = values
+        return sweep or None
+
     def get_data_name(self):
         """
         :returns: name of the selected table
@@ -40,6 +40,7 @@ class MplWidget(QWidget):
         GraphDisplayBackend.__init__(self)
 
         self.canvas = MplCanvas()
+        self.partials = {}
         self.parent().addToolBar(QtCore.Qt.BottomToolBarArea,
                         NavigationToolbar2QT(self.canvas, self))
         self.layout = QHBoxLayout()
@@ -57,6 +58,23 @@ class MplWidget(QWidget):
     def hide_legend(self):
         self.canvas.hide_legend()
 
+    def show_partial(self, key, x, y, name):
+        if key in self.partials:
+            self.partials[key].set_data(x, y)
+        else:
+            self.partials[key] = self.canvas.ax.plot(x, y, label=name, linestyle='--')[0]
+        self.canvas.ax.relim()
+        self.canvas.ax.autoscale_view()
+        self.canvas.draw()
+
+    def remove_partial(self, key):
+        line = self.partials.pop(key, None)
+        if line is None:
+            return
+        line.remove()
+        self.canvas.ax.relim()
+        self.canvas.draw()
+
     def update_canvas(self):
         self.canvas.draw()
         self.canvas.flush_events()
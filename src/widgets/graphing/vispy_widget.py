@@ -91,3 +91,8 @@ class VispyWidget(QWidget):
         """
         pass
 
+    def show_partial(self, key, x, y, name):
+        pass
+
+    def remove_partial(self, key):
+        pass
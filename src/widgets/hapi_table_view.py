@@ -7,6 +7,7 @@ from PyQt5.QtWidgets import *
 from data_structures.lines import *
 from utils.hapiest_util import *
 from metadata.hapi_metadata import HapiMetaData
+from worker.hapi_worker import HapiWorker
 from worker.work_request import *
 from worker.work_result import *
 
@@ -26,10 +27,10 @@ class HapiLineEdit(QLineEdit):
         Alters a field in the corresponding hapi table. Each cell in the table is
         assigned an on edit function that is generataed using this function.
         """
-        t = type(self.table.data[self.table.lines.param_order[self.col]][0])
         value = self.text()
         line = self.table.lines.get_line(self.row)
         old_val = line.get_nth_field(self.col)
+        t = type(old_val)
         res = False
 
         if type(old_val) == float:
@@ -95,7 +96,12 @@ class HapiTableView(QTableView):
         self.table_name = table_name
         self.hmd = HapiMetaData(table_name)
 
-        self.table = None
+        self.lines: Lines = None
+
+        ##
+        # The pages that have been requested but not received yet, with the callbacks to call
+        # once they are.
+        self.pending_pages: Dict[int, List[Callable]] = {}
 
         self.view_widget = parent
 
@@ -115,9 +121,10 @@ class HapiTableView(QTableView):
 
         if self.table_name != None:
             self.workers = []
-            args = HapiWorker.echo(table_name=table_name)
+            args = HapiWorker.echo(table_name=table_name, start=0, count=self.page_len)
 
-            self.start_worker = HapiWorker(WorkRequest.GET_TABLE, args, self.display_first_page)
+            self.start_worker = HapiWorker(WorkRequest.GET_TABLE_PAGE, args,
+                                           self.display_first_page)
             self.start_worker.start()
         else:
             self.workers = []
@@ -186,9 +193,10 @@ class HapiTableView(QTableView):
         Displays first page of info for edit functionity, sets 'on edit' functions.
         """
         self.view_widget.setWindowTitle("Viewing - {}".format(self.view_widget.get_table_name()))
-        self.table = work_result.result
-        self.data = self.table['data']
-        lines: Lines = Lines(self.table)
+        if work_result.result is None:
+            err_log(f"Failed to load table '{self.table_name}'...")
+            return
+        lines: Lines = Lines(work_result.result)
         self.lines = lines
         nparams: int = len(lines.param_order)
         self.nparams = nparams
@@ -245,21 +253,57 @@ class HapiTableView(QTableView):
         # self.resizeColumnsToContents()
         self.display_page(1)
 
+    def request_page(self, page_number: int, callback: Callable = None):
+        """
+        Requests page `page_number` from the work process and adds it to the loaded pages.
+        :param callback: Called once the page has been added.
+        """
+        if page_number in self.pending_pages:
+            if callback is not None:
+                self.pending_pages[page_number].append(callback)
+            return
+        self.pending_pages[page_number] = [] if callback is None else [callback]
+
+        def on_page(work_result: WorkResult):
+            callbacks = self.pending_pages.pop(page_number, [])
+            self.workers = [worker for worker in self.workers
+                            if worker.job_id != work_result.job_id]
+            if work_result.result is None:
+                err_log(f"Failed to load page {page_number} of '{self.table_name}'...")
+                return
+            self.lines.add_page(work_result.result)
+            for callback in callbacks:
+                callback()
+
+        args = HapiWorker.echo(table_name=self.table_name,
+                               start=self.lines.page_start(page_number), count=self.page_len)
+        worker = HapiWorker(WorkRequest.GET_TABLE_PAGE, args, on_page)
+        self.workers.append(worker)
+        worker.start()
+
     def display_page(self, page_number: int):
         if page_number < 1:
             page_number = 1
         elif page_number > self.lines.last_page:
             page_number = self.lines.last_page
+        if not self.lines.has_page(page_number):
+            # Displayed as soon as it arrives
+            self.request_page(page_number, lambda: self.display_page(page_number))
+            return
         self.current_page = page_number
 
         self.lines.set_page(self.current_page)
+        # Prefetch the page that is most likely to be displayed next
+        if page_number < self.lines.last_page and not self.lines.has_page(page_number + 1):
+            self.request_page(page_number + 1)
 
         self.next_button.setEnabled(True)
         self.back_button.setEnabled(True)
-        page_min = (self.current_page - 1) * self.lines.get_len()
+        page_min = self.lines.page_start(self.current_page)
         self.page_min = page_min
+        page_len = self.lines.get_len()
         self.table_model.setVerticalHeaderLabels(
-            map(str, range(page_min + 1, 1 + page_min + self.current_page_len)))
+            map(str, range(page_min + 1, 1 + page_min + page_len)))
         # for i in range(0, self.current_page_len):
         #    item = self.verticalHeaderItem(i)
         #    item.setText(str(page_min + i))
@@ -267,6 +311,11 @@ class HapiTableView(QTableView):
         # self.table_model.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         nparams = self.lines.param_order
         for row in range(0, self.current_page_len):
+            if row >= page_len:
+                # The last page may be shorter than the others
+                for column in range(0, len(nparams)):
+                    self.indexWidget(self.table_model.createIndex(row, column)).setText('')
+                continue
             line = self.lines.get_line(row)
             for column in range(0, len(nparams)):
                 x = line.get_nth_field(column)
@@ -328,7 +377,10 @@ class HapiTableView(QTableView):
         # Name for the new table.
         output_name = self.view_widget.get_output_name()
 
-        worker = HapiWorker(WorkRequest.SAVE_TABLE, {'table': self.table, 'name': output_name},
+        # Only the edits are sent; the work process applies them to its copy of the table
+        edits = [(param, row, value) for (param, row), value in self.lines.edits.items()]
+        worker = HapiWorker(WorkRequest.SAVE_TABLE,
+                            {'table_name': self.table_name, 'name': output_name, 'edits': edits},
                             self.done_saving)
 
         self.hmd.save_as(output_name)
@@ -0,0 +1,119 @@
+import asyncio
+import weakref
+from typing import Any, Callable, Dict, Optional
+
+from worker.work_dispatcher import WorkDispatcher
+from worker.work_progress import WorkProgress
+from worker.work_request import WorkRequest
+from worker.work_result import WorkResult
+from worker.work_scheduler import WorkScheduler
+
+
+class WorkError(Exception):
+    """
+    Raised by AsyncWorker.run when the work function of a request raised an exception.
+    """
+
+    def __init__(self, job_id: int, error: str):
+        super().__init__(error)
+        self.job_id = job_id
+        self.error = error
+
+
+class AsyncWorker:
+    """
+    The asyncio counterpart of HapiWorker: submits work requests from coroutines and awaits their
+    results, without a Qt event loop. The requests go through the WorkDispatcher, so they share
+    the pool of work processes (with their loaded tables and cached results), the coalescing of
+    identical requests and the memoized metadata with the GUI, the work server and any other
+    AsyncWorker.
+
+    At most `concurrency` requests of an AsyncWorker are submitted at a time; the others wait in
+    `submit`, so any number of requests can be gathered without flooding the queue of the pool:
+
+        worker = AsyncWorker()
+        names = await worker.run(WorkRequest.TABLE_NAMES, {})
+        spectra = await asyncio.gather(*(worker.run(WorkRequest.ABSORPTION_COEFFICIENT,
+                                                    {'SourceTables': [name], ...})
+                                         for name in names))
+
+    The bound holds per event loop, so one AsyncWorker can be used by several `asyncio.run`
+    calls, one after the other or on different threads.
+    Cancelling the task that awaits a request cancels the request (see WorkDispatcher.cancel).
+    Coalesced requests share their result, so results must not be modified.
+    The pool has to be started (see WorkRequest.start_work_process) in the same process. Other
+    processes reach the pool of the GUI (if Config.serve_work is set) or of the headless server
+    with rpc.async_work_client.AsyncWorkClient.
+    """
+
+    def __init__(self, concurrency: Optional[int] = None,
+                 priority: Optional[WorkRequest.Priority] = None):
+        """
+        :param concurrency: The maximal number of requests of an event loop that are submitted at
+        a time. By default the number of processes of the pool when the first request of the
+        loop is submitted.
+        :param priority: The priority of the requests; the default depends on the work type (see
+        WorkRequest).
+        """
+        self.concurrency = concurrency
+        self.priority = priority
+        ##
+        # The semaphore that bounds the requests of each event loop. A semaphore can only be
+        # awaited on the loop it was first used on.
+        self.semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    async def submit(self, work_type: WorkRequest.WorkType, args: Dict[str, Any],
+                     progress: Optional[Callable[[WorkProgress], None]] = None,
+                     partial: bool = False) -> WorkResult:
+        """
+        Submits a work request once fewer than `concurrency` requests are in flight, and waits
+        for its result.
+        :param progress: Called on the event loop with every WorkProgress of the request.
+        :param partial: Whether the WorkProgress reports should carry partial results.
+        :return: The WorkResult of the request, which may be an error or cancelled.
+        """
+        loop = asyncio.get_running_loop()
+        if loop not in self.semaphores:
+            self.semaphores[loop] = asyncio.Semaphore(
+                self.concurrency or max(1, len(WorkScheduler.workers)))
+        async with self.semaphores[loop]:
+            future = loop.create_future()
+            job_id = WorkDispatcher.new_job_id()
+
+            def resolve(work_result: WorkResult):
+                if not future.done():
+                    future.set_result(work_result)
+
+            def deliver(callback: Callable, value: Any):
+                # Called on the dispatcher thread. The result of a cancelled request may arrive
+                # after the event loop was closed.
+                try:
+                    loop.call_soon_threadsafe(callback, value)
+                except RuntimeError:
+                    pass
+
+            WorkDispatcher.submit(
+                WorkRequest(job_id, work_type, args, self.priority, partial),
+                lambda work_result: deliver(resolve, work_result),
+                None if progress is None else
+                lambda work_progress: deliver(progress, work_progress))
+            try:
+                return await future
+            except asyncio.CancelledError:
+                WorkDispatcher.cancel(job_id)
+                raise
+
+    async def run(self, work_type: WorkRequest.WorkType, args: Dict[str, Any],
+                  progress: Optional[Callable[[WorkProgress], None]] = None,
+                  partial: bool = False) -> Any:
+        """
+        Like `submit`, but returns the result itself.
+        :raises WorkError: If the work function failed.
+        :raises asyncio.CancelledError: If the request was cancelled.
+        """
+        work_result = await self.submit(work_type, args, progress, partial)
+        if work_result.cancelled:
+            raise asyncio.CancelledError()
+        if work_result.error is not None:
+            raise WorkError(work_result.job_id, work_result.error)
+        return work_result.result
@@ -1,10 +1,8 @@
-import time
-from typing import List
-
-from PyQt5 import QtWidgets
-
 from worker.hapi_thread import HapiThread
+from worker.work_dispatcher import WorkDispatcher
+from worker.work_progress import WorkProgress
 from worker.work_request import *
+from worker.work_scheduler import WorkScheduler
 
 
 class HapiWorker(HapiThread):
@@ -21,14 +19,16 @@ class HapiWorker(HapiThread):
 
     The HapiWorker object is a way to request work from this worker process, and receive the
     result from it. Each
-    HapiWorker is assigned an id, and will spin until a work result with the same job_id is found.
+    HapiWorker is assigned an id; the WorkDispatcher emits done_signal as soon as the work result
+    with the same job_id arrives, and step_signal for every WorkProgress report that arrives before
+    it. A request that failed, or that was cancelled by anything but this HapiWorker, emits
+    failed_signal with its WorkResult instead of done_signal.
     """
-    job_id: int = 0
+    job_id: int
 
     step_signal = QtCore.pyqtSignal(object)
     done_signal = QtCore.pyqtSignal(object)
-
-    job_results: List[WorkResult] = []
+    failed_signal = QtCore.pyqtSignal(object)
 
     @staticmethod
     def echo(**kwargs) -> Dict[str, Any]:
@@ -38,27 +38,35 @@ class HapiWorker(HapiThread):
         return kwargs
 
     def __init__(self, work_type: WorkRequest.WorkType, args: Dict[str, Any],
-                 callback: Callable = None):
+                 callback: Callable = None, priority: Optional[WorkRequest.Priority] = None,
+                 progress: Callable = None, partial: bool = False, failed: Callable = None):
+        """
+        :param priority: WorkRequest.INTERACTIVE or WorkRequest.BATCH; the default depends on
+        the work type (see WorkRequest).
+        :param progress: Connected to step_signal, i.e. called with every WorkProgress.
+        :param partial: Whether the WorkProgress reports should carry partial results.
+        :param failed: Connected to failed_signal, i.e. called with the WorkResult of a request
+        that failed or was cancelled.
+        """
         super(HapiWorker, self).__init__()
         self.callback = callback
         self.work_type = work_type
         self.args: Dict[str, Any] = args
-        self.job_id = HapiWorker.job_id
-        HapiWorker.job_id += 1
-        self.started.connect(self.__run)
+        self.priority = priority
+        self.partial = partial
+        self.cancelled = False
+        self.job_id = WorkDispatcher.new_job_id()
 
-        if self.work_type == WorkRequest.END_WORK_PROCESS:
-            end_request = WorkRequest(self.job_id, self.work_type, self.args)
-            WorkRequest.WORKQ.put(end_request)
-            self.started.connect(lambda: None)
-        elif self.work_type == WorkRequest.START_HAPI:
-            WorkRequest.WORKQ.put(WorkRequest(self.job_id, self.work_type, self.args))
-            self.started.connect(lambda: None)
-        else:
-            self.step_signal.connect(
-                lambda x: QtWidgets.QApplication.processEvents(QtCore.QEventLoop.AllEvents))
+        if self.work_type in (WorkRequest.END_WORK_PROCESS, WorkRequest.START_HAPI):
+            # These go to every work process and produce no result to wait for, so they are sent
+            # right away
+            WorkScheduler.broadcast(WorkRequest(self.job_id, self.work_type, self.args))
         if callback:
             self.done_signal.connect(self.callback)
+        if progress:
+            self.step_signal.connect(progress)
+        if failed:
+            self.failed_signal.connect(failed)
 
     def safe_exit(self):
         self.quit()
@@ -66,30 +74,37 @@ class HapiWorker(HapiThread):
             pass
         return
 
-    def __run(self):
+    def run(self):
         """
-        Attempts to pull results from the result queue until if finds the matching result. The
-        matching result is the
-        one that has the same job_id as this HapiWorker object. If it polls a result that does
-        not have the same job_id,
-        it places it into a list for other HapiWorkers to check.
+        Sends the work request to the work process. Nothing waits for the result: the
+        WorkDispatcher calls __on_result as soon as it arrives, which emits done_signal.
         """
-        work_request = WorkRequest(self.job_id, self.work_type, self.args)
-        WorkRequest.WORKQ.put(work_request)
+        if self.work_type in (WorkRequest.END_WORK_PROCESS, WorkRequest.START_HAPI):
+            return
+        WorkDispatcher.submit(WorkRequest(self.job_id, self.work_type, self.args, self.priority,
+                                          self.partial),
+                              self.__on_result, self.__on_progress)
+
+    def cancel(self):
+        """
+        Cancels the work request: it is removed from the queue, or the work process abandons it
+        at the next check of a long calculation. Neither done_signal nor failed_signal is emitted
+        afterwards.
+        """
+        self.cancelled = True
+        WorkDispatcher.cancel(self.job_id)
+
+    def __on_progress(self, work_progress: WorkProgress):
+        if not self.cancelled:
+            self.step_signal.emit(work_progress)
 
-        while True:
-            time.sleep(0.25)
-            try:
-                work_result = WorkRequest.RESULTQ.get_nowait()
-                if work_result.job_id == self.job_id:
-                    self.done_signal.emit(work_result)
-                    return
-                HapiWorker.job_results.append(work_result)
-            except Exception as e:
-                self.step_signal.emit({})
-            finally:
-                for work_result in HapiWorker.job_results:
-                    if work_result.job_id == self.job_id:
-                        HapiWorker.job_results.remove(work_result)
-                        self.done_signal.emit(work_result)
-                        return
+    def __on_result(self, work_result: WorkResult):
+        # Called on the dispatcher thread; the signal is queued to the thread of the receivers
+        if self.cancelled:
+            return
+        if work_result.error is not None or work_result.cancelled:
+            if work_result.error is not None:
+                err_log(f'Work request {self.job_id} failed: {work_result.error}')
+            self.failed_signal.emit(work_result)
+            return
+        self.done_signal.emit(work_result)
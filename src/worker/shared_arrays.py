@@ -0,0 +1,131 @@
+import os
+import pickle
+import threading
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, List, Tuple
+
+from utils.log import *
+
+
+class SharedPayload:
+    """
+    A pickled object whose large buffers were moved into a shared memory block.
+    """
+
+    def __init__(self, data: bytes, block: str, buffers: List[Tuple[int, int]]):
+        """
+        :param data: The pickle of the object, without the large buffers.
+        :param block: The name of the shared memory block.
+        :param buffers: The (offset, size) of every large buffer in the block, in pickle order.
+        """
+        self.data = data
+        self.block = block
+        self.buffers = buffers
+
+
+class SharedArrays:
+    """
+    Moves large NumPy arrays between processes through shared memory rather than through the pipe
+    of a multiprocessing.Queue.
+
+    `pack` pickles an object with protocol 5: arrays of at least MIN_SIZE bytes are not written
+    into the pickle but copied into one shared memory block, so only the small pickle and the
+    positions of the arrays in the block go through the queue. `unpack` maps the block and
+    unpickles the object with these arrays as views of the block, i.e. without copying them.
+
+    The receiver unlinks a block as soon as it is mapped. The mapping itself can not be closed
+    while arrays still use it, so it is kept in a list and closed by a later `release`, once all
+    of its arrays have been garbage collected.
+
+    On Windows a shared memory block only exists while some process has it open, which the
+    sender can not guarantee, so objects are pickled as before.
+    """
+
+    ENABLED = os.name == 'posix'
+
+    ##
+    # The size (in bytes) from which an array is sent through shared memory.
+    MIN_SIZE = 1 << 16
+
+    ##
+    # The alignment of the arrays in a block.
+    ALIGNMENT = 64
+
+    ##
+    # The mapped blocks whose arrays may still be in use.
+    __blocks: List[SharedMemory] = []
+
+    __lock = threading.Lock()
+
+    @staticmethod
+    def pack(obj: Any) -> Any:
+        """
+        :return: A SharedPayload of `obj` if it contains large arrays, otherwise `obj` itself.
+        """
+        if not SharedArrays.ENABLED:
+            return obj
+
+        buffers = []
+
+        def in_band(buffer: pickle.PickleBuffer) -> bool:
+            if buffer.raw().nbytes < SharedArrays.MIN_SIZE:
+                return True
+            buffers.append(buffer.raw())
+            return False
+
+        try:
+            data = pickle.dumps(obj, protocol=5, buffer_callback=in_band)
+        except Exception as e:
+            # Leave it to the queue to report objects that can't be pickled
+            debug('Failed to pack object: ', e, type(e))
+            return obj
+        if not buffers:
+            return obj
+
+        positions = []
+        size = 0
+        for buffer in buffers:
+            positions.append((size, buffer.nbytes))
+            size += -(-buffer.nbytes // SharedArrays.ALIGNMENT) * SharedArrays.ALIGNMENT
+        block = SharedMemory(create=True, size=size)
+        for buffer, (offset, nbytes) in zip(buffers, positions):
+            block.buf[offset:offset + nbytes] = buffer
+        payload = SharedPayload(data, block.name, positions)
+        block.close()
+        return payload
+
+    @staticmethod
+    def unpack(obj: Any) -> Any:
+        """
+        :return: The object packed into `obj` by `pack`, or `obj` itself if it is not a
+        SharedPayload.
+        """
+        if not isinstance(obj, SharedPayload):
+            return obj
+
+        block = SharedMemory(name=obj.block)
+        block.unlink()
+        buffers = [block.buf[offset:offset + nbytes] for offset, nbytes in obj.buffers]
+        result = pickle.loads(obj.data, buffers=buffers)
+        del buffers
+
+        SharedArrays.release()
+        with SharedArrays.__lock:
+            SharedArrays.__blocks.append(block)
+        return result
+
+    @staticmethod
+    def release() -> int:
+        """
+        Closes the mapped blocks that are no longer used by any array.
+        :return: The number of blocks that are still in use.
+        """
+        with SharedArrays.__lock:
+            in_use = []
+            for block in SharedArrays.__blocks:
+                try:
+                    block.close()
+                except BufferError:
+                    in_use.append(block)
+            SharedArrays.__blocks = in_use
+            return len(in_use)
@@ -0,0 +1,374 @@
+import copy
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+from utils.log import *
+from worker.shared_arrays import SharedArrays
+from worker.work_functions import WorkFunctions
+from worker.work_progress import WorkProgress
+from worker.work_request import WorkRequest
+from worker.work_result import WorkResult
+from worker.work_scheduler import WorkScheduler
+
+
+class WorkDispatcher:
+    """
+    Routes the results of the work processes to the clients that are waiting for them.
+
+    A single daemon thread blocks on `WorkRequest.RESULTQ` and, as soon as a WorkResult arrives,
+    calls the handler that was registered for its job_id. A result is therefore delivered the
+    moment it is put into the queue, and no client ever has to poll the queue or look at the
+    results of other jobs. WorkProgress reports of a job are routed the same way to its progress
+    handler, if it has one.
+
+    Identical read requests (see WorkRequest.key) are coalesced: a request that is submitted
+    while an identical one is in flight is not executed, but receives the result of the one in
+    flight. The results of WorkRequest.MEMOIZED_WORK_TYPES are also kept, and identical requests
+    are answered from memory until a request that writes one of their tables is submitted or
+    finishes. Requests that are in flight when a write invalidates their tables can no longer be
+    joined, and their results are not kept.
+
+    A SWEEP request is split into one part per process of the pool (see WorkRequest.split), so
+    its points are calculated in parallel, and its handler receives the stacked result once all
+    parts have arrived. The progress reports of the parts are summed up, and cancelling the sweep
+    cancels all of its parts.
+
+    Handlers are called on the dispatcher thread, so they must be quick and thread safe, e.g.
+    emit a Qt signal (which queues the call to the thread of the receiver). Coalesced clients
+    share the result, so handlers must not modify it.
+    """
+
+    ##
+    # The job_id of the WorkResult that stops the dispatcher thread.
+    STOP_JOB_ID = -1
+
+    ##
+    # The number of memoized results.
+    MEMO_ENTRIES = 256
+
+    ##
+    # The handlers of the jobs whose results have not arrived yet: job_id -> handler.
+    __handlers: Dict[int, Callable[[WorkResult], None]] = {}
+
+    ##
+    # The progress handlers of the jobs whose results have not arrived yet: job_id -> handler.
+    __progress_handlers: Dict[int, Callable[[WorkProgress], None]] = {}
+
+    ##
+    # The jobs that receive the result of an executed job: executed job_id -> job_ids.
+    __members: Dict[int, List[int]] = {}
+
+    ##
+    # The executed job of every job that joined an identical one: job_id -> executed job_id.
+    __executions: Dict[int, int] = {}
+
+    ##
+    # The executed read requests that can be joined: key -> executed job_id.
+    __in_flight: Dict[Hashable, int] = {}
+
+    ##
+    # The key and the tables of every executed read request: job_id -> (key, tables).
+    __keys: Dict[int, Tuple[Hashable, List[str]]] = {}
+
+    ##
+    # The tables written by every executed write request (None: any table): job_id -> tables.
+    __writes: Dict[int, Optional[List[str]]] = {}
+
+    ##
+    # The parts of the sweeps whose results have not arrived yet: job_id -> part job_ids.
+    __sweeps: Dict[int, List[int]] = {}
+
+    ##
+    # The memoized results: key -> (tables, result), from the least to the most recently used.
+    __memo: 'OrderedDict[Hashable, Tuple[List[str], Any]]' = OrderedDict()
+
+    __lock = threading.Lock()
+
+    __next_job_id: int = 0
+
+    __thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def new_job_id() -> int:
+        """
+        :return: A job_id that has not been used by any other client.
+        """
+        with WorkDispatcher.__lock:
+            job_id = WorkDispatcher.__next_job_id
+            WorkDispatcher.__next_job_id += 1
+        return job_id
+
+    @staticmethod
+    def submit(work_request: WorkRequest, handler: Callable[[WorkResult], None],
+               progress_handler: Optional[Callable[[WorkProgress], None]] = None):
+        """
+        Sends `work_request` to a work process (see WorkScheduler), unless an identical request
+        is in flight or its result is memoized. `handler` is called with its WorkResult (on the
+        dispatcher thread, or right away on the calling thread for a memoized result) once the
+        result arrives, and `progress_handler` with every WorkProgress that arrives before.
+        """
+        WorkDispatcher.start()
+        if work_request.work_type == WorkRequest.SWEEP and \
+                WorkDispatcher.__fan_out(work_request, handler, progress_handler):
+            return
+        job_id = work_request.job_id
+        key = work_request.key()
+        with WorkDispatcher.__lock:
+            memo = WorkDispatcher.__memo.get(key) if key is not None else None
+            if memo is not None:
+                WorkDispatcher.__memo.move_to_end(key)
+                result = copy.deepcopy(memo[1])
+            else:
+                WorkDispatcher.__handlers[job_id] = handler
+                if progress_handler is not None:
+                    WorkDispatcher.__progress_handlers[job_id] = progress_handler
+                execution = WorkDispatcher.__in_flight.get(key) if key is not None else None
+                if execution is not None:
+                    WorkDispatcher.__members[execution].append(job_id)
+                    WorkDispatcher.__executions[job_id] = execution
+                    return
+                WorkDispatcher.__members[job_id] = [job_id]
+                if key is not None:
+                    WorkDispatcher.__in_flight[key] = job_id
+                    WorkDispatcher.__keys[job_id] = (key, work_request.tables())
+                if work_request.work_type in WorkRequest.WRITE_ARGUMENTS:
+                    written = work_request.written_tables()
+                    WorkDispatcher.__writes[job_id] = written
+                    WorkDispatcher.__invalidate(written)
+        if memo is not None:
+            WorkDispatcher.__call(handler, WorkResult(job_id, result))
+            return
+        WorkScheduler.schedule(work_request)
+
+    @staticmethod
+    def __fan_out(work_request: WorkRequest, handler: Callable[[WorkResult], None],
+                  progress_handler: Optional[Callable[[WorkProgress], None]]) -> bool:
+        """
+        Submits the parts of the SWEEP request `work_request`, unless it is not worth splitting.
+        :return: Whether the request was split.
+        """
+        try:
+            groups = work_request.sweep_groups()
+        except ValueError:
+            # The work process reports the error
+            return False
+        number_of_parts = min(len(groups), len(WorkScheduler.workers))
+        if number_of_parts < 2:
+            return False
+
+        sweep_id = work_request.job_id
+        parts = work_request.split([WorkDispatcher.new_job_id() for _ in range(number_of_parts)])
+        results: List[Optional[WorkResult]] = [None] * len(parts)
+        reports: List[Optional[WorkProgress]] = [None] * len(parts)
+        with WorkDispatcher.__lock:
+            WorkDispatcher.__sweeps[sweep_id] = [part.job_id for part in parts]
+
+        def on_result(index: int, work_result: WorkResult):
+            with WorkDispatcher.__lock:
+                results[index] = work_result
+                finished = all(result is not None for result in results)
+                if finished:
+                    del WorkDispatcher.__sweeps[sweep_id]
+            if not finished:
+                # The sweep has failed, so the other parts are not needed
+                if work_result.error is not None or work_result.cancelled:
+                    WorkDispatcher.cancel(sweep_id)
+                return
+            errors = [result.error for result in results if result.error is not None]
+            if errors:
+                sweep_result = WorkResult(sweep_id, False, error=errors[0])
+            elif any(result.cancelled for result in results):
+                sweep_result = WorkResult(sweep_id, None, cancelled=True)
+            else:
+                sweep_result = WorkResult(sweep_id, WorkFunctions.stack_sweep(
+                    [result.result for result in results]))
+            WorkDispatcher.__call(handler, sweep_result)
+
+        def on_progress(index: int, work_progress: WorkProgress):
+            with WorkDispatcher.__lock:
+                reports[index] = work_progress
+                stage = [report for report in reports
+                         if report is not None and report.stage == work_progress.stage]
+            total = None if any(report.total is None for report in stage) else \
+                sum(report.total for report in stage)
+            progress_handler(WorkProgress(sweep_id, work_progress.stage,
+                                          sum(report.done for report in stage), total,
+                                          {**work_progress.info, 'Parts': len(parts)}))
+
+        for index, part in enumerate(parts):
+            WorkDispatcher.submit(part, functools.partial(on_result, index),
+                                  functools.partial(on_progress, index)
+                                  if progress_handler is not None else None)
+        return True
+
+    @staticmethod
+    def cancel(job_id: int):
+        """
+        Cancels the job `job_id`. If other clients wait for the same execution, only this client
+        is removed, and its handler is called right away (on the calling thread) with a cancelled
+        WorkResult. Otherwise the execution is cancelled (see WorkScheduler.cancel): if it had not
+        been sent to a work process yet, the handler is called right away as well; otherwise it
+        receives whatever the process returns, i.e. a cancelled WorkResult or, if the job
+        finished before it noticed the cancellation, its normal result. A sweep is cancelled by
+        cancelling all of its parts.
+        """
+        with WorkDispatcher.__lock:
+            parts = WorkDispatcher.__sweeps.get(job_id)
+        if parts is not None:
+            for part in parts:
+                WorkDispatcher.cancel(part)
+            return
+        with WorkDispatcher.__lock:
+            execution = WorkDispatcher.__executions.get(job_id, job_id)
+            members = WorkDispatcher.__members.get(execution)
+            if members is None or job_id not in members:
+                return
+            if len(members) > 1:
+                members.remove(job_id)
+                WorkDispatcher.__executions.pop(job_id, None)
+                handler = WorkDispatcher.__pop_handlers(job_id)
+            else:
+                handler = None
+                # Nobody may join an execution that is about to be cancelled
+                key, _ = WorkDispatcher.__keys.get(execution, (None, None))
+                if key is not None and WorkDispatcher.__in_flight.get(key) == execution:
+                    del WorkDispatcher.__in_flight[key]
+        if handler is None:
+            if not WorkScheduler.cancel(execution):
+                return
+            with WorkDispatcher.__lock:
+                WorkDispatcher.__forget(execution)
+                WorkDispatcher.__executions.pop(job_id, None)
+                handler = WorkDispatcher.__pop_handlers(job_id)
+        if handler is not None:
+            WorkDispatcher.__call(handler, WorkResult(job_id, None, cancelled=True))
+
+    @staticmethod
+    def invalidate(table_names: Optional[List[str]] = None):
+        """
+        Forgets the memoized results that depend on the tables `table_names` (None: any table),
+        e.g. after the tables were changed outside of the work processes.
+        """
+        with WorkDispatcher.__lock:
+            WorkDispatcher.__invalidate(table_names)
+
+    @staticmethod
+    def __invalidate(table_names: Optional[List[str]]):
+        # Called with the lock held
+        def affected(tables: List[str]) -> bool:
+            # A request without tables, e.g. TABLE_NAMES, depends on all of them
+            return table_names is None or not tables or not set(tables).isdisjoint(table_names)
+
+        for key in [key for key, (tables, _) in WorkDispatcher.__memo.items() if affected(tables)]:
+            del WorkDispatcher.__memo[key]
+        for key, execution in list(WorkDispatcher.__in_flight.items()):
+            if affected(WorkDispatcher.__keys[execution][1]):
+                del WorkDispatcher.__in_flight[key]
+
+    @staticmethod
+    def start():
+        """
+        Starts the dispatcher thread if it is not running.
+        """
+        with WorkDispatcher.__lock:
+            if WorkDispatcher.__thread is not None and WorkDispatcher.__thread.is_alive():
+                return
+            WorkDispatcher.__thread = threading.Thread(target=WorkDispatcher.__run,
+                                                       name='WorkDispatcher', daemon=True)
+            WorkDispatcher.__thread.start()
+
+    @staticmethod
+    def stop():
+        """
+        Stops the dispatcher thread once it has delivered all results that are already queued.
+        """
+        thread = WorkDispatcher.__thread
+        if thread is None or not thread.is_alive():
+            return
+        WorkRequest.RESULTQ.put(WorkResult(WorkDispatcher.STOP_JOB_ID, None))
+        thread.join()
+
+    @staticmethod
+    def pending() -> int:
+        """
+        :return: The number of submitted jobs whose results have not arrived yet.
+        """
+        with WorkDispatcher.__lock:
+            return len(WorkDispatcher.__handlers)
+
+    @staticmethod
+    def __run():
+        while True:
+            work_result = SharedArrays.unpack(WorkRequest.RESULTQ.get())
+            if work_result is None:
+                continue
+            if work_result.job_id == WorkDispatcher.STOP_JOB_ID:
+                return
+            if isinstance(work_result, WorkProgress):
+                with WorkDispatcher.__lock:
+                    handlers = [WorkDispatcher.__progress_handlers.get(job_id) for job_id in
+                                WorkDispatcher.__members.get(work_result.job_id, ())]
+                for handler in handlers:
+                    if handler is not None:
+                        WorkDispatcher.__call(handler, work_result)
+                continue
+            # Before the handlers, so the invalidations of a write precede any request that
+            # reacts to its result
+            WorkScheduler.finished(work_result.job_id)
+            with WorkDispatcher.__lock:
+                members = WorkDispatcher.__members.get(work_result.job_id)
+                if members is None:
+                    debug('Received a result for an unknown job: ', work_result.job_id)
+                    continue
+                WorkDispatcher.__memoize(work_result)
+                WorkDispatcher.__forget(work_result.job_id)
+                handlers = []
+                for job_id in members:
+                    WorkDispatcher.__executions.pop(job_id, None)
+                    handlers.append((job_id, WorkDispatcher.__pop_handlers(job_id)))
+            for job_id, handler in handlers:
+                if handler is None:
+                    continue
+                if job_id == work_result.job_id:
+                    WorkDispatcher.__call(handler, work_result)
+                else:
+                    WorkDispatcher.__call(handler, WorkResult(job_id, work_result.result,
+                                                              work_result.error,
+                                                              work_result.cancelled))
+
+    @staticmethod
+    def __memoize(work_result: WorkResult):
+        # Called with the lock held, before the job is forgotten
+        key, tables = WorkDispatcher.__keys.get(work_result.job_id, (None, None))
+        if key is None or WorkDispatcher.__in_flight.get(key) != work_result.job_id or \
+                key[0] not in WorkRequest.MEMOIZED_WORK_TYPES or \
+                work_result.error is not None or work_result.cancelled:
+            return
+        WorkDispatcher.__memo[key] = (tables, copy.deepcopy(work_result.result))
+        while len(WorkDispatcher.__memo) > WorkDispatcher.MEMO_ENTRIES:
+            WorkDispatcher.__memo.popitem(last=False)
+
+    @staticmethod
+    def __forget(execution: int):
+        # Called with the lock held, once the execution has ended
+        WorkDispatcher.__members.pop(execution, None)
+        key, _ = WorkDispatcher.__keys.pop(execution, (None, None))
+        if key is not None and WorkDispatcher.__in_flight.get(key) == execution:
+            del WorkDispatcher.__in_flight[key]
+        if execution in WorkDispatcher.__writes:
+            WorkDispatcher.__invalidate(WorkDispatcher.__writes.pop(execution))
+
+    @staticmethod
+    def __pop_handlers(job_id: int) -> Optional[Callable[[WorkResult], None]]:
+        # Called with the lock held
+        WorkDispatcher.__progress_handlers.pop(job_id, None)
+        return WorkDispatcher.__handlers.pop(job_id, None)
+
+    @staticmethod
+    def __call(handler: Callable, work_result: Union[WorkResult, WorkProgress]):
+        try:
+            handler(work_result)
+        except Exception as e:
+            debug('Error handling work result: ', e, type(e))
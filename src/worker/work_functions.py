@@ -1,7 +1,12 @@
+import builtins
+import copy
 import functools
+import itertools
 import traceback
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
+
 from data_structures.bands import Band, Bands
 from data_structures.xsc import CrossSection
 from hapi import *
@@ -83,6 +88,7 @@ class WorkFunctions:
 
     graph_type_map = {
         "Voigt":    absorptionCoefficient_Voigt,
+        "Voigt (LUT)": absorptionCoefficient_VoigtLUT,
         "Lorentz":  absorptionCoefficient_Lorentz,
         "Gauss":    absorptionCoefficient_Gauss,
         "SD Voigt": absorptionCoefficient_SDVoigt,
@@ -99,6 +105,12 @@ class WorkFunctions:
         "dispersion":  SLIT_DISPERSION
         }
 
+    ##
+    # The parameters a sweep can vary, in the order in which their values are combined (see
+    # sweep_points). The path length varies fastest, so the points that share an absorption
+    # coefficient are consecutive.
+    SWEEP_PARAMETERS = ('T', 'p', 'Diluent', 'path_length')
+
     @staticmethod
     def graph_bands(TableName: str, **_kwargs) -> Bands:
         """
@@ -153,16 +165,25 @@ class WorkFunctions:
         return Bands(list(map(get_band, band2index.keys())), TableName)
 
     @staticmethod
-    def convolve_spectrum(x, y, instrumental_fn: str, Resolution: float, AF_wing: float):
+    def convolve_spectrum(x, y, instrumental_fn: str, Resolution: float, AF_wing: float,
+                          output_step: Optional[float] = None):
         """
         Applies an instrumental function to (x, y) coordinates if one was selected.
-        
+
+        :param output_step: If given, the convolved spectrum is only evaluated on a grid with
+                this step (e.g. the sampling of the instrument) rather than on the calculation
+                grid, which shrinks the result by the oversampling factor.
         :returns: the original (x, y) coordinates if no instrumental function was selected,
                 otherwise it applies it and returns the result.
         """
         instrumental_fn = instrumental_fn.lower()
         if instrumental_fn not in WorkFunctions.instrumental_fn_map:
             return x, y
+        elif output_step is not None and output_step > x[1] - x[0]:
+            return convolveSpectrumSampled(x, y, Resolution = Resolution, AF_wing = AF_wing,
+                                           SlitFunction =
+                                           WorkFunctions.instrumental_fn_map[instrumental_fn],
+                                           OutputStep = output_step)
         else:
             newx, newy, i, j, slit = convolveSpectrum(x, y, Resolution = Resolution,
                                                       AF_wing = AF_wing,
@@ -171,6 +192,110 @@ class WorkFunctions:
                                                           instrumental_fn])
             return newx, newy
 
+    @staticmethod
+    def absorption_coefficient(
+            graph_fn: str, Components: List[Tuple[int, int]], SourceTables: List[str],
+            Environment: Dict[str, Any], Diluent: dict, WavenumberRange: Tuple[float, float],
+            WavenumberStep: float, WavenumberWing: float, WavenumberWingHW: float):
+        """
+        Calculates the absorption coefficient (in cm-1) that all of the graphs are based on. Results
+        are memoized on disk by ResultCache, so plotting the same table with the same settings
+        again doesn't recalculate it.
+        :returns: the wavenumbers and the absorption coefficient.
+        """
+        from data_structures.result_cache import ResultCache
+
+        def calculate():
+            # absorptionCoefficient_Doppler functions do not use Diluent
+            if WorkFunctions.graph_type_map[graph_fn] == WorkFunctions.graph_type_map["Galatry"]:
+                return WorkFunctions.graph_type_map[graph_fn](
+                        Components = Components,
+                        SourceTables = SourceTables,
+                        Environment = Environment,
+                        HITRAN_units = False,
+                        WavenumberRange = WavenumberRange,
+                        WavenumberStep = WavenumberStep,
+                        WavenumberWing = WavenumberWing,
+                        WavenumberWingHW = WavenumberWingHW)
+            else:
+                return WorkFunctions.graph_type_map[graph_fn](
+                        Components = Components,
+                        SourceTables = SourceTables,
+                        Environment = Environment,
+                        Diluent = Diluent,
+                        HITRAN_units = False,
+                        WavenumberRange = WavenumberRange,
+                        WavenumberStep = WavenumberStep,
+                        WavenumberWing = WavenumberWing,
+                        WavenumberWingHW = WavenumberWingHW)
+
+        arguments = WorkFunctions.__coefficient_arguments(
+                graph_fn, Components, Environment, Diluent, WavenumberRange, WavenumberStep,
+                WavenumberWing, WavenumberWingHW)
+        return ResultCache.memoize(SourceTables, arguments, calculate)
+
+    @staticmethod
+    def __coefficient_arguments(
+            graph_fn: str, Components: List[Tuple[int, int]], Environment: Dict[str, Any],
+            Diluent: dict, WavenumberRange: Tuple[float, float], WavenumberStep: float,
+            WavenumberWing: float, WavenumberWingHW: float) -> Dict[str, Any]:
+        """
+        :returns: everything besides the source tables that the absorption coefficient depends
+                on, i.e. its ResultCache key. This includes the hapi settings that change the
+                result, since the cached results outlive the session they were calculated in.
+        """
+
+        def function_name(function) -> Optional[str]:
+            return None if function is None else f'{function.__module__}.{function.__qualname__}'
+
+        return {
+            'graph_fn': graph_fn, 'Components': Components,
+            'Environment': {'T': Environment['T'], 'p': Environment['p']},
+            'Diluent': Diluent, 'WavenumberRange': WavenumberRange,
+            'WavenumberStep': WavenumberStep, 'WavenumberWing': WavenumberWing,
+            'WavenumberWingHW': WavenumberWingHW,
+            'IntensityThreshold': DefaultIntensityThreshold,
+            'hapi': {
+                'PRECISION': VARIABLES['PRECISION'],
+                'CPF': function_name(VARIABLES['CPF']),
+                'CPF_VOIGT': function_name(VARIABLES['CPF_VOIGT']),
+                'ABSCOEF_BATCH_SIZE': VARIABLES['ABSCOEF_BATCH_SIZE'],
+                'WING_TOLERANCE_MIN_HW': VARIABLES['WING_TOLERANCE_MIN_HW']
+            }
+        }
+
+    @staticmethod
+    def spectrum(
+            spectrum_fn, graph_fn: str, Components: List[Tuple[int, int]],
+            SourceTables: List[str], Environment: Dict[str, Any], Diluent: dict,
+            WavenumberRange: Tuple[float, float], WavenumberStep: float, WavenumberWing: float,
+            WavenumberWingHW: float, path_length: float, File=None, Format='%e %e'):
+        """
+        Calculates a spectrum with spectrum_fn (absorptionSpectrum, transmittanceSpectrum or
+        radianceSpectrum) from the absorption coefficient. Both stages are memoized in the work
+        process, so changing only the path length reuses the absorption coefficient, and changing
+        only the instrumental function reuses the spectrum.
+        :returns: the wavenumbers and the spectrum.
+        """
+        from data_structures.result_cache import ResultCache
+
+        def calculate():
+            wn, ac = WorkFunctions.absorption_coefficient(
+                    graph_fn, Components, SourceTables, Environment, Diluent, WavenumberRange,
+                    WavenumberStep, WavenumberWing, WavenumberWingHW)
+            return spectrum_fn(wn, ac, Environment = { 'l': path_length, 'T': Environment['T'] },
+                               File = File, Format = Format)
+
+        # The file has to be written, so there is nothing to reuse
+        if File:
+            return calculate()
+
+        arguments = WorkFunctions.__coefficient_arguments(
+                graph_fn, Components, Environment, Diluent, WavenumberRange, WavenumberStep,
+                WavenumberWing, WavenumberWingHW)
+        arguments.update({ 'spectrum_fn': spectrum_fn.__name__, 'path_length': path_length })
+        return ResultCache.memoize(SourceTables, arguments, calculate, disk = False)
+
     @staticmethod
     def graph_absorption_coefficient(
             graph_fn: str, Components: List[Tuple[int, int]], SourceTables: List[str],
@@ -208,28 +333,9 @@ class WorkFunctions:
                 'args': {'xsc': True, **kwargs}
             }
 
-        # absorptionCoefficient_Doppler functions do not use Diluent
-        if WorkFunctions.graph_type_map[graph_fn] == WorkFunctions.graph_type_map["Galatry"]:
-            x, y = WorkFunctions.graph_type_map[graph_fn](
-                    Components = Components,
-                    SourceTables = SourceTables,
-                    Environment = Environment,
-                    HITRAN_units = False,
-                    WavenumberRange = WavenumberRange,
-                    WavenumberStep = WavenumberStep,
-                    WavenumberWing = WavenumberWing,
-                    WavenumberWingHW = WavenumberWingHW)
-        else:
-            x, y = WorkFunctions.graph_type_map[graph_fn](
-                    Components = Components,
-                    SourceTables = SourceTables,
-                    Environment = Environment,
-                    Diluent = Diluent,
-                    HITRAN_units = False,
-                    WavenumberRange = WavenumberRange,
-                    WavenumberStep = WavenumberStep,
-                    WavenumberWing = WavenumberWing,
-                    WavenumberWingHW = WavenumberWingHW)
+        x, y = WorkFunctions.absorption_coefficient(
+                graph_fn, Components, SourceTables, Environment, Diluent, WavenumberRange,
+                WavenumberStep, WavenumberWing, WavenumberWingHW)
 
         return {
             'x':      x,
@@ -248,7 +354,8 @@ class WorkFunctions:
             WavenumberStep: float, WavenumberWing: float, WavenumberWingHW: float, title: str,
             titlex: str, titley: str,
             Format='%e %e', path_length=100.0, File=None, instrumental_fn: str = "",
-            Resolution: float = 0.01, AF_wing: float = 100.0, **kwargs) -> Union[
+            Resolution: float = 0.01, AF_wing: float = 100.0,
+            output_step: Optional[float] = None, **kwargs) -> Union[
         Dict[str, Any], Exception]:
         """
         Generates coordinates for absorption spectrum graph.
@@ -258,20 +365,12 @@ class WorkFunctions:
             'WavenumberRange': WavenumberRange, 'Environment': Environment, 'graph_fn': graph_fn,
             'Diluent':         Diluent
         }
-        wn, ac = WorkFunctions.graph_type_map[graph_fn](
-                Components = Components,
-                SourceTables = SourceTables,
-                Environment = Environment,
-                Diluent = Diluent,
-                HITRAN_units = False,
-                WavenumberRange = WavenumberRange,
-                WavenumberStep = WavenumberStep,
-                WavenumberWing = WavenumberWing,
-                WavenumberWingHW = WavenumberWingHW)
-        Environment = { 'l': path_length }
-        x, y = absorptionSpectrum(wn, ac, Environment = Environment, File = File, Format = Format)
+        x, y = WorkFunctions.spectrum(
+                absorptionSpectrum, graph_fn, Components, SourceTables, Environment, Diluent,
+                WavenumberRange, WavenumberStep, WavenumberWing, WavenumberWingHW, path_length,
+                File = File, Format = Format)
         rx, ry = WorkFunctions.convolve_spectrum(x, y, instrumental_fn, Resolution = Resolution,
-                                                 AF_wing = AF_wing)
+                                                 AF_wing = AF_wing, output_step = output_step)
         return {
             'x':      rx, 'y': ry, 'title': title, 'name': name, 'titlex': titlex,
             'titley': titley, 'args': kwargs
@@ -285,7 +384,8 @@ class WorkFunctions:
             WavenumberStep: float, WavenumberWing: float, WavenumberWingHW: float, title: str,
             titlex: str, titley: str,
             Format='%e %e', path_length=100.0, temp=296.0, File=None, instrumental_fn: str = "",
-            Resolution: float = 0.01, AF_wing: float = 100.0, **kwargs) -> Union[
+            Resolution: float = 0.01, AF_wing: float = 100.0,
+            output_step: Optional[float] = None, **kwargs) -> Union[
         Dict[str, Any], Exception]:
         """
         Generates coordinates for radiance spectrum graph.
@@ -295,20 +395,12 @@ class WorkFunctions:
             'WavenumberRange': WavenumberRange, 'Environment': Environment, 'graph_fn': graph_fn,
             'Diluent':         Diluent
         }
-        wn, ac = WorkFunctions.graph_type_map[graph_fn](
-                Components = Components,
-                SourceTables = SourceTables,
-                Environment = Environment,
-                Diluent = Diluent,
-                HITRAN_units = False,
-                WavenumberRange = WavenumberRange,
-                WavenumberStep = WavenumberStep,
-                WavenumberWing = WavenumberWing,
-                WavenumberWingHW = WavenumberWingHW)
-        Environment['l'] = path_length
-        x, y = radianceSpectrum(wn, ac, Environment = Environment, File = File, Format = Format)
+        x, y = WorkFunctions.spectrum(
+                radianceSpectrum, graph_fn, Components, SourceTables, Environment, Diluent,
+                WavenumberRange, WavenumberStep, WavenumberWing, WavenumberWingHW, path_length,
+                File = File, Format = Format)
         rx, ry = WorkFunctions.convolve_spectrum(x, y, instrumental_fn, Resolution = Resolution,
-                                                 AF_wing = AF_wing)
+                                                 AF_wing = AF_wing, output_step = output_step)
         return {
             'x':      rx, 'y': ry, 'title': title, 'name': name, 'titlex': titlex,
             'titley': titley, 'args': kwargs
@@ -322,7 +414,8 @@ class WorkFunctions:
             WavenumberStep: float, WavenumberWing: float, WavenumberWingHW: float, title: str,
             titlex: str, titley: str,
             Format='%e %e', path_length=100.0, File=None, instrumental_fn: str = "",
-            Resolution: float = 0.01, AF_wing: float = 100.0, **kwargs) -> Union[
+            Resolution: float = 0.01, AF_wing: float = 100.0,
+            output_step: Optional[float] = None, **kwargs) -> Union[
         Dict[str, Any], Exception]:
         """
         Generates coordinates for transmittance spectrum graph.
@@ -332,26 +425,178 @@ class WorkFunctions:
             'WavenumberRange': WavenumberRange, 'Environment': Environment, 'graph_fn': graph_fn,
             'Diluent':         Diluent
         }
-        wn, ac = WorkFunctions.graph_type_map[graph_fn](
-                Components = Components,
-                SourceTables = SourceTables,
-                Environment = Environment,
-                Diluent = Diluent,
-                HITRAN_units = False,
-                WavenumberRange = WavenumberRange,
-                WavenumberStep = WavenumberStep,
-                WavenumberWing = WavenumberWing,
-                WavenumberWingHW = WavenumberWingHW)
-        Environment = { 'l': path_length }
-        x, y = transmittanceSpectrum(wn, ac, Environment = Environment, File = File,
-                                     Format = Format)
+        x, y = WorkFunctions.spectrum(
+                transmittanceSpectrum, graph_fn, Components, SourceTables, Environment, Diluent,
+                WavenumberRange, WavenumberStep, WavenumberWing, WavenumberWingHW, path_length,
+                File = File, Format = Format)
         rx, ry = WorkFunctions.convolve_spectrum(x, y, instrumental_fn, Resolution = Resolution,
-                                                 AF_wing = AF_wing)
+                                                 AF_wing = AF_wing, output_step = output_step)
         return {
             'x':      rx, 'y': ry, 'title': title, 'name': name, 'titlex': titlex,
             'titley': titley, 'args': kwargs
         }
 
+    @staticmethod
+    def absorption_coefficients(
+            graph_fn: str, Components: List[Tuple[int, int]], SourceTables: List[str],
+            Environments: List[Dict[str, Any]], WavenumberRange: Tuple[float, float],
+            WavenumberStep: float, WavenumberWing: float, WavenumberWingHW: float) \
+            -> Tuple[Any, List[Any]]:
+        """
+        Calculates the absorption coefficients of several environments ({'T': ..., 'p': ...,
+        'Diluent': ...}) in a single pass over the lines, so everything that does not depend on
+        the environment is prepared once. Every coefficient is cached by ResultCache under the
+        same key as one calculated by absorption_coefficient, and only the environments that are
+        not cached yet are calculated.
+        :returns: the wavenumbers, and the absorption coefficient of every environment.
+        """
+        from data_structures.result_cache import ResultCache
+
+        keys = [ResultCache.key(SourceTables, **WorkFunctions.__coefficient_arguments(
+                graph_fn, Components, environment, environment['Diluent'], WavenumberRange,
+                WavenumberStep, WavenumberWing, WavenumberWingHW))
+            for environment in Environments]
+        results = { key: ResultCache.lookup(key) for key in keys }
+        missing = [key for key, result in results.items() if result is None]
+        if missing:
+            environments = [Environments[keys.index(key)] for key in missing]
+            # absorptionCoefficient_Doppler functions do not use Diluent
+            if WorkFunctions.graph_type_map[graph_fn] == WorkFunctions.graph_type_map["Galatry"]:
+                environments = [{ 'T': environment['T'], 'p': environment['p'] }
+                                for environment in environments]
+            x, coefficients = WorkFunctions.graph_type_map[graph_fn](
+                    Components = Components,
+                    SourceTables = SourceTables,
+                    Environment = environments[0],
+                    Environments = environments,
+                    HITRAN_units = False,
+                    WavenumberRange = WavenumberRange,
+                    WavenumberStep = WavenumberStep,
+                    WavenumberWing = WavenumberWing,
+                    WavenumberWingHW = WavenumberWingHW)
+            for key, y in zip(missing, coefficients):
+                results[key] = (x, y.copy())
+                ResultCache.store(key, results[key])
+        return results[keys[0]][0], [results[key][1] for key in keys]
+
+    @staticmethod
+    def sweep_points(sweep: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+        """
+        :param sweep: The values of the swept parameters (see SWEEP_PARAMETERS), e.g.
+                {'T': [250.0, 296.0], 'p': [0.5, 1.0]}. 'path_length' is in cm, and 'Diluent'
+                is a list of diluent dictionaries, e.g. [{'air': 0.5, 'self': 0.5}].
+        :returns: every combination of the values, e.g. [{'T': 250.0, 'p': 0.5},
+                {'T': 250.0, 'p': 1.0}, {'T': 296.0, 'p': 0.5}, {'T': 296.0, 'p': 1.0}].
+        """
+        unknown = set(sweep) - set(WorkFunctions.SWEEP_PARAMETERS)
+        if unknown:
+            raise ValueError(f'Unknown sweep parameters: {", ".join(sorted(unknown))}')
+        names = [name for name in WorkFunctions.SWEEP_PARAMETERS if name in sweep]
+        return [dict(zip(names, values))
+                for values in itertools.product(*(sweep[name] for name in names))]
+
+    @staticmethod
+    def sweep_label(point: Dict[str, Any]) -> str:
+        """
+        :returns: a short description of a sweep point, for the legend of its curve.
+        """
+        labels = []
+        if 'T' in point:
+            labels.append(f"T = {point['T']:g} K")
+        if 'p' in point:
+            labels.append(f"p = {point['p']:g} atm")
+        if 'Diluent' in point:
+            labels.extend(f'{name} = {fraction:g}' for name, fraction in point['Diluent'].items())
+        if 'path_length' in point:
+            labels.append(f"l = {point['path_length']:g} cm")
+        return ', '.join(labels)
+
+    @staticmethod
+    def sweep(work_type: int, args: Dict[str, Any], sweep: Optional[Dict[str, List[Any]]] = None,
+              points: Optional[List[Dict[str, Any]]] = None, **_kwargs) -> Dict[str, Any]:
+        """
+        Calculates the graph of an absorption coefficient or spectrum request for every point of
+        a parameter sweep. The absorption coefficients of all points are calculated together (see
+        absorption_coefficients), then the spectrum and the instrumental function are applied to
+        each of them.
+        :param work_type: The WorkRequest opcode of the swept request, one of
+                WorkRequest.SWEEP_WORK_TYPES.
+        :param args: The arguments of the swept request.
+        :param sweep: The values of the swept parameters, see sweep_points.
+        :param points: The sweep points to calculate, instead of all points of `sweep`.
+        :returns: a graph like the one of the swept request, whose 'y' has a row for every
+                point, with the 'points' and their 'labels'.
+        """
+        from worker.work_request import WorkRequest
+
+        spectrum_fns = {
+            WorkRequest.ABSORPTION_COEFFICIENT: None,
+            WorkRequest.ABSORPTION_SPECTRUM:    absorptionSpectrum,
+            WorkRequest.TRANSMITTANCE_SPECTRUM: transmittanceSpectrum,
+            WorkRequest.RADIANCE_SPECTRUM:      radianceSpectrum
+            }
+        if work_type not in spectrum_fns:
+            raise ValueError(f'Requests of type {work_type} can not be swept')
+        spectrum_fn = spectrum_fns[work_type]
+        if points is None:
+            points = WorkFunctions.sweep_points(sweep or {})
+        # The star import of hapi shadows any with numpy's, which does not take generators
+        if spectrum_fn is None and builtins.any('path_length' in point for point in points):
+            raise ValueError('The absorption coefficient does not depend on the path length')
+        if args['SourceTables'][0] in LOCAL_XSC_CACHE:
+            raise ValueError('Cross sections can not be swept')
+
+        Environment = args['Environment']
+        environments = [{
+            'T':       point.get('T', Environment['T']),
+            'p':       point.get('p', Environment['p']),
+            'Diluent': point.get('Diluent', args['Diluent'])
+            } for point in points]
+        x, coefficients = WorkFunctions.absorption_coefficients(
+                args['graph_fn'], args['Components'], args['SourceTables'], environments,
+                args['WavenumberRange'], args['WavenumberStep'], args['WavenumberWing'],
+                args['WavenumberWingHW'])
+
+        rx, rows = x, []
+        for point, environment, y in zip(points, environments, coefficients):
+            if spectrum_fn is not None:
+                path_length = point.get('path_length', args.get('path_length', 100.0))
+                wn, y = spectrum_fn(x, y, Environment = { 'l': path_length,
+                                                          'T': environment['T'] })
+                rx, y = WorkFunctions.convolve_spectrum(
+                        wn, y, args.get('instrumental_fn', ''),
+                        Resolution = args.get('Resolution', 0.01),
+                        AF_wing = args.get('AF_wing', 100.0),
+                        output_step = args.get('output_step'))
+            rows.append(y)
+        return {
+            'x':      rx,
+            'y':      np.vstack(rows) if rows else np.zeros((0, len(rx))),
+            'points': points,
+            'labels': [WorkFunctions.sweep_label(point) for point in points],
+            'title':  args['title'],
+            'titlex': args['titlex'],
+            'titley': args['titley'],
+            'name':   args['name'],
+            'args':   {
+                'xsc': False, 'WavenumberRange': args['WavenumberRange'],
+                'Environment': Environment, 'graph_fn': args['graph_fn'],
+                'Diluent': args['Diluent']
+                }
+            }
+
+    @staticmethod
+    def stack_sweep(parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        :param parts: The results of sweep for consecutive parts of the sweep points.
+        :returns: the result of sweep for all of the points.
+        """
+        result = dict(parts[0])
+        result['y'] = np.vstack([part['y'] for part in parts])
+        result['points'] = [point for part in parts for point in part['points']]
+        result['labels'] = [label for part in parts for label in part['labels']]
+        return result
+
     @staticmethod
     def fetch(data_name: str, iso_id_list: List[int], numin: float, numax: float,
               parameter_groups: List[str] = (), parameters: List[str] = (), **_kwargs) -> Union[
@@ -362,8 +607,14 @@ class WorkFunctions:
         if len(iso_id_list) == 0:
             return FetchError(FetchErrorKind.BadIsoList,
                               'Fetch Failure: Iso list cannot be empty.')
+        if not WorkFunctions.valid_table_name(data_name):
+            return FetchError(FetchErrorKind.BadName,
+                              f'Fetch Failure: {data_name!r} is not a valid table name.')
+        from data_structures.result_cache import ResultCache
+
         try:
             fetch_by_ids(data_name, iso_id_list, numin, numax, parameter_groups, parameters)
+            ResultCache.forget_table(data_name)
             hmd = HapiMetaData(data_name, iso_id_list, numin, numax)
         except Exception as e:
             exc_type, exc_value, exc_traceback = sys.exc_info()
@@ -391,11 +642,67 @@ class WorkFunctions:
             return None
 
     @staticmethod
-    def save_table(table: Dict[str, Any], name: str, **_kwargs):
+    def get_table_page(table_name: str, start: int, count: int,
+                       columns: Optional[List[str]] = None, **_kwargs) -> Optional[Dict[str, Any]]:
+        """
+        :param start: The index of the first row of the page.
+        :param count: The number of rows of the page.
+        :param columns: The columns to return. By default all columns, in the order of the header.
+        :returns: the rows [start, start + count) of the columns of a table, with the number of
+                rows and the formats of the columns, or None if there is no such table.
+        """
+        if table_name not in LOCAL_TABLE_CACHE:
+            return None
+        table = LOCAL_TABLE_CACHE[table_name]
+        header = table['header']
+        if columns is None:
+            columns = list(header['order'])
+        number_of_rows = header['number_of_rows']
+        start = max(0, min(start, number_of_rows))
+        end = min(start + count, number_of_rows)
+        return {
+            'table_name': table_name, 'number_of_rows': number_of_rows, 'start': start,
+            'columns':    columns,
+            'format':     { column: header['format'][column] for column in columns },
+            'data':       { column: table['data'][column][start:end] for column in columns }
+        }
+
+    @staticmethod
+    def valid_table_name(name: Any) -> bool:
+        """
+        :returns: whether `name` can name a table, i.e. the files of the table are in the data
+                folder: it is a non-empty string without path separators that does not start
+                with a dot.
+        """
+        return isinstance(name, str) and name != '' and not name.startswith('.') and \
+            '/' not in name and '\\' not in name
+
+    @staticmethod
+    def save_table(table: Optional[Dict[str, Any]] = None, name: str = None,
+                   table_name: Optional[str] = None, edits: List[Tuple[str, int, Any]] = (),
+                   **_kwargs):
         """
         Saves the modified table in the local table cache and on disk.
+        :param table: The table to save. If None, a copy of the table `table_name` with `edits`
+                applied is saved, so the modified table never has to leave the work process.
+        :param edits: (column, row, value) of every modified cell.
         """
+        from data_structures.result_cache import ResultCache
+
+        if not WorkFunctions.valid_table_name(name):
+            print(f'{name!r} is not a valid table name')
+            return False
         try:
+            if table is None:
+                source = LOCAL_TABLE_CACHE[table_name]
+                table = {
+                    'header': copy.deepcopy(source['header']),
+                    'data':   { column: copy.copy(values)
+                                for column, values in source['data'].items() }
+                }
+                for column, row, value in edits:
+                    table['data'][column][row] = value
+
             # This also means the files already exist on disk and do not need to be created
             if name in LOCAL_TABLE_CACHE:
                 del LOCAL_TABLE_CACHE[name]
@@ -404,6 +711,7 @@ class WorkFunctions:
                 open(Config.data_folder + "/{}.data".format(name), 'w+')
 
             LOCAL_TABLE_CACHE[name] = table
+            ResultCache.forget_table(name)
             # Cahce2storage requires that the '{tablename}.par' and '{tablename}.header' files exist
             cache2storage(TableName = name)
             return True
@@ -411,6 +719,37 @@ class WorkFunctions:
             print(str(e))
             return False
 
+    @staticmethod
+    def invalidate_tables(table_names: Optional[List[str]] = None, **_kwargs) -> bool:
+        """
+        Reloads tables from disk after another work process has written them.
+        :param table_names: The tables (or cross section files) to reload. If None, all tables
+        and cross sections on disk that are not loaded yet are loaded.
+        """
+        from data_structures.result_cache import ResultCache
+
+        if table_names is None:
+            all_files = os.listdir(Config.data_folder)
+            table_names = [filename[:-len('.header')] for filename in all_files
+                           if filename.endswith('.header') and
+                           filename[:-len('.header')] not in LOCAL_TABLE_CACHE]
+            table_names += [filename for filename in all_files
+                            if filename.endswith('.xsc') and filename not in LOCAL_XSC_CACHE]
+
+        for table_name in table_names:
+            ResultCache.forget_table(table_name)
+            if table_name.endswith('.xsc'):
+                if os.path.isfile(os.path.join(Config.data_folder, table_name)):
+                    add_xsc_to_cache(table_name)
+                else:
+                    LOCAL_XSC_CACHE.pop(table_name, None)
+            elif os.path.isfile(os.path.join(Config.data_folder, table_name + '.header')):
+                LOCAL_TABLE_CACHE.pop(table_name, None)
+                storage2cache(table_name)
+            else:
+                LOCAL_TABLE_CACHE.pop(table_name, None)
+        return True
+
     @staticmethod
     def get_all_table_names() -> List[str]:
         l = list(tableList())
@@ -457,11 +796,14 @@ class WorkFunctions:
         """
         Attempts to call the select() method from hapi.
         """
+        if not WorkFunctions.valid_table_name(DestinationTableName):
+            raise ValueError(f'{DestinationTableName!r} is not a valid table name')
         select(TableName = TableName, DestinationTableName = DestinationTableName,
                ParameterNames = ParameterNames,
                Conditions = Conditions, Output = Output, File = File)
         hmd = HapiMetaData(DestinationTableName)
-        WorkFunctions.save_table(LOCAL_TABLE_CACHE[TableName], table_name = DestinationTableName)
+        WorkFunctions.save_table(LOCAL_TABLE_CACHE[DestinationTableName],
+                                 name = DestinationTableName)
 
         return echo(new_table_name = DestinationTableName, all_tables = list(tableList()))
 
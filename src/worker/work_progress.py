@@ -0,0 +1,41 @@
+from typing import *
+
+
+class WorkProgress:
+    """
+    A progress report of a job that is still running. Any number of them can arrive before the
+    WorkResult of the job.
+    """
+
+    def __init__(self, job_id: int, stage: str, done: int, total: Optional[int],
+                 info: Dict[str, Any], partial: Optional[Dict[str, Any]] = None):
+        """
+        :param stage: What is being done: 'abscoef' (lines), 'download' (bytes), 'parse' (rows)
+        or 'convolve' (output points), see hapi's PROGRESS_CALLBACK.
+        :param done: How many units of the stage are done.
+        :param total: The number of units of the stage, or None if it is not known.
+        :param info: Details about the stage, e.g. the name of the table.
+        :param partial: The partial result {'x': wavenumbers, 'y': absorption coefficient} of
+        the lines calculated so far, if the request asked for partial results.
+        """
+        self.job_id = job_id
+        self.stage = stage
+        self.done = done
+        self.total = total
+        self.info = info
+        self.partial = partial
+
+    def fraction(self) -> Optional[float]:
+        """
+        :return: The fraction of the stage that is done, or None if the total is not known.
+        """
+        if not self.total:
+            return None
+        return self.done / self.total
+
+    def __str__(self) -> str:
+        table = self.info.get('TableName')
+        prefix = f'{self.stage} {table}' if table else self.stage
+        if self.total:
+            return f'{prefix}: {self.done} / {self.total} ({100.0 * self.fraction():.0f}%)'
+        return f'{prefix}: {self.done}'
@@ -1,20 +1,47 @@
+import ctypes
+import itertools
 import multiprocessing as mp
+import time
 import traceback
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Hashable, List, Optional
 
+import numpy as np
+
+from metadata.config import Config
 from utils.log import *
+from worker.shared_arrays import SharedArrays
 from worker.work_functions import WorkFunctions
+from worker.work_progress import WorkProgress
 from worker.work_result import WorkResult
 
 
 class WorkRequest:
 
-    def __init__(self, job_id: int, work_type: Any, work_args: Dict[str, Any]):
+    def __init__(self, job_id: int, work_type: Any, work_args: Dict[str, Any],
+                 priority: Optional[int] = None, partial: bool = False):
+        """
+        :param priority: INTERACTIVE or BATCH. By default BATCH for BATCH_WORK_TYPES and
+        INTERACTIVE for everything else.
+        :param partial: Whether the progress reports of an absorption coefficient calculation
+        should carry the partial result (see WorkProgress).
+        """
         self.job_id = job_id
         self.work_type = work_type
         self.work_args = work_args
+        self.partial = partial
+        if priority is None:
+            priority = WorkRequest.BATCH if work_type in WorkRequest.BATCH_WORK_TYPES else \
+                WorkRequest.INTERACTIVE
+        self.priority = priority
 
     WorkType = int
+    Priority = int
+
+    ##
+    # Queued requests are served in the order of their priority: all INTERACTIVE requests (the
+    # user is waiting for them) before any BATCH request.
+    INTERACTIVE: Priority = 0
+    BATCH: Priority = 1
 
     # A list of "opcodes," rather than using strings
     START_HAPI: WorkType = 0
@@ -31,14 +58,161 @@ class WorkRequest:
     ABSORPTION_SPECTRUM: WorkType = 11
     BANDS: WorkType = 12
     DOWNLOAD_XSCS: WorkType = 13
+    INVALIDATE_TABLES: WorkType = 14
+    GET_TABLE_PAGE: WorkType = 15
+    SWEEP: WorkType = 16
+
+    ##
+    # Cheap requests that are served by the fast lane process, if there is one.
+    FAST_WORK_TYPES = {TABLE_META_DATA, TABLE_NAMES, GET_TABLE_PAGE}
+
+    ##
+    # Requests that are BATCH by default, since they take long and nobody waits for them.
+    BATCH_WORK_TYPES = {FETCH, DOWNLOAD_XSCS}
+
+    ##
+    # Requests that only read, so identical requests that are in flight at the same time can share
+    # one execution (see WorkDispatcher).
+    READ_WORK_TYPES = {ABSORPTION_COEFFICIENT, TABLE_META_DATA, GET_TABLE, TABLE_NAMES,
+                       TRANSMITTANCE_SPECTRUM, RADIANCE_SPECTRUM, ABSORPTION_SPECTRUM, BANDS,
+                       GET_TABLE_PAGE, SWEEP}
 
+    ##
+    # Read requests with small results, which are kept until a write request invalidates them.
+    MEMOIZED_WORK_TYPES = {TABLE_META_DATA, TABLE_NAMES, GET_TABLE_PAGE}
+
+    ##
+    # Requests that can be swept over a range of parameters: a SWEEP request has the arguments
+    # {'work_type': one of these, 'args': its arguments, 'sweep': the swept values} (see
+    # WorkFunctions.sweep), and is split into parts that are calculated in parallel (see
+    # WorkDispatcher).
+    SWEEP_WORK_TYPES = {ABSORPTION_COEFFICIENT, ABSORPTION_SPECTRUM, TRANSMITTANCE_SPECTRUM,
+                        RADIANCE_SPECTRUM}
+
+    ##
+    # Requests that produce no result.
+    NO_RESULT_WORK_TYPES = {END_WORK_PROCESS, INVALIDATE_TABLES}
+
+    ##
+    # The arguments that name the tables a request reads.
+    TABLE_ARGUMENTS = ('table_name', 'TableName', 'SourceTables')
+
+    ##
+    # Requests that write tables, and the argument that names the written table. None means the
+    # names are only known to the work function (e.g. downloaded cross sections).
+    WRITE_ARGUMENTS: Dict[WorkType, Optional[str]] = {
+        SAVE_TABLE:    'name',
+        FETCH:         'data_name',
+        SELECT:        'DestinationTableName',
+        DOWNLOAD_XSCS: None
+    }
+
+    ##
+    # The queue of the first work process.
     WORKQ: mp.Queue = mp.Queue()
     RESULTQ: mp.Queue = mp.Queue()
 
-    WORKER: 'Work' = None
-
     WORK_FUNCTIONS: Dict[WorkType, Callable] = {}
 
+    def tables(self) -> List[str]:
+        """
+        :return: The names of the tables this request reads or writes.
+        """
+        tables = []
+        # A sweep reads the tables of the swept request
+        work_args = self.work_args.get('args', {}) if self.work_type == WorkRequest.SWEEP else \
+            self.work_args
+        names = [name for name in WorkRequest.TABLE_ARGUMENTS if name in work_args]
+        if WorkRequest.WRITE_ARGUMENTS.get(self.work_type) is not None:
+            names.append(WorkRequest.WRITE_ARGUMENTS[self.work_type])
+        for name in names:
+            value = work_args.get(name)
+            if isinstance(value, str):
+                tables.append(value)
+            elif isinstance(value, (list, tuple)):
+                tables.extend(table for table in value if isinstance(table, str))
+        return tables
+
+    def written_tables(self) -> Optional[List[str]]:
+        """
+        :return: The names of the tables this request writes, or None if it may write any table.
+        Only meaningful for the requests in WRITE_ARGUMENTS.
+        """
+        name = WorkRequest.WRITE_ARGUMENTS.get(self.work_type)
+        if name is not None and isinstance(self.work_args.get(name), str):
+            return [self.work_args[name]]
+        return None
+
+    def invalidation(self) -> Optional['WorkRequest']:
+        """
+        :return: The request that makes the other work processes reload the tables written by this
+        request, or None if it writes no tables.
+        """
+        if self.work_type not in WorkRequest.WRITE_ARGUMENTS:
+            return None
+        return WorkRequest(self.job_id, WorkRequest.INVALIDATE_TABLES,
+                           {'table_names': self.written_tables()})
+
+    def sweep_points(self) -> List[Dict[str, Any]]:
+        """
+        :return: The points of a SWEEP request, see WorkFunctions.sweep_points.
+        """
+        if 'points' in self.work_args:
+            return self.work_args['points']
+        return WorkFunctions.sweep_points(self.work_args.get('sweep') or {})
+
+    def sweep_groups(self) -> List[List[Dict[str, Any]]]:
+        """
+        :return: The points of a SWEEP request, grouped into runs of consecutive points that only
+        differ in the path length, i.e. share their absorption coefficient.
+        """
+        return [list(group) for _, group in itertools.groupby(
+            self.sweep_points(),
+            key=lambda point: {name: value for name, value in point.items()
+                               if name != 'path_length'})]
+
+    def split(self, job_ids: List[int]) -> List['WorkRequest']:
+        """
+        :return: The parts of a SWEEP request: a SWEEP request for every job id, each with a
+        consecutive share of the groups of points (see sweep_groups), so that their stacked
+        results (see WorkFunctions.stack_sweep) are the result of this request.
+        """
+        groups = self.sweep_groups()
+        bounds = np.linspace(0, len(groups), len(job_ids) + 1).round().astype(int)
+        return [WorkRequest(job_id, WorkRequest.SWEEP,
+                            {'work_type': self.work_args['work_type'],
+                             'args':      self.work_args['args'],
+                             'points':    [point for group in groups[start:end]
+                                           for point in group]},
+                            self.priority)
+                for job_id, start, end in zip(job_ids, bounds[:-1], bounds[1:])]
+
+    def key(self) -> Optional[Hashable]:
+        """
+        :return: A key that is equal for requests that do the same work: the work type and the
+        normalized arguments. None if the request is not in READ_WORK_TYPES or has arguments
+        that can't be normalized (e.g. arrays).
+        """
+        if self.work_type not in WorkRequest.READ_WORK_TYPES:
+            return None
+        try:
+            return self.work_type, self.partial, WorkRequest.__normalize(self.work_args)
+        except TypeError:
+            return None
+
+    @staticmethod
+    def __normalize(value: Any) -> Hashable:
+        if isinstance(value, dict):
+            return tuple(sorted(((str(name), WorkRequest.__normalize(item))
+                                 for name, item in value.items()), key=lambda entry: entry[0]))
+        if isinstance(value, (list, tuple)):
+            return tuple(WorkRequest.__normalize(item) for item in value)
+        if isinstance(value, np.generic):
+            return value.item()
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        raise TypeError(f'{type(value).__name__} can not be part of a request key')
+
     def do_work(self) -> Any:
         """
         Executes the appropriate function, based on the specified work_type in the work request.
@@ -52,22 +226,72 @@ class WorkRequest:
 
     @staticmethod
     def start_work_process():
-        WorkRequest.WORKER = Work()
+        """
+        Starts the pool of work processes (see WorkScheduler).
+        """
+        from worker.work_scheduler import WorkScheduler
+
+        WorkScheduler.start(Config.work_processes, Config.fast_lane)
 
 
 class Work:
 
+    ##
+    # The minimal time (in seconds) between two progress reports of a job.
+    PROGRESS_INTERVAL = 0.25
+
+    ##
+    # The minimal time (in seconds) between two partial results of a job. A partial result
+    # copies the whole spectrum, so it is sent much less often than a progress report.
+    PARTIAL_INTERVAL = 2.0
+
     @staticmethod
-    def WORK_FUNCTION(workq: mp.Queue, resultq: mp.Queue) -> int:
+    def progress_callback(work_request: WorkRequest, resultq: mp.Queue) -> Callable:
+        """
+        :return: A hapi PROGRESS_CALLBACK that sends WorkProgress reports of `work_request` to
+        `resultq`, at most one every PROGRESS_INTERVAL seconds.
+        """
+        last_progress = 0.0
+        last_partial = time.time()
+
+        def callback(stage: str, done: int, total: Optional[int], info: Dict[str, Any]):
+            nonlocal last_progress, last_partial
+            now = time.time()
+            if now - last_progress < Work.PROGRESS_INTERVAL:
+                return
+            last_progress = now
+            info = dict(info)
+            make_partial = info.pop('Partial', None)
+            partial = None
+            if work_request.partial and make_partial is not None and \
+                    now - last_partial >= Work.PARTIAL_INTERVAL:
+                x, y = make_partial()
+                partial = {'x': x, 'y': y}
+                last_partial = now
+            resultq.put(SharedArrays.pack(WorkProgress(work_request.job_id, stage, done, total,
+                                                       info, partial)))
+
+        return callback
+
+    @staticmethod
+    def WORK_FUNCTION(workq: mp.Queue, resultq: mp.Queue, data_folder: str,
+                      cancel: ctypes.c_longlong) -> int:
         """
         Handles the calling of most hapi functions.
+        :param cancel: The job_id of the job to cancel. Long calculations poll it through
+        hapi's CANCEL_CHECK and stop with a cancelled WorkResult.
         """
+        import hapi
+
+        # The configuration file may have changed since it was read by the GUI process
+        Config.data_folder = data_folder
         WorkRequest.WORK_FUNCTIONS = {
             WorkRequest.START_HAPI:                           WorkFunctions.start_hapi,
             WorkRequest.FETCH:                                WorkFunctions.fetch,
             WorkRequest.ABSORPTION_COEFFICIENT:
                                           WorkFunctions.graph_absorption_coefficient,
             WorkRequest.GET_TABLE:                            WorkFunctions.get_table,
+            WorkRequest.GET_TABLE_PAGE:                       WorkFunctions.get_table_page,
             WorkRequest.SAVE_TABLE:                           WorkFunctions.save_table,
             WorkRequest.TABLE_NAMES:                          WorkFunctions.table_names,
             WorkRequest.TABLE_META_DATA:                      WorkFunctions.table_meta_data,
@@ -78,7 +302,9 @@ class Work:
                                           WorkFunctions.graph_transmittance_spectrum,
             WorkRequest.RADIANCE_SPECTRUM:                    WorkFunctions.graph_radiance_spectrum,
             WorkRequest.BANDS:                                WorkFunctions.graph_bands,
-            WorkRequest.DOWNLOAD_XSCS:                        WorkFunctions.download_xscs
+            WorkRequest.DOWNLOAD_XSCS:                        WorkFunctions.download_xscs,
+            WorkRequest.INVALIDATE_TABLES:                    WorkFunctions.invalidate_tables,
+            WorkRequest.SWEEP:                                WorkFunctions.sweep
         }
 
         WorkFunctions.start_hapi(**{})
@@ -88,22 +314,43 @@ class Work:
                                                                                        '\n    |   '
                                                                                        '') + '\n')
         while True:
-            work_request = workq.get()
+            work_request = SharedArrays.unpack(workq.get())
+            hapi.VARIABLES['CANCEL_CHECK'] = \
+                lambda job_id=work_request.job_id: cancel.value == job_id
+            hapi.VARIABLES['PROGRESS_CALLBACK'] = \
+                None if work_request.work_type in WorkRequest.NO_RESULT_WORK_TYPES else \
+                Work.progress_callback(work_request, resultq)
             if work_request.work_type == WorkRequest.END_WORK_PROCESS:
                 return 0
+            elif work_request.work_type in WorkRequest.NO_RESULT_WORK_TYPES:
+                try:
+                    work_request.do_work()
+                except Exception as e:
+                    debug('Error executing work request: ', e, type(e))
             else:
                 result = None
                 try:
                     result = work_request.do_work()
+                except hapi.CalculationCancelled:
+                    result = WorkResult(work_request.job_id, None, cancelled=True)
                 except Exception as e:
                     exc_ty, exc_val, exc_tb = sys.exc_info()
                     print_tb(exc_tb, exc_val)
                     debug('Error executing work request: ', e, type(e), result)
-                    result = WorkResult(e, False)
+                    result = WorkResult(work_request.job_id, False, error=str(e))
                 finally:
-                    resultq.put(result)
+                    resultq.put(SharedArrays.pack(result))
 
-    def __init__(self):
+    def __init__(self, workq: mp.Queue = None):
+        """
+        Starts a work process.
+        :param workq: The queue the process takes its requests from. A new queue by default.
+        """
+        self.workq: mp.Queue = mp.Queue() if workq is None else workq
+        ##
+        # The job_id of the job this process has to cancel, -1 if none.
+        self.cancel: ctypes.c_longlong = mp.RawValue(ctypes.c_longlong, -1)
         self.process: mp.Process = mp.Process(target=Work.WORK_FUNCTION,
-                                              args=(WorkRequest.WORKQ, WorkRequest.RESULTQ))
+                                              args=(self.workq, WorkRequest.RESULTQ,
+                                                    Config.data_folder, self.cancel))
         self.process.start()
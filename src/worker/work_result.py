@@ -3,6 +3,15 @@ from typing import *
 
 class WorkResult:
 
-    def __init__(self, job_id: int, result: Any):
+    def __init__(self, job_id: int, result: Any, error: Optional[str] = None,
+                 cancelled: bool = False):
+        """
+        :param error: The message of the exception that was raised by the work function, if it
+        failed.
+        :param cancelled: Whether the job was cancelled before it finished, in which case there
+        is no result.
+        """
         self.job_id = job_id
         self.result = result
+        self.error = error
+        self.cancelled = cancelled
@@ -0,0 +1,232 @@
+import heapq
+import itertools
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from worker.shared_arrays import SharedArrays
+from worker.work_request import Work, WorkRequest
+
+
+class WorkScheduler:
+    """
+    Distributes work requests over a pool of work processes.
+
+    Requests wait in a priority queue on the GUI side, and a process of the pool is only sent a
+    request when it is idle. The queued requests are therefore served in the order of their
+    priority (WorkRequest.INTERACTIVE before WorkRequest.BATCH, in submission order within the
+    same priority), and a request that has not been sent yet can be cancelled without ever
+    reaching a process. A running request is cancelled through the cancel slot of its process
+    (see Work), which hapi polls during long calculations.
+
+    Every process keeps its own hapi state: the loaded tables and in-memory caches such as the
+    recently used absorption coefficients. A request is therefore sent to the idle process that
+    last worked on its tables if there is one; otherwise it goes to any idle process, which then
+    becomes the preferred process for those tables.
+
+    Cheap requests (WorkRequest.FAST_WORK_TYPES) can be served by a separate fast lane process,
+    so that they never wait for a long calculation.
+
+    When a request that writes a table has finished, the other processes are sent an
+    INVALIDATE_TABLES request, which reloads the table from disk. It is queued before any request
+    that is submitted after the result of the write has been delivered.
+
+    If the pool has not been started, all requests are put into WorkRequest.WORKQ.
+    """
+
+    ##
+    # The processes of the pool. The first one takes its requests from WorkRequest.WORKQ.
+    workers: List[Work] = []
+
+    ##
+    # The process that serves WorkRequest.FAST_WORK_TYPES, if there is one.
+    fast_lane: Optional[Work] = None
+
+    ##
+    # The number of unfinished requests of each pool process (at most 1).
+    __load: List[int] = []
+
+    ##
+    # The requests that wait for an idle pool process: a heap of (priority, sequence number,
+    # request).
+    __queue: List[Tuple[int, int, WorkRequest]] = []
+
+    __sequence = itertools.count()
+
+    ##
+    # The unfinished requests: job_id -> (index of the process or -1 for the fast lane,
+    # the request that invalidates the tables written by the job).
+    __jobs: Dict[int, Tuple[int, Optional[WorkRequest]]] = {}
+
+    ##
+    # The preferred process of a table: table name -> index of the process.
+    __affinity: Dict[str, int] = {}
+
+    __lock = threading.Lock()
+
+    @staticmethod
+    def start(processes: int = 1, fast_lane: bool = False):
+        """
+        Starts the work processes.
+        :param processes: The number of processes of the pool (at least 1).
+        :param fast_lane: Whether to start a fast lane process as well.
+        """
+        processes = max(1, processes)
+        WorkScheduler.workers = [Work(WorkRequest.WORKQ)] + \
+                                [Work() for _ in range(processes - 1)]
+        WorkScheduler.fast_lane = Work() if fast_lane else None
+        WorkScheduler.__load = [0] * processes
+        WorkScheduler.__queue = []
+        WorkScheduler.__jobs = {}
+        WorkScheduler.__affinity = {}
+
+    @staticmethod
+    def stop():
+        """
+        Ends all work processes once they have finished their current requests. The requests that
+        are still queued are dropped.
+        """
+        with WorkScheduler.__lock:
+            WorkScheduler.__queue = []
+        WorkScheduler.broadcast(WorkRequest(-1, WorkRequest.END_WORK_PROCESS, {}))
+        for worker in WorkScheduler.all_workers():
+            worker.process.join()
+        WorkScheduler.workers = []
+        WorkScheduler.fast_lane = None
+
+    @staticmethod
+    def all_workers() -> List[Work]:
+        """
+        :return: The processes of the pool and the fast lane process.
+        """
+        if WorkScheduler.fast_lane is None:
+            return list(WorkScheduler.workers)
+        return WorkScheduler.workers + [WorkScheduler.fast_lane]
+
+    @staticmethod
+    def schedule(work_request: WorkRequest):
+        """
+        Sends `work_request` to the process chosen for it, or queues it until a process of the
+        pool is idle. Every request that produces a result must be followed by a call to
+        `finished` once its result has arrived.
+        """
+        if work_request.work_type in WorkRequest.NO_RESULT_WORK_TYPES:
+            WorkScheduler.broadcast(work_request)
+            return
+        if not WorkScheduler.workers:
+            WorkRequest.WORKQ.put(SharedArrays.pack(work_request))
+            return
+
+        if WorkScheduler.fast_lane is not None and \
+                work_request.work_type in WorkRequest.FAST_WORK_TYPES:
+            with WorkScheduler.__lock:
+                WorkScheduler.__jobs[work_request.job_id] = (-1, work_request.invalidation())
+            WorkScheduler.fast_lane.workq.put(SharedArrays.pack(work_request))
+            return
+
+        with WorkScheduler.__lock:
+            heapq.heappush(WorkScheduler.__queue, (work_request.priority,
+                                                   next(WorkScheduler.__sequence), work_request))
+            sends = WorkScheduler.__dispatch()
+        WorkScheduler.__send(sends)
+
+    @staticmethod
+    def __dispatch() -> List[Tuple[Work, WorkRequest]]:
+        # Assigns queued requests to the idle processes; called with the lock held. The requests
+        # are packed and sent outside of the lock, since packing copies their arrays.
+        sends = []
+        load = WorkScheduler.__load
+        while WorkScheduler.__queue and 0 in load:
+            _, _, work_request = heapq.heappop(WorkScheduler.__queue)
+            index = WorkScheduler.__choose(work_request.tables())
+            load[index] += 1
+            WorkScheduler.__jobs[work_request.job_id] = (index, work_request.invalidation())
+            sends.append((WorkScheduler.workers[index], work_request))
+        return sends
+
+    @staticmethod
+    def __send(sends: List[Tuple[Work, WorkRequest]]):
+        for worker, work_request in sends:
+            worker.workq.put(SharedArrays.pack(work_request))
+
+    @staticmethod
+    def __choose(tables: List[str]) -> int:
+        load = WorkScheduler.__load
+        index = next((WorkScheduler.__affinity[table] for table in tables
+                      if table in WorkScheduler.__affinity), None)
+        if index is None or load[index] > 0:
+            index = load.index(0)
+        for table in tables:
+            WorkScheduler.__affinity[table] = index
+        return index
+
+    @staticmethod
+    def finished(job_id: int):
+        """
+        Records that the result of the job `job_id` has arrived. If the job wrote tables, the
+        other processes are told to reload them. The process that ran the job is then sent the
+        next queued request.
+        """
+        with WorkScheduler.__lock:
+            job = WorkScheduler.__jobs.pop(job_id, None)
+            if job is None:
+                return
+            index, invalidation = job
+            # Under the lock, so no request that is sent after this call can overtake it
+            if invalidation is not None:
+                exclude = WorkScheduler.fast_lane if index < 0 else WorkScheduler.workers[index]
+                WorkScheduler.broadcast(invalidation, exclude)
+            if index < 0:
+                return
+            WorkScheduler.__load[index] -= 1
+            sends = WorkScheduler.__dispatch()
+        WorkScheduler.__send(sends)
+
+    @staticmethod
+    def cancel(job_id: int) -> bool:
+        """
+        Cancels the job `job_id`. If it is still queued it is removed from the queue, otherwise
+        its process is asked to abandon it, which it does at the next check of a long
+        calculation (the job then produces a cancelled WorkResult, unless it has finished before).
+        :return: True if the job was removed from the queue, i.e. it will produce no result.
+        """
+        with WorkScheduler.__lock:
+            for i, (_, _, work_request) in enumerate(WorkScheduler.__queue):
+                if work_request.job_id == job_id:
+                    WorkScheduler.__queue.pop(i)
+                    heapq.heapify(WorkScheduler.__queue)
+                    return True
+            job = WorkScheduler.__jobs.get(job_id)
+            if job is not None:
+                index = job[0]
+                worker = WorkScheduler.fast_lane if index < 0 else WorkScheduler.workers[index]
+                worker.cancel.value = job_id
+        return False
+
+    @staticmethod
+    def broadcast(work_request: WorkRequest, exclude: Optional[Work] = None):
+        """
+        Sends `work_request`, a request that produces no result, to every work process except
+        `exclude`.
+        """
+        workers = WorkScheduler.all_workers()
+        if not workers:
+            WorkRequest.WORKQ.put(work_request)
+        for worker in workers:
+            if worker is not exclude:
+                worker.workq.put(work_request)
+
+    @staticmethod
+    def load() -> List[int]:
+        """
+        :return: The number of unfinished requests of each process of the pool.
+        """
+        with WorkScheduler.__lock:
+            return list(WorkScheduler.__load)
+
+    @staticmethod
+    def queued() -> int:
+        """
+        :return: The number of requests that wait for an idle process.
+        """
+        with WorkScheduler.__lock:
+            return len(WorkScheduler.__queue)